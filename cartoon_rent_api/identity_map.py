@@ -0,0 +1,86 @@
+"""Request scoped identity map shared by views and access policies of every app."""
+
+from typing import Callable, Dict, Hashable, Optional, Tuple, Type, Union
+
+from django.conf import settings
+from django.db.models import Model
+from django.http import HttpRequest, HttpResponse
+from rest_framework.request import Request
+
+IDENTITY_MAP_ATTRIBUTE = "_identity_map"
+IDENTITY_MAP_SAVED_FETCH_HEADER = "X-Identity-Map-Saved-Fetches"
+
+
+class RequestIdentityMap:
+    """Map of records already fetched during a request keyed by model and lookup value.
+
+    A record fetched once by an access policy is returned to the view instead of being queried again, and the
+    number of fetches answered from the map is counted for debugging.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty identity map."""
+        self.records: Dict[Tuple[Type[Model], str, str], Model] = {}
+        self.saved_fetch_count: int = 0
+
+    def get(self, model: Type[Model], lookup_field: str, lookup_value: Hashable) -> Optional[Model]:
+        """Get a record fetched earlier in the request and count the saved fetch."""
+        record: Optional[Model] = self.records.get((model, lookup_field, str(lookup_value)))
+        if record is not None:
+            self.saved_fetch_count += 1
+        return record
+
+    def add(self, model: Type[Model], lookup_field: str, lookup_value: Hashable, record: Model) -> None:
+        """Keep a fetched record for the rest of the request."""
+        self.records[(model, lookup_field, str(lookup_value))] = record
+
+    def clear(self) -> None:
+        """Drop every kept record."""
+        self.records.clear()
+
+
+def get_request_identity_map(request: Union[Request, HttpRequest]) -> RequestIdentityMap:
+    """Get identity map of the request, shared between the DRF request and the underlying django request."""
+    http_request: HttpRequest = getattr(request, "_request", request)
+    identity_map: Optional[RequestIdentityMap] = getattr(http_request, IDENTITY_MAP_ATTRIBUTE, None)
+    if identity_map is None:
+        identity_map = RequestIdentityMap()
+        setattr(http_request, IDENTITY_MAP_ATTRIBUTE, identity_map)
+    return identity_map
+
+
+class IdentityMapMixin:
+    """Generic API view mixin fetching the object of a request only once for view and access policy."""
+
+    def get_object(self) -> Model:
+        """Get object from the request identity map or fetch and keep it on first access."""
+        lookup_url_kwarg: str = self.lookup_url_kwarg or self.lookup_field
+        lookup_value: Hashable = self.kwargs[lookup_url_kwarg]
+        model: Type[Model] = self.queryset.model if self.queryset is not None else self.get_queryset().model
+        identity_map: RequestIdentityMap = get_request_identity_map(self.request)
+        record: Optional[Model] = identity_map.get(model, self.lookup_field, lookup_value)
+        if record is None:
+            record = super().get_object()
+            identity_map.add(model, self.lookup_field, lookup_value, record)
+        else:
+            self.check_object_permissions(self.request, record)
+        return record
+
+
+class IdentityMapMiddleware:
+    """Middleware clearing the request identity map at request end and reporting saved fetches when opted in."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Keep the next handler of the middleware chain."""
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Process the request and clear its identity map afterwards."""
+        identity_map: RequestIdentityMap = get_request_identity_map(request)
+        try:
+            response: HttpResponse = self.get_response(request)
+            if settings.IDENTITY_MAP_DEBUG_HEADER:
+                response[IDENTITY_MAP_SAVED_FETCH_HEADER] = str(identity_map.saved_fetch_count)
+            return response
+        finally:
+            identity_map.clear()
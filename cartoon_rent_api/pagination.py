@@ -0,0 +1,334 @@
+"""Pagination classes shared by list endpoints of every app."""
+
+import base64
+import binascii
+import hashlib
+import json
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Union
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Field, Model, Q, QuerySet
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import ValidationError as ApiValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.views import APIView
+
+INVALID_CURSOR_DETAIL = "Invalid cursor"
+UNSUPPORTED_CURSOR_DETAIL = "Cursor pagination is not supported by this listing."
+COUNT_CACHE_KEY_PREFIX = "pagination-count"
+
+
+class KeysetOrderingField(NamedTuple):
+    """Model field of the keyset ordering with its direction."""
+
+    field: Field
+    descending: bool
+
+
+class KeysetCursor(NamedTuple):
+    """Decoded cursor pointing at the boundary row of a page."""
+
+    values: List[Any]
+    previous: bool
+
+
+class KeysetPagination(PageNumberPagination):
+    """Page number pagination which switches to keyset pagination when the request has a cursor parameter.
+
+    Clients opt in per request by sending an empty `cursor` parameter for the first page and following the opaque
+    `next` and `previous` links afterwards. A keyset page filters on the ordering columns of the queryset, which
+    default to `Meta.ordering` of the model, with the primary key as tiebreaker, so a page reads only its own rows
+    through a composite index in any depth of the listing and no count query is run. Ordering columns must be
+    non-nullable local fields of the model.
+    """
+
+    cursor_query_param = "cursor"
+    cursor_query_description = "Opaque keyset cursor, send empty value for the first page."
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view: Optional[APIView] = None) -> List[Any]:
+        """Paginate by keyset when the request has a cursor parameter, otherwise by page number."""
+        self.keyset_enabled: bool = self.cursor_query_param in request.query_params
+        if not self.keyset_enabled:
+            return super().paginate_queryset(queryset, request, view)
+        self.request = request
+        self.ordering_fields: List[KeysetOrderingField] = self.get_ordering_fields(queryset)
+        page_size: int = self.get_page_size(request) or self.max_page_size or 0
+        cursor: Optional[KeysetCursor] = self.decode_cursor(request)
+        reverse: bool = cursor is not None and cursor.previous
+        keyset_queryset: QuerySet = queryset.order_by(
+            *[
+                f"{'-' if ordering_field.descending != reverse else ''}{ordering_field.field.name}"
+                for ordering_field in self.ordering_fields
+            ]
+        )
+        if cursor is not None:
+            keyset_queryset = keyset_queryset.filter(self.get_keyset_condition(cursor.values, reverse))
+        records: List[Model] = list(keyset_queryset[: page_size + 1])
+        has_more: bool = len(records) > page_size
+        records = records[:page_size]
+        if reverse:
+            records.reverse()
+        self.next_cursor: Optional[KeysetCursor] = None
+        self.previous_cursor: Optional[KeysetCursor] = None
+        if records and (has_more or reverse):
+            self.next_cursor = KeysetCursor(self.get_cursor_values(records[-1]), previous=False)
+        if records and cursor is not None and (has_more or not reverse):
+            self.previous_cursor = KeysetCursor(self.get_cursor_values(records[0]), previous=True)
+        return records
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """Get page with links to neighbouring pages, with the total count for page number pagination only."""
+        if not self.keyset_enabled:
+            return super().get_paginated_response(data)
+        return Response({"next": self.get_next_link(), "previous": self.get_previous_link(), "results": data})
+
+    def get_next_link(self) -> Optional[str]:
+        """Get link to the next page."""
+        if not self.keyset_enabled:
+            return super().get_next_link()
+        return self.get_cursor_link(self.next_cursor)
+
+    def get_previous_link(self) -> Optional[str]:
+        """Get link to the previous page."""
+        if not self.keyset_enabled:
+            return super().get_previous_link()
+        return self.get_cursor_link(self.previous_cursor)
+
+    def get_paginated_response_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Get response schema where the total count is only returned by page number pagination."""
+        paginated_schema: Dict[str, Any] = super().get_paginated_response_schema(schema)
+        paginated_schema["required"] = ["results"]
+        return paginated_schema
+
+    def get_schema_operation_parameters(self, view: APIView) -> List[Dict[str, Any]]:
+        """Get query parameters of both pagination modes."""
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.cursor_query_description,
+                "schema": {"type": "string"},
+            },
+        ]
+
+    def get_ordering_fields(self, queryset: QuerySet) -> List[KeysetOrderingField]:
+        """Get ordering fields of the queryset or the model with the primary key appended as tiebreaker.
+
+        Listings ordered by annotations, e.g. search rank, can not be paginated by keyset.
+        """
+        model_meta = queryset.model._meta
+        ordering: Sequence[str] = queryset.query.order_by or model_meta.ordering
+        ordering_fields: List[KeysetOrderingField] = []
+        for ordering_name in ordering:
+            if not isinstance(ordering_name, str):
+                raise ApiValidationError({self.cursor_query_param: UNSUPPORTED_CURSOR_DETAIL})
+            descending: bool = ordering_name.startswith("-")
+            field_name: str = ordering_name.lstrip("-")
+            try:
+                field: Field = model_meta.pk if field_name == "pk" else model_meta.get_field(field_name)
+            except FieldDoesNotExist:
+                raise ApiValidationError({self.cursor_query_param: UNSUPPORTED_CURSOR_DETAIL}) from None
+            ordering_fields.append(KeysetOrderingField(field, descending))
+        if model_meta.pk not in [ordering_field.field for ordering_field in ordering_fields]:
+            last_descending: bool = ordering_fields[-1].descending if ordering_fields else False
+            ordering_fields.append(KeysetOrderingField(model_meta.pk, last_descending))
+        return ordering_fields
+
+    def get_keyset_condition(self, values: List[Any], reverse: bool) -> Q:
+        """Build condition matching rows after the cursor values in the keyset ordering.
+
+        The leading column is also bounded on its own, so the database can start an index scan at the cursor.
+        """
+        keyset_condition = Q()
+        for position, ordering_field in enumerate(self.ordering_fields):
+            lookup: str = "lt" if ordering_field.descending != reverse else "gt"
+            position_condition = Q(
+                **{
+                    previous_field.field.name: previous_value
+                    for previous_field, previous_value in zip(self.ordering_fields[:position], values)
+                },
+                **{f"{ordering_field.field.name}__{lookup}": values[position]},
+            )
+            keyset_condition |= position_condition
+        leading_field: KeysetOrderingField = self.ordering_fields[0]
+        leading_lookup: str = "lte" if leading_field.descending != reverse else "gte"
+        return Q(**{f"{leading_field.field.name}__{leading_lookup}": values[0]}) & keyset_condition
+
+    def get_cursor_values(self, record: Model) -> List[Any]:
+        """Get ordering values of a record for its cursor."""
+        return [getattr(record, ordering_field.field.attname) for ordering_field in self.ordering_fields]
+
+    def get_cursor_link(self, cursor: Optional[KeysetCursor]) -> Optional[str]:
+        """Encode a cursor into the link of its page."""
+        if cursor is None:
+            return None
+        encoded_cursor: str = base64.urlsafe_b64encode(
+            json.dumps(
+                {
+                    "v": [
+                        ordering_field.field.get_prep_value(value)
+                        for ordering_field, value in zip(self.ordering_fields, cursor.values)
+                    ],
+                    "p": cursor.previous,
+                },
+                default=str,
+            ).encode()
+        ).decode()
+        url: str = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded_cursor)
+
+    def decode_cursor(self, request: Request) -> Optional[KeysetCursor]:
+        """Decode cursor of the request, an empty cursor points at the first page."""
+        encoded_cursor: str = request.query_params[self.cursor_query_param]
+        if not encoded_cursor:
+            return None
+        try:
+            cursor_data: Dict[str, Any] = json.loads(base64.urlsafe_b64decode(encoded_cursor.encode()))
+            encoded_values: List[Any] = cursor_data["v"]
+            if len(encoded_values) != len(self.ordering_fields):
+                raise NotFound(INVALID_CURSOR_DETAIL)
+            return KeysetCursor(
+                [
+                    ordering_field.field.to_python(value)
+                    for ordering_field, value in zip(self.ordering_fields, encoded_values)
+                ],
+                bool(cursor_data["p"]),
+            )
+        except (binascii.Error, ValueError, TypeError, KeyError, FieldDoesNotExist, ValidationError):
+            raise NotFound(INVALID_CURSOR_DETAIL) from None
+
+
+class EstimatedCountPage(Page):
+    """Page of a paginator with estimated count which knows whether more records follow it."""
+
+    has_more: Optional[bool] = None
+
+    def has_next(self) -> bool:
+        """Check if more records follow the page from the extra record read with the page."""
+        if self.has_more is None:
+            return super().has_next()
+        return self.has_more
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator which counts large querysets from planner estimates instead of an exact count.
+
+    An exact count which is cached for the filter signature of the queryset is used first. Otherwise, when the
+    database estimates at least the configured threshold of rows, the estimate is used and pages are read with one
+    extra record to find out whether a next page exists. Smaller querysets are counted exactly, and exact counts
+    above the threshold are cached for a short time.
+    """
+
+    _count_estimated: bool = False
+
+    @cached_property
+    def count(self) -> int:
+        """Get cached exact count, estimated count of a large queryset or exact count of the queryset."""
+        if not isinstance(self.object_list, QuerySet):
+            return super().count
+        cache_key: str = self.get_count_cache_key(self.object_list)
+        cached_count: Optional[int] = cache.get(cache_key)
+        if cached_count is not None:
+            return cached_count
+        estimated_count: Optional[int] = self.estimate_count(self.object_list)
+        if estimated_count is not None and estimated_count >= settings.PAGINATION_ESTIMATED_COUNT_THRESHOLD:
+            self._count_estimated = True
+            return estimated_count
+        exact_count: int = self.object_list.count()
+        if exact_count >= settings.PAGINATION_ESTIMATED_COUNT_THRESHOLD:
+            cache.set(cache_key, exact_count, settings.PAGINATION_COUNT_CACHE_SECONDS)
+        return exact_count
+
+    @property
+    def count_estimated(self) -> bool:
+        """Check if the count is a planner estimate rather than an exact count."""
+        return self.count is not None and self._count_estimated
+
+    def validate_number(self, number: Union[int, str]) -> int:
+        """Validate page number, pages beyond an estimated count are only rejected when they have no records."""
+        if not self.count_estimated:
+            return super().validate_number(number)
+        try:
+            page_number: int = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"]) from None
+        if page_number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return page_number
+
+    def page(self, number: Union[int, str]) -> Page:
+        """Get page of records, reading one extra record when the count is estimated."""
+        page_number: int = self.validate_number(number)
+        if not self.count_estimated:
+            return super().page(page_number)
+        bottom: int = (page_number - 1) * self.per_page
+        records: List[Any] = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not records and page_number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        page: EstimatedCountPage = EstimatedCountPage(records[: self.per_page], page_number, self)
+        page.has_more = len(records) > self.per_page
+        return page
+
+    @staticmethod
+    def estimate_count(queryset: QuerySet) -> Optional[int]:
+        """Estimate rows of a queryset from table statistics or the query plan on PostgreSQL.
+
+        Unfiltered querysets read the row estimate of the table, filtered querysets read the row estimate of the
+        plan. Other databases have no estimate.
+        """
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            if not queryset.query.has_filters():
+                cursor.execute(
+                    "SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)", [queryset.model._meta.db_table]
+                )
+                table_statistics = cursor.fetchone()
+                if table_statistics is not None and table_statistics[0] >= 0:
+                    return int(table_statistics[0])
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            query_plan: Any = cursor.fetchone()[0]
+        if isinstance(query_plan, str):
+            query_plan = json.loads(query_plan)
+        return int(query_plan[0]["Plan"]["Plan Rows"])
+
+    @staticmethod
+    def get_count_cache_key(queryset: QuerySet) -> str:
+        """Get cache key of the exact count from the SQL and parameters of the queryset."""
+        sql, params = queryset.query.sql_with_params()
+        filter_signature: str = hashlib.sha256(f"{queryset.db}:{sql}:{params!r}".encode()).hexdigest()
+        return f"{COUNT_CACHE_KEY_PREFIX}:{filter_signature}"
+
+
+class EstimatedCountPagination(KeysetPagination):
+    """Keyset or page number pagination which estimates the total count of large listings.
+
+    Page number responses state with `count_estimated` whether the total count is a planner estimate.
+    """
+
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """Get page with whether its total count is estimated for page number pagination."""
+        response: Response = super().get_paginated_response(data)
+        if not self.keyset_enabled:
+            response.data["count_estimated"] = self.page.paginator.count_estimated
+        return response
+
+    def get_paginated_response_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Get response schema with whether the total count is estimated."""
+        paginated_schema: Dict[str, Any] = super().get_paginated_response_schema(schema)
+        paginated_schema["properties"]["count_estimated"] = {"type": "boolean", "example": False}
+        return paginated_schema
@@ -35,7 +35,7 @@ ALLOWED_HOSTS = []
 
 
 # Application definition
-LOCAL_APPS = ['user_management', 'rental_management']
+LOCAL_APPS = ['job_scheduler', 'user_management', 'rental_management']
 
 THRIRD_PARTY_APPS = ['drf_spectacular', 'rest_framework']
 
@@ -46,6 +46,7 @@ DEFAULTS_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 ]
 
 INSTALLED_APPS = DEFAULTS_APPS + LOCAL_APPS + THRIRD_PARTY_APPS
@@ -58,6 +59,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'cartoon_rent_api.identity_map.IdentityMapMiddleware',
 ]
 
 ROOT_URLCONF = 'cartoon_rent_api.urls'
@@ -95,6 +97,21 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "cartoon-rent-cache"),
+    }
+}
+
+# Versions of cached user permissions expire after this interval, which bounds how long a worker keeps serving
+# permissions invalidated by another worker when the cache backend is local to each process
+PERMISSION_CACHE_VERSION_SECONDS = int(os.getenv("PERMISSION_CACHE_VERSION_SECONDS", "30"))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -147,15 +164,84 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
 }
 
+# Stateless authentication trusts admin flag and permission claims of access tokens for their whole lifetime
+JWT_PERMISSION_CLAIM_AUTHENTICATION = os.getenv("JWT_PERMISSION_CLAIM_AUTHENTICATION", "off") == "on"
+
+# Responses report the number of fetches answered by the request identity map in a header, for debugging only
+IDENTITY_MAP_DEBUG_HEADER = os.getenv("IDENTITY_MAP_DEBUG_HEADER", "off") == "on"
+
+# Last login timestamps are buffered per worker and written in batches instead of on every login
+LAST_LOGIN_FLUSH_INTERVAL_SECONDS = int(os.getenv("LAST_LOGIN_FLUSH_INTERVAL_SECONDS", "30"))
+LAST_LOGIN_FLUSH_BATCH_SIZE = int(os.getenv("LAST_LOGIN_FLUSH_BATCH_SIZE", "500"))
+
+# Rent policy: days a book can be kept before late return fee is charged per each extra day
+RENT_DUE_DAYS = int(os.getenv("RENT_DUE_DAYS", "7"))
+LATE_RETURN_FEE_PER_DAY = int(os.getenv("LATE_RETURN_FEE_PER_DAY", "50"))
+
+# Overdue sweeper marks late rents as overdue in chunks
+OVERDUE_SWEEP_CHUNK_SIZE = int(os.getenv("OVERDUE_SWEEP_CHUNK_SIZE", "1000"))
+
+# Account summary rebuild recomputes summaries in chunks of users, each in its own transaction
+ACCOUNT_SUMMARY_REBUILD_CHUNK_SIZE = int(os.getenv("ACCOUNT_SUMMARY_REBUILD_CHUNK_SIZE", "1000"))
+
+# Rent history partitions are created months ahead, and old partitions are detached after the retention (0 keeps all)
+RENT_PARTITION_MONTHS_AHEAD = int(os.getenv("RENT_PARTITION_MONTHS_AHEAD", "3"))
+RENT_PARTITION_RETENTION_MONTHS = int(os.getenv("RENT_PARTITION_RETENTION_MONTHS", "0"))
+
+# Periodic jobs run in a scheduler thread of each worker, and each due job runs on one worker of the whole cluster.
+# The scheduler is off unless SCHEDULER_ENABLED is on, which the app service of docker-compose.yml sets, so tests and
+# management commands never start it
+SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "off") == "on"
+SCHEDULER_TICK_SECONDS = int(os.getenv("SCHEDULER_TICK_SECONDS", "30"))
+SCHEDULER_JOB_LEASE_SECONDS = int(os.getenv("SCHEDULER_JOB_LEASE_SECONDS", "3600"))
+# Interval of each periodic job, a job is disabled when its interval is zero
+OVERDUE_SWEEP_INTERVAL_SECONDS = int(os.getenv("OVERDUE_SWEEP_INTERVAL_SECONDS", "900"))
+ACCOUNT_SUMMARY_REBUILD_INTERVAL_SECONDS = int(os.getenv("ACCOUNT_SUMMARY_REBUILD_INTERVAL_SECONDS", "86400"))
+RENT_PARTITION_INTERVAL_SECONDS = int(os.getenv("RENT_PARTITION_INTERVAL_SECONDS", "86400"))
+REVOKED_TOKEN_PURGE_INTERVAL_SECONDS = int(os.getenv("REVOKED_TOKEN_PURGE_INTERVAL_SECONDS", "3600"))
+
+# Task workers run deferred tasks of the task queue, and failed tasks are retried with exponential backoff
+TASK_WORKER_THREADS = int(os.getenv("TASK_WORKER_THREADS", "4"))
+TASK_WORKER_POLL_SECONDS = float(os.getenv("TASK_WORKER_POLL_SECONDS", "1"))
+TASK_MAX_ATTEMPTS = int(os.getenv("TASK_MAX_ATTEMPTS", "5"))
+TASK_RETRY_BACKOFF_SECONDS = int(os.getenv("TASK_RETRY_BACKOFF_SECONDS", "10"))
+TASK_RETRY_MAX_BACKOFF_SECONDS = int(os.getenv("TASK_RETRY_MAX_BACKOFF_SECONDS", "3600"))
+
+# List counts at or above the threshold are estimated by the database planner, exact counts above it are cached
+PAGINATION_ESTIMATED_COUNT_THRESHOLD = int(os.getenv("PAGINATION_ESTIMATED_COUNT_THRESHOLD", "10000"))
+PAGINATION_COUNT_CACHE_SECONDS = int(os.getenv("PAGINATION_COUNT_CACHE_SECONDS", "30"))
+
+# Book autocomplete index of each worker is rebuilt from the database in the background after this interval, or
+# earlier once more books than the limit have changed in the worker since the last rebuild
+BOOK_AUTOCOMPLETE_REBUILD_SECONDS = int(os.getenv("BOOK_AUTOCOMPLETE_REBUILD_SECONDS", "300"))
+BOOK_AUTOCOMPLETE_MAX_CHANGED_BOOKS = int(os.getenv("BOOK_AUTOCOMPLETE_MAX_CHANGED_BOOKS", "500"))
+BOOK_AUTOCOMPLETE_MAX_SUGGESTIONS = int(os.getenv("BOOK_AUTOCOMPLETE_MAX_SUGGESTIONS", "10"))
+
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
     ],
-    'DEFAULT_AUTHENTICATION_CLASSES': ['rest_framework_simplejwt.authentication.JWTAuthentication'],
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        (
+            'user_management.authentication.permission_claim_authentication.PermissionClaimJWTAuthentication'
+            if JWT_PERMISSION_CLAIM_AUTHENTICATION
+            else 'user_management.authentication.revocable_authentication.RevocableJWTAuthentication'
+        )
+    ],
     'DEFAULT_PARSER_CLASSES': ['rest_framework.parsers.JSONParser', 'rest_framework.parsers.MultiPartParser'],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'cartoon_rent_api.pagination.EstimatedCountPagination',
     'PAGE_SIZE': 10,
 }
 
-SIMPLE_JWT = {'USER_ID_FIELD': 'user_id', 'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15), 'UPDATE_LAST_LOGIN': True}
+SIMPLE_JWT = {
+    'USER_ID_FIELD': 'user_id',
+    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15),
+    'UPDATE_LAST_LOGIN': False,
+    'TOKEN_OBTAIN_SERIALIZER': (
+        'user_management.serializers.token.permission_claim_token_serializer.PermissionClaimTokenObtainPairSerializer'
+    ),
+    'TOKEN_REFRESH_SERIALIZER': (
+        'user_management.serializers.token.permission_claim_token_serializer.PermissionClaimTokenRefreshSerializer'
+    ),
+}
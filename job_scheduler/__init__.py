@@ -0,0 +1 @@
+"""Django package directory."""
@@ -0,0 +1,6 @@
+"""Module register with admin interface."""
+
+from django.contrib import admin
+
+# Register your models here.
+__all__ = ['admin']
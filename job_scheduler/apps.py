@@ -0,0 +1,25 @@
+"""Configuration for storing metadata and settings."""
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.core.signals import request_started
+
+
+class JobSchedulerConfig(AppConfig):
+    """Configuration for periodic job scheduler app."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'job_scheduler'
+
+    def ready(self) -> None:
+        """Arm the scheduler to start in each worker process once the worker serves its first request.
+
+        Starting the scheduler thread here directly would start it in the gunicorn master when the application is
+        preloaded, and the thread would not survive forking into workers.
+        """
+        if settings.SCHEDULER_ENABLED:
+            from job_scheduler.services.job_scheduler_service import JobSchedulerService
+
+            request_started.connect(
+                JobSchedulerService.start_on_request, dispatch_uid="start_job_scheduler_on_first_request"
+            )
@@ -0,0 +1,11 @@
+"""Outcome type for keep track of the result of each scheduled job run."""
+
+from django.db import models
+
+
+class JobOutcomeType(models.TextChoices):
+    """Enumeration for scheduled job run outcome types."""
+
+    RUNNING = 'RUNNING'
+    SUCCEEDED = 'SUCCEEDED'
+    FAILED = 'FAILED'
@@ -0,0 +1,10 @@
+"""Status type for keep track of queued background tasks."""
+
+from django.db import models
+
+
+class TaskStatusType(models.TextChoices):
+    """Enumeration for queued task status types."""
+
+    PENDING = 'PENDING'
+    FAILED = 'FAILED'
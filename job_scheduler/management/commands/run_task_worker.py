@@ -0,0 +1,49 @@
+"""Management command for running background task workers."""
+
+import threading
+from typing import Any, Dict, List
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from job_scheduler.services.task_queue_service import TaskQueueService
+
+
+class Command(BaseCommand):
+    """Run queued tasks in a pool of worker threads until interrupted."""
+
+    help = "Run queued background tasks with a pool of worker threads."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add options for number of worker threads, poll interval and burst mode."""
+        parser.add_argument("--threads", type=int, default=None, help="Number of worker threads.")
+        parser.add_argument(
+            "--poll-interval", type=float, default=None, help="Seconds to wait before polling an empty queue again."
+        )
+        parser.add_argument("--burst", action="store_true", help="Exit once no due task is left in the queue.")
+
+    def handle(self, *args: Any, **options: Dict[str, Any]) -> None:
+        """Start worker threads and wait for them, stopping them gracefully on interrupt."""
+        thread_count: int = options["threads"] or settings.TASK_WORKER_THREADS
+        poll_interval_seconds: float = options["poll_interval"] or settings.TASK_WORKER_POLL_SECONDS
+        stop_event = threading.Event()
+        threads: List[threading.Thread] = [
+            threading.Thread(
+                target=TaskQueueService.run_worker,
+                args=(stop_event, poll_interval_seconds, options["burst"]),
+                name=f"task-worker-{thread_number}",
+            )
+            for thread_number in range(thread_count)
+        ]
+        for thread in threads:
+            thread.start()
+        self.stdout.write(f"Started {thread_count} task worker threads.")
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=1)
+        except KeyboardInterrupt:
+            stop_event.set()
+            for thread in threads:
+                thread.join()
+        self.stdout.write(self.style.SUCCESS("Task workers stopped."))
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name='JobRun',
+            fields=[
+                ('job_name', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('last_started_date', models.DateTimeField(blank=True, null=True)),
+                ('last_finished_date', models.DateTimeField(blank=True, null=True)),
+                ('last_duration', models.DurationField(blank=True, null=True)),
+                (
+                    'last_outcome',
+                    models.CharField(
+                        blank=True,
+                        choices=[('RUNNING', 'Running'), ('SUCCEEDED', 'Succeeded'), ('FAILED', 'Failed')],
+                        max_length=20,
+                        null=True,
+                    ),
+                ),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('run_count', models.PositiveIntegerField(default=0)),
+                ('locked_until', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
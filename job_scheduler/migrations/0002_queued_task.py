@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:07
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_scheduler', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QueuedTask',
+            fields=[
+                ('task_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('task_name', models.CharField(max_length=100)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[('PENDING', 'Pending'), ('FAILED', 'Failed')], default='PENDING', max_length=20
+                    ),
+                ),
+                ('attempt_count', models.PositiveIntegerField(default=0)),
+                ('max_attempts', models.PositiveIntegerField(default=1)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now)),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+            ],
+            options={
+                'indexes': [
+                    models.Index(
+                        condition=models.Q(('status', 'PENDING')),
+                        fields=['run_after'],
+                        name='pending_task_run_after_idx',
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,6 @@
+"""Job scheduler models package for model registrations."""
+
+from job_scheduler.models.job_run_model import JobRun
+from job_scheduler.models.queued_task_model import QueuedTask
+
+__all__ = ["JobRun", "QueuedTask"]
@@ -0,0 +1,22 @@
+"""Job run model definition for periodic job scheduler."""
+
+from django.db import models
+
+from job_scheduler.enums.job_outcome_type import JobOutcomeType
+
+
+class JobRun(models.Model):
+    """Model for keeping the last run of each scheduled job.
+
+    The row of a job is claimed with a conditional update when the job is due, so the job runs on one worker only.
+    Without database advisory locks, the claim also holds a lease until the run is recorded or the lease expires.
+    """
+
+    job_name = models.CharField(max_length=100, primary_key=True)
+    last_started_date = models.DateTimeField(null=True, blank=True)
+    last_finished_date = models.DateTimeField(null=True, blank=True)
+    last_duration = models.DurationField(null=True, blank=True)
+    last_outcome = models.CharField(max_length=20, choices=JobOutcomeType.choices, null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+    run_count = models.PositiveIntegerField(default=0)
+    locked_until = models.DateTimeField(null=True, blank=True)
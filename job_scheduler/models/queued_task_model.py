@@ -0,0 +1,35 @@
+"""Queued task model definition for background task queue."""
+
+from django.db import models
+from django.utils import timezone
+
+from job_scheduler.enums.task_status_type import TaskStatusType
+
+
+class QueuedTask(models.Model):
+    """Model for keeping deferred work until a task worker runs it.
+
+    Pending tasks are claimed by workers with row locks skipping tasks locked by other workers, and a task is deleted
+    once it has run successfully. Tasks which fail are retried later with backoff until they run out of attempts.
+    """
+
+    task_id = models.BigAutoField(primary_key=True)
+    task_name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=TaskStatusType.choices, default=TaskStatusType.PENDING)
+    attempt_count = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=1)
+    run_after = models.DateTimeField(default=timezone.now)
+    created_date = models.DateTimeField(auto_now_add=True)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        """Set up index of pending tasks in the order workers claim them."""
+
+        indexes = [
+            models.Index(
+                fields=["run_after"],
+                condition=models.Q(status=TaskStatusType.PENDING),
+                name="pending_task_run_after_idx",
+            )
+        ]
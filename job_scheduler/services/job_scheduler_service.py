@@ -0,0 +1,180 @@
+"""Utility service for running registered periodic jobs on one worker of the whole cluster."""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
+
+from django.conf import settings
+from django.db import connection, connections
+from django.db.models import F, Q
+from django.utils import timezone
+
+from job_scheduler.enums.job_outcome_type import JobOutcomeType
+from job_scheduler.models.job_run_model import JobRun
+
+logger = logging.getLogger(__name__)
+
+JOB_ERROR_MAX_LENGTH = 2000
+ADVISORY_LOCK_NAMESPACE = "job_scheduler"
+
+
+class ScheduledJob(NamedTuple):
+    """Periodic job declared in the job registry."""
+
+    name: str
+    interval_seconds: int
+    function: Callable[[], Any]
+
+
+class JobSchedulerService:
+    """Function service to declare periodic jobs and run each due job on exactly one worker.
+
+    Every worker ticks in a daemon thread and tries each registered job. On PostgreSQL a worker first takes a session
+    advisory lock of the job, and on other databases the job row holds a lease instead. The job is then claimed with
+    a conditional update which only matches when the interval has passed since the last start, so a job runs once
+    per interval however many workers tick. Duration and outcome of the last run are recorded in the job run table.
+    """
+
+    _lock = threading.Lock()
+    _jobs: Dict[str, ScheduledJob] = {}
+    _created_job_names: Set[str] = set()
+    _scheduler_thread: Optional[threading.Thread] = None
+    _scheduler_pid: Optional[int] = None
+    _stop_event: Optional[threading.Event] = None
+
+    @classmethod
+    def register_job(cls, name: str, interval_seconds: int, function: Callable[[], Any]) -> None:
+        """Declare a job to run every interval, jobs without a positive interval are disabled."""
+        if interval_seconds > 0:
+            cls._jobs[name] = ScheduledJob(name, interval_seconds, function)
+        else:
+            cls._jobs.pop(name, None)
+
+    @classmethod
+    def get_registered_jobs(cls) -> List[ScheduledJob]:
+        """Get every enabled job of the registry."""
+        return list(cls._jobs.values())
+
+    @classmethod
+    def run_due_jobs(cls, now: Optional[datetime] = None) -> List[str]:
+        """Run every registered job which is due and not claimed by another worker, returning names of run jobs."""
+        jobs: List[ScheduledJob] = cls.get_registered_jobs()
+        cls._create_job_runs(jobs)
+        return [job.name for job in jobs if cls.run_job(job, now)]
+
+    @classmethod
+    def run_job(cls, job: ScheduledJob, now: Optional[datetime] = None) -> bool:
+        """Run a job if it is due and this worker wins its claim, returning whether the job has run."""
+        now = now or timezone.now()
+        if connection.vendor != "postgresql":
+            if not cls._claim_job_run(job, now, use_lease=True):
+                return False
+            cls._execute_job(job)
+            return True
+        lock_key: int = cls._get_advisory_lock_key(job.name)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [lock_key])
+            if not cursor.fetchone()[0]:
+                return False
+            try:
+                if not cls._claim_job_run(job, now, use_lease=False):
+                    return False
+                cls._execute_job(job)
+                return True
+            finally:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_key])
+
+    @classmethod
+    def start(cls) -> None:
+        """Start ticking in a daemon thread of the current process unless it is already running."""
+        with cls._lock:
+            if (
+                cls._scheduler_thread is not None
+                and cls._scheduler_thread.is_alive()
+                and cls._scheduler_pid == os.getpid()
+            ):
+                return
+            cls._stop_event = threading.Event()
+            cls._scheduler_thread = threading.Thread(
+                target=cls._run_scheduler_loop, args=(cls._stop_event,), name="job-scheduler", daemon=True
+            )
+            cls._scheduler_pid = os.getpid()
+            cls._scheduler_thread.start()
+
+    @classmethod
+    def stop(cls) -> None:
+        """Stop ticking after the job which is currently running, if any."""
+        with cls._lock:
+            if cls._stop_event is not None:
+                cls._stop_event.set()
+            cls._scheduler_thread = None
+            cls._stop_event = None
+
+    @classmethod
+    def start_on_request(cls, sender: Any, **kwargs: Dict[str, Any]) -> None:
+        """Start the scheduler of the worker from the request started signal."""
+        if cls._scheduler_pid != os.getpid():
+            cls.start()
+
+    @classmethod
+    def _run_scheduler_loop(cls, stop_event: threading.Event) -> None:
+        """Run due jobs every tick until stopped, releasing database connections of the thread after each tick."""
+        while not stop_event.wait(settings.SCHEDULER_TICK_SECONDS):
+            try:
+                cls.run_due_jobs()
+            except Exception:
+                logger.exception("Scheduler tick failed")
+            finally:
+                connections.close_all()
+
+    @classmethod
+    def _create_job_runs(cls, jobs: List[ScheduledJob]) -> None:
+        """Create job run rows of registered jobs which were not created by this process yet."""
+        new_job_names: List[str] = [job.name for job in jobs if job.name not in cls._created_job_names]
+        if new_job_names:
+            JobRun.objects.bulk_create([JobRun(job_name=job_name) for job_name in new_job_names], ignore_conflicts=True)
+            cls._created_job_names.update(new_job_names)
+
+    @staticmethod
+    def _claim_job_run(job: ScheduledJob, now: datetime, use_lease: bool) -> bool:
+        """Mark a due job as started with a conditional update and return whether this worker has claimed it."""
+        job_runs = JobRun.objects.filter(
+            Q(last_started_date__isnull=True) | Q(last_started_date__lte=now - timedelta(seconds=job.interval_seconds)),
+            job_name=job.name,
+        )
+        claim_fields: Dict[str, Any] = {"last_started_date": now, "last_outcome": JobOutcomeType.RUNNING.value}
+        if use_lease:
+            job_runs = job_runs.filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now))
+            claim_fields["locked_until"] = now + timedelta(seconds=settings.SCHEDULER_JOB_LEASE_SECONDS)
+        return job_runs.update(**claim_fields) == 1
+
+    @staticmethod
+    def _execute_job(job: ScheduledJob) -> None:
+        """Run a claimed job and record its duration and outcome, releasing the lease of the job."""
+        start_time: float = time.monotonic()
+        outcome: str = JobOutcomeType.SUCCEEDED.value
+        error: str = ""
+        try:
+            job.function()
+        except Exception as job_error:
+            logger.exception("Scheduled job %s failed", job.name)
+            outcome = JobOutcomeType.FAILED.value
+            error = repr(job_error)[:JOB_ERROR_MAX_LENGTH]
+        JobRun.objects.filter(job_name=job.name).update(
+            last_finished_date=timezone.now(),
+            last_duration=timedelta(seconds=time.monotonic() - start_time),
+            last_outcome=outcome,
+            last_error=error,
+            run_count=F("run_count") + 1,
+            locked_until=None,
+        )
+
+    @staticmethod
+    def _get_advisory_lock_key(job_name: str) -> int:
+        """Derive the signed 64 bit advisory lock key of a job from its name."""
+        digest: bytes = hashlib.blake2b(f"{ADVISORY_LOCK_NAMESPACE}:{job_name}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big", signed=True)
@@ -0,0 +1,125 @@
+"""Utility service for deferring work to background task workers through a database table."""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from job_scheduler.enums.task_status_type import TaskStatusType
+from job_scheduler.models.queued_task_model import QueuedTask
+
+logger = logging.getLogger(__name__)
+
+TASK_ERROR_MAX_LENGTH = 2000
+
+
+class TaskQueueService:
+    """Function service to enqueue tasks and run them in task workers.
+
+    A task is inserted in the transaction of the caller, so it becomes visible to workers only when the state change
+    which caused it commits, and it is discarded with that change on rollback. Workers claim pending tasks with
+    `SELECT ... FOR UPDATE SKIP LOCKED` and run each task in the transaction which holds its row lock, so database
+    changes of a task commit together with the removal of the task and a task is never run twice after success.
+    """
+
+    _handlers: Dict[str, Callable[..., Any]] = {}
+
+    @classmethod
+    def register_task(cls, task_name: str, handler: Callable[..., Any]) -> None:
+        """Declare the function which runs tasks of the given name with the task payload as keyword arguments."""
+        cls._handlers[task_name] = handler
+
+    @classmethod
+    def enqueue(
+        cls,
+        task_name: str,
+        payload: Optional[Dict[str, Any]] = None,
+        run_after: Optional[datetime] = None,
+        max_attempts: Optional[int] = None,
+    ) -> QueuedTask:
+        """Queue a task which workers can run once the current transaction commits."""
+        return QueuedTask.objects.create(
+            task_name=task_name,
+            payload=payload or {},
+            run_after=run_after or timezone.now(),
+            max_attempts=max_attempts or settings.TASK_MAX_ATTEMPTS,
+        )
+
+    @classmethod
+    def run_next_task(cls, now: Optional[datetime] = None) -> bool:
+        """Claim and run the pending task which is due first, returning whether any task was claimed.
+
+        A failed task is rolled back and retried after an exponential backoff, or kept as failed when it has used
+        every attempt.
+        """
+        now = now or timezone.now()
+        with transaction.atomic():
+            task: Optional[QueuedTask] = (
+                QueuedTask.objects.select_for_update(skip_locked=True)
+                .filter(status=TaskStatusType.PENDING.value, run_after__lte=now)
+                .order_by("run_after")
+                .first()
+            )
+            if task is None:
+                return False
+            try:
+                with transaction.atomic():
+                    cls._handlers[task.task_name](**task.payload)
+            except Exception as task_error:
+                logger.exception("Queued task %s %s failed", task.task_name, task.task_id)
+                cls._retry_task(task, task_error, now)
+            else:
+                task.delete()
+        return True
+
+    @classmethod
+    def run_pending_tasks(cls, now: Optional[datetime] = None) -> int:
+        """Run every due pending task one after another and return the number of claimed tasks."""
+        task_count: int = 0
+        while cls.run_next_task(now):
+            task_count += 1
+        return task_count
+
+    @classmethod
+    def run_worker(cls, stop_event: threading.Event, poll_interval_seconds: float, burst: bool = False) -> None:
+        """Run tasks in the current thread until stopped, waiting for the poll interval whenever the queue is empty.
+
+        Burst workers stop as soon as no due task is left.
+        """
+        try:
+            while not stop_event.is_set():
+                try:
+                    claimed: bool = cls.run_next_task()
+                except Exception:
+                    logger.exception("Task worker failed to claim a task")
+                    claimed = False
+                if not claimed:
+                    if burst:
+                        return
+                    stop_event.wait(poll_interval_seconds)
+        finally:
+            connections.close_all()
+
+    @staticmethod
+    def get_retry_delay(attempt_count: int) -> timedelta:
+        """Get exponential backoff delay before the next attempt of a task which has failed the given times."""
+        return timedelta(
+            seconds=min(
+                settings.TASK_RETRY_BACKOFF_SECONDS * 2 ** (attempt_count - 1), settings.TASK_RETRY_MAX_BACKOFF_SECONDS
+            )
+        )
+
+    @classmethod
+    def _retry_task(cls, task: QueuedTask, task_error: Exception, now: datetime) -> None:
+        """Record a failed attempt and schedule the next attempt or mark the task as failed."""
+        task.attempt_count += 1
+        task.last_error = repr(task_error)[:TASK_ERROR_MAX_LENGTH]
+        if task.attempt_count >= task.max_attempts:
+            task.status = TaskStatusType.FAILED.value
+        else:
+            task.run_after = now + cls.get_retry_delay(task.attempt_count)
+        task.save(update_fields=["attempt_count", "last_error", "status", "run_after"])
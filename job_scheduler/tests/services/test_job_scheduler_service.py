@@ -0,0 +1,139 @@
+"""Unittest for periodic job scheduler service."""
+
+import threading
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Dict, List
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings, skipUnlessDBFeature
+
+from job_scheduler.enums.job_outcome_type import JobOutcomeType
+from job_scheduler.models.job_run_model import JobRun
+from job_scheduler.services.job_scheduler_service import JobSchedulerService, ScheduledJob
+
+TICK_DATE = datetime(2025, 10, 20, 12, 0, 0, tzinfo=dt_timezone.utc)
+CONCURRENT_WORKER_COUNT = 8
+
+
+class JobRegistryTestMixin:
+    """Replace the job registry with an empty one for each test and restore it afterwards."""
+
+    def setUp(self) -> None:
+        """Empty the job registry."""
+        super().setUp()
+        self.registered_jobs: Dict[str, ScheduledJob] = dict(JobSchedulerService._jobs)
+        JobSchedulerService._jobs.clear()
+        JobSchedulerService._created_job_names.clear()
+        self.job_calls: List[str] = []
+
+    def tearDown(self) -> None:
+        """Restore the job registry."""
+        JobSchedulerService._jobs.clear()
+        JobSchedulerService._jobs.update(self.registered_jobs)
+        JobSchedulerService._created_job_names.clear()
+        super().tearDown()
+
+    def record_call(self) -> None:
+        """Job function which only records that it has run."""
+        self.job_calls.append("called")
+
+
+class TestJobSchedulerService(JobRegistryTestMixin, TestCase):
+    """Test case for running registered jobs once per interval and recording their runs."""
+
+    def test_register_jobs_of_apps(self) -> None:
+        """Test declaring periodic jobs of every app in the registry."""
+        self.assertTrue(
+            {"mark_overdue_rents", "rebuild_user_account_summaries", "purge_expired_revoked_tokens"}.issubset(
+                self.registered_jobs
+            )
+        )
+
+    def test_run_due_job_once_per_interval(self) -> None:
+        """Test running job when due and recording duration and outcome of the run."""
+        JobSchedulerService.register_job("record_call", 60, self.record_call)
+        self.assertEqual(JobSchedulerService.run_due_jobs(TICK_DATE), ["record_call"])
+        self.assertEqual(JobSchedulerService.run_due_jobs(TICK_DATE + timedelta(seconds=59)), [])
+        self.assertEqual(JobSchedulerService.run_due_jobs(TICK_DATE + timedelta(seconds=60)), ["record_call"])
+        self.assertEqual(len(self.job_calls), 2)
+
+        job_run: JobRun = JobRun.objects.get(job_name="record_call")
+        self.assertEqual(job_run.run_count, 2)
+        self.assertEqual(job_run.last_outcome, JobOutcomeType.SUCCEEDED.value)
+        self.assertEqual(job_run.last_started_date, TICK_DATE + timedelta(seconds=60))
+        self.assertIsNotNone(job_run.last_duration)
+        self.assertIsNone(job_run.locked_until)
+
+    def test_record_failed_job(self) -> None:
+        """Test recording failure of a job and releasing its claim."""
+
+        def fail() -> None:
+            raise ValueError("sweep failed")
+
+        JobSchedulerService.register_job("fail", 60, fail)
+        self.assertEqual(JobSchedulerService.run_due_jobs(TICK_DATE), ["fail"])
+        job_run: JobRun = JobRun.objects.get(job_name="fail")
+        self.assertEqual(job_run.last_outcome, JobOutcomeType.FAILED.value)
+        self.assertIn("sweep failed", job_run.last_error)
+        self.assertIsNone(job_run.locked_until)
+
+    def test_skip_job_claimed_by_other_worker(self) -> None:
+        """Test not running a due job whose lease is held by another worker."""
+        JobSchedulerService.register_job("record_call", 60, self.record_call)
+        JobRun.objects.create(job_name="record_call", locked_until=TICK_DATE + timedelta(minutes=5))
+        if connection.vendor == "postgresql":
+            JobRun.objects.filter(job_name="record_call").update(last_started_date=TICK_DATE)
+        self.assertEqual(JobSchedulerService.run_due_jobs(TICK_DATE), [])
+        self.assertEqual(self.job_calls, [])
+
+    def test_disable_job_without_interval(self) -> None:
+        """Test removing job from the registry when its interval is zero."""
+        JobSchedulerService.register_job("record_call", 60, self.record_call)
+        JobSchedulerService.register_job("record_call", 0, self.record_call)
+        self.assertEqual(JobSchedulerService.get_registered_jobs(), [])
+
+    @override_settings(SCHEDULER_TICK_SECONDS=3600)
+    def test_start_and_stop_scheduler(self) -> None:
+        """Test starting one daemon scheduler thread per process and stopping it."""
+        JobSchedulerService.start()
+        try:
+            scheduler_thread: threading.Thread = JobSchedulerService._scheduler_thread
+            self.assertTrue(scheduler_thread.daemon)
+            JobSchedulerService.start_on_request(sender=None)
+            self.assertIs(JobSchedulerService._scheduler_thread, scheduler_thread)
+        finally:
+            JobSchedulerService.stop()
+        scheduler_thread.join(timeout=5)
+        self.assertFalse(scheduler_thread.is_alive())
+
+
+@skipUnlessDBFeature("has_select_for_update")
+class TestConcurrentJobScheduler(JobRegistryTestMixin, TransactionTestCase):
+    """Test case for ticking the same job from many workers at once.
+
+    It runs only on databases with row level locking, since SQLite rejects concurrent writers with table lock errors.
+    """
+
+    def test_only_one_worker_runs_due_job(self) -> None:
+        """Test that exactly one of many concurrently ticking workers runs a due job."""
+        JobSchedulerService.register_job("record_call", 60, self.record_call)
+        JobSchedulerService.run_due_jobs(TICK_DATE - timedelta(seconds=60))
+        self.job_calls.clear()
+        start_barrier = threading.Barrier(CONCURRENT_WORKER_COUNT)
+
+        def tick() -> None:
+            start_barrier.wait()
+            try:
+                JobSchedulerService.run_due_jobs(TICK_DATE)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=tick) for _ in range(CONCURRENT_WORKER_COUNT)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.job_calls), 1)
+        self.assertEqual(JobRun.objects.get(job_name="record_call").run_count, 2)
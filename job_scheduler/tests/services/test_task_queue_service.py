@@ -0,0 +1,142 @@
+"""Unittest for background task queue service."""
+
+import threading
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from io import StringIO
+from typing import Callable, Dict, List
+
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings, skipUnlessDBFeature
+
+from job_scheduler.enums.task_status_type import TaskStatusType
+from job_scheduler.models.job_run_model import JobRun
+from job_scheduler.models.queued_task_model import QueuedTask
+from job_scheduler.services.task_queue_service import TaskQueueService
+
+RUN_DATE = datetime(2025, 10, 20, 12, 0, 0, tzinfo=dt_timezone.utc)
+CONCURRENT_TASK_COUNT = 20
+CONCURRENT_WORKER_COUNT = 4
+
+
+class TaskRegistryTestMixin:
+    """Replace the task handler registry with one recording calls for each test and restore it afterwards."""
+
+    def setUp(self) -> None:
+        """Register a task handler which records its payload."""
+        super().setUp()
+        self.registered_handlers: Dict[str, Callable] = dict(TaskQueueService._handlers)
+        self.task_calls: List[int] = []
+        self.task_calls_lock = threading.Lock()
+        TaskQueueService.register_task("record_call", self.record_call)
+
+    def tearDown(self) -> None:
+        """Restore the task handler registry."""
+        TaskQueueService._handlers.clear()
+        TaskQueueService._handlers.update(self.registered_handlers)
+        super().tearDown()
+
+    def record_call(self, number: int) -> None:
+        """Task handler which only records that it has run."""
+        with self.task_calls_lock:
+            self.task_calls.append(number)
+
+
+@override_settings(TASK_MAX_ATTEMPTS=3, TASK_RETRY_BACKOFF_SECONDS=10, TASK_RETRY_MAX_BACKOFF_SECONDS=15)
+class TestTaskQueueService(TaskRegistryTestMixin, TestCase):
+    """Test case for enqueueing tasks and running them with retries."""
+
+    def test_register_tasks_of_apps(self) -> None:
+        """Test declaring queued tasks of every app in the registry."""
+        self.assertIn("refresh_user_account_summaries", self.registered_handlers)
+
+    def test_run_due_task_once(self) -> None:
+        """Test running due task with its payload and removing it, while tasks which are not due wait."""
+        TaskQueueService.enqueue("record_call", {"number": 1}, run_after=RUN_DATE)
+        TaskQueueService.enqueue("record_call", {"number": 2}, run_after=RUN_DATE + timedelta(minutes=1))
+        self.assertEqual(TaskQueueService.run_pending_tasks(RUN_DATE), 1)
+        self.assertEqual(self.task_calls, [1])
+        self.assertEqual(QueuedTask.objects.count(), 1)
+        self.assertFalse(TaskQueueService.run_next_task(RUN_DATE))
+
+    def test_discard_task_of_rolled_back_transaction(self) -> None:
+        """Test that a task is only queued when the transaction which enqueued it commits."""
+        with self.assertRaises(ValueError):
+            with transaction.atomic():
+                TaskQueueService.enqueue("record_call", {"number": 1})
+                raise ValueError("rent failed")
+        self.assertFalse(QueuedTask.objects.exists())
+
+    def test_retry_failed_task_with_backoff(self) -> None:
+        """Test rolling back a failed task and retrying it later until it runs out of attempts."""
+
+        def fail() -> None:
+            JobRun.objects.create(job_name="partial_work")
+            raise ValueError("task failed")
+
+        TaskQueueService.register_task("fail", fail)
+        task: QueuedTask = TaskQueueService.enqueue("fail", run_after=RUN_DATE)
+        self.assertTrue(TaskQueueService.run_next_task(RUN_DATE))
+        task.refresh_from_db()
+        self.assertEqual(task.attempt_count, 1)
+        self.assertEqual(task.run_after, RUN_DATE + timedelta(seconds=10))
+        self.assertIn("task failed", task.last_error)
+        self.assertFalse(JobRun.objects.filter(job_name="partial_work").exists())
+
+        self.assertFalse(TaskQueueService.run_next_task(RUN_DATE + timedelta(seconds=9)))
+        TaskQueueService.run_next_task(task.run_after)
+        task.refresh_from_db()
+        self.assertEqual(task.run_after, RUN_DATE + timedelta(seconds=25))
+        TaskQueueService.run_next_task(task.run_after)
+        task.refresh_from_db()
+        self.assertEqual(task.attempt_count, 3)
+        self.assertEqual(task.status, TaskStatusType.FAILED.value)
+        self.assertFalse(TaskQueueService.run_next_task(RUN_DATE + timedelta(days=1)))
+
+    def test_fail_task_without_handler(self) -> None:
+        """Test keeping a task whose name has no registered handler as failed after its attempts."""
+        task: QueuedTask = TaskQueueService.enqueue("unknown", max_attempts=1)
+        TaskQueueService.run_pending_tasks()
+        task.refresh_from_db()
+        self.assertEqual(task.status, TaskStatusType.FAILED.value)
+
+
+class TestTaskWorkerCommand(TaskRegistryTestMixin, TransactionTestCase):
+    """Test case for running task workers in threads which read committed tasks."""
+
+    def test_run_task_worker_command(self) -> None:
+        """Test draining the queue from management command in burst mode."""
+        for number in range(3):
+            TaskQueueService.enqueue("record_call", {"number": number})
+        output = StringIO()
+        call_command("run_task_worker", "--threads", "1", "--burst", stdout=output)
+        self.assertEqual(sorted(self.task_calls), [0, 1, 2])
+        self.assertIn("Task workers stopped.", output.getvalue())
+
+
+@skipUnlessDBFeature("has_select_for_update_skip_locked")
+class TestConcurrentTaskWorkers(TaskRegistryTestMixin, TransactionTestCase):
+    """Test case for draining the queue from many worker threads at once.
+
+    It runs only on databases which can skip locked rows, since SQLite rejects concurrent writers with table lock
+    errors.
+    """
+
+    def test_each_task_runs_once(self) -> None:
+        """Test that concurrent workers split the queue without running any task twice."""
+        for number in range(CONCURRENT_TASK_COUNT):
+            TaskQueueService.enqueue("record_call", {"number": number})
+        stop_event = threading.Event()
+        threads = [
+            threading.Thread(target=TaskQueueService.run_worker, args=(stop_event, 0, True))
+            for _ in range(CONCURRENT_WORKER_COUNT)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(self.task_calls), list(range(CONCURRENT_TASK_COUNT)))
+        self.assertFalse(QueuedTask.objects.exists())
+        connection.close()
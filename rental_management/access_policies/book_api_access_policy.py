@@ -7,7 +7,7 @@ class BookApiAccessPolicy(GlobalApiAccessPolicy):
     """Access policy for book service CRUD APIs."""
 
     statements = [
-        {"action": ["retrieve", "list"], "principal": "authenticated", "effect": "allow"},
+        {"action": ["retrieve", "list", "search", "autocomplete"], "principal": "authenticated", "effect": "allow"},
         {"action": ["*"], "principal": "authenticated", "effect": "allow", "condition": "has_role_permission"},
         {"action": ["*"], "principal": "*", "effect": "allow", "condition": "is_admin"},
     ]
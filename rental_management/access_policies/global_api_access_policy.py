@@ -1,20 +1,25 @@
 """Global access policy for rental service CRUD APIs."""
 
-from typing import Dict, List, Type
+from typing import Dict, Type
 
-from django.db.models import Q
-from rest_access_policy import AccessPolicy
 from rest_framework.request import Request
 from rest_framework.viewsets import ModelViewSet
 
-from user_management.models.user_role_binding_model import UserRoleBinding
-from user_management.models.user_role_permission_binding_model import UserRolePermissionBinding
+from user_management.access_policies.compiled_access_policy import CompiledAccessPolicy
 from user_management.models.user_role_permission_model import ActionOptions
+from user_management.services.permission_service import PermissionService
 
 
-class GlobalApiAccessPolicy(AccessPolicy):
+class GlobalApiAccessPolicy(CompiledAccessPolicy):
     """Global access policy for controlling user access to rental service APIs."""
 
+    permission_action_mapping: Dict[str, str] = {
+        "list": ActionOptions.READ_ALL.value,
+        "create": ActionOptions.CREATE.value,
+        "update": ActionOptions.UPDATE.value,
+        "partial_update": ActionOptions.UPDATE.value,
+        "destroy": ActionOptions.DELETE.value,
+    }
     statements = [
         {"action": ["retrieve", "list"], "principal": "authenticated", "effect": "allow"},
         {"action": ["*"], "principal": "authenticated", "effect": "allow", "condition": "has_role_permission"},
@@ -27,20 +32,4 @@ class GlobalApiAccessPolicy(AccessPolicy):
 
     def has_role_permission(self, request: Request, view: Type[ModelViewSet], action: str) -> bool:
         """Verify request user permission by checking permission in each assigned role."""
-        permission_action_mapping: Dict[str, str] = {
-            "list": ActionOptions.READ_ALL.value,
-            "create": ActionOptions.CREATE.value,
-            "update": ActionOptions.UPDATE.value,
-            "partial_update": ActionOptions.UPDATE.value,
-            "destroy": ActionOptions.DELETE.value,
-        }
-        role_with_selected_permission_action: List[int] = list(
-            UserRolePermissionBinding.objects.filter(
-                Q(permission_id__action=permission_action_mapping.get(action, ""))
-                | Q(permission_id__action=ActionOptions.ALL.value)
-            ).values_list("role_id", flat=True)
-        )
-        user_assigned_roles = UserRoleBinding.objects.filter(
-            user_id=request.user.user_id, role_id__in=role_with_selected_permission_action
-        )
-        return user_assigned_roles.exists()
+        return PermissionService.has_request_permission(request, self.permission_action_mapping.get(action, ""))
@@ -1,20 +1,23 @@
 """Access policy for rent service CRUD APIs."""
 
-from typing import List
+from typing import Optional
 
 from django.db.models import Q
 from django.db.models.query import QuerySet
 from rest_framework.request import Request
 
 from rental_management.access_policies.global_api_access_policy import GlobalApiAccessPolicy
-from user_management.models.user_role_binding_model import UserRoleBinding
-from user_management.models.user_role_permission_binding_model import UserRolePermissionBinding
 from user_management.models.user_role_permission_model import ActionOptions
+from user_management.services.permission_service import PermissionService
 
 
 class RentApiAccessPolicy(GlobalApiAccessPolicy):
     """Access policy for rent service CRUD APIs."""
 
+    permission_action_mapping = {
+        **GlobalApiAccessPolicy.permission_action_mapping,
+        "checkout_cart": ActionOptions.CREATE.value,
+    }
     statements = [
         {"action": ["retrieve", "list"], "principal": "authenticated", "effect": "allow"},
         {"action": ["*"], "principal": "authenticated", "effect": "allow", "condition": "has_role_permission"},
@@ -29,18 +32,21 @@ class RentApiAccessPolicy(GlobalApiAccessPolicy):
         1. Admin user or user with read all permission: can request for any book rent records.
         2. Normal user: can request for only the records that they are created or assigned to.
         """
-        if request.user.is_admin:
+        if cls.can_read_all_rent_records(request):
             return queryset
-        else:
-            role_with_read_all_permission: List[int] = list(
-                UserRolePermissionBinding.objects.filter(
-                    Q(permission_id__action=ActionOptions.READ_ALL.value)
-                    | Q(permission_id__action=ActionOptions.ALL.value)
-                ).values_list("role_id", flat=True)
-            )
-            user_assigned_roles_with_read_all_permission = UserRoleBinding.objects.filter(
-                user_id=request.user.user_id, role_id__in=role_with_read_all_permission
-            )
-            if user_assigned_roles_with_read_all_permission.exists():
-                return queryset
         return queryset.filter(Q(user_id=request.user.user_id) | Q(created_by=request.user.user_id))
+
+    @staticmethod
+    def can_read_all_rent_records(request: Request) -> bool:
+        """Check if request user can read every rent record, decided once per request.
+
+        The decision is read from the cached permission mask of the user, which is invalidated whenever role
+        bindings of the user change, so scoping the queryset does not query the database.
+        """
+        can_read_all: Optional[bool] = getattr(request, "_can_read_all_rent_records", None)
+        if can_read_all is None:
+            can_read_all = request.user.is_admin or PermissionService.has_request_permission(
+                request, ActionOptions.READ_ALL.value
+            )
+            request._can_read_all_rent_records = can_read_all
+        return can_read_all
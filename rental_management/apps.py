@@ -1,6 +1,7 @@
 """Configuration for storing metadata and settings."""
 
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class RentalManagementConfig(AppConfig):
@@ -8,3 +9,34 @@ class RentalManagementConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'rental_management'
+
+    def ready(self) -> None:
+        """Register signal receivers, periodic jobs and queued tasks of rental management app."""
+        from job_scheduler.services.job_scheduler_service import JobSchedulerService
+        from job_scheduler.services.task_queue_service import TaskQueueService
+        from rental_management.services.account_summary_service import (
+            REFRESH_ACCOUNT_SUMMARIES_TASK,
+            AccountSummaryService,
+        )
+        from rental_management.services.overdue_rent_service import OverdueRentService
+        from rental_management.services.rent_partition_service import RentPartitionService
+        from rental_management.signals import (  # noqa: F401
+            account_summary_signals,
+            book_autocomplete_signals,
+            book_search_signals,
+        )
+
+        JobSchedulerService.register_job(
+            "mark_overdue_rents", settings.OVERDUE_SWEEP_INTERVAL_SECONDS, OverdueRentService.mark_overdue_rents
+        )
+        JobSchedulerService.register_job(
+            "rebuild_user_account_summaries",
+            settings.ACCOUNT_SUMMARY_REBUILD_INTERVAL_SECONDS,
+            AccountSummaryService.rebuild_account_summaries,
+        )
+        JobSchedulerService.register_job(
+            "maintain_rent_history_partitions",
+            settings.RENT_PARTITION_INTERVAL_SECONDS,
+            RentPartitionService.maintain_partitions,
+        )
+        TaskQueueService.register_task(REFRESH_ACCOUNT_SUMMARIES_TASK, AccountSummaryService.refresh_account_summaries)
@@ -10,3 +10,6 @@ class RentStatusType(models.TextChoices):
     COMPLETED = 'COMPLETED'
     OVERDUE = 'OVERDUE'
     UNPAID = 'UNPAID'
+
+
+ACTIVE_RENT_STATUSES = [RentStatusType.IN_PROGRESS.value, RentStatusType.OVERDUE.value]
@@ -0,0 +1,12 @@
+"""Outcome type for keep track of the result of each returned book."""
+
+from django.db import models
+
+
+class ReturnOutcomeType(models.TextChoices):
+    """Enumeration for book return outcome types."""
+
+    RETURNED = 'RETURNED'
+    ALREADY_RETURNED = 'ALREADY_RETURNED'
+    OUT_OF_SERVICE = 'OUT_OF_SERVICE'
+    NOT_FOUND = 'NOT_FOUND'
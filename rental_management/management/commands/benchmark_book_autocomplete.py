@@ -0,0 +1,79 @@
+"""Management command for measuring memory and lookup time of the book autocomplete index."""
+
+import random
+import time
+import timeit
+import tracemalloc
+from typing import Any, Dict, List, Tuple
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from rental_management.services.book_autocomplete_service import BookAutocompleteIndex
+
+BENCHMARK_SYLLABLES: List[str] = [
+    "ka", "ki", "ku", "ke", "ko", "sa", "shi", "su", "ta", "chi", "to", "na", "ni", "no", "ha", "hi",
+    "mo", "ya", "yu", "ra", "ri", "ru", "wa", "do", "ga", "go", "ba", "bo", "pa", "po", "man", "ron",
+]  # fmt: skip
+BENCHMARK_MAX_SUGGESTIONS = 10
+BYTES_PER_MEBIBYTE = 1024 * 1024
+
+
+class Command(BaseCommand):
+    """Build the autocomplete index from generated books and report its memory, build time and lookup time.
+
+    Names have two to five romanized words and authors two, like the titles of the store, and popularity is random.
+    The index is built once for timing and once more under tracemalloc, which measures the allocations it keeps.
+    """
+
+    help = "Measure memory per 100k titles and lookup time of the book autocomplete index."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add options for number of generated books and of measured lookups."""
+        parser.add_argument("--titles", type=int, default=100_000, help="Number of generated books.")
+        parser.add_argument("--lookups", type=int, default=1000, help="Number of measured lookups.")
+        parser.add_argument("--seed", type=int, default=0, help="Seed of generated books and prefixes.")
+
+    def handle(self, *args: Any, **options: Dict[str, Any]) -> None:
+        """Build the index, look up random prefixes and print the measurements."""
+        title_count: int = options["titles"]
+        generator = random.Random(options["seed"])
+        records: List[Tuple[int, str, str, int]] = [
+            (book_id, self.make_words(generator, generator.randint(2, 5)), self.make_words(generator, 2), popularity)
+            for book_id, popularity in enumerate((generator.randint(0, 500) for _ in range(title_count)), start=1)
+        ]
+        prefixes: List[str] = [
+            generator.choice(records)[1].split()[0][: generator.randint(1, 6)] for _ in range(options["lookups"])
+        ]
+
+        build_start_time: float = time.perf_counter()
+        index = BookAutocompleteIndex(records, BENCHMARK_MAX_SUGGESTIONS)
+        build_seconds: float = time.perf_counter() - build_start_time
+        del index
+        tracemalloc.start()
+        try:
+            allocated_bytes_before: int = tracemalloc.get_traced_memory()[0]
+            index = BookAutocompleteIndex(records, BENCHMARK_MAX_SUGGESTIONS)
+            index_bytes: int = tracemalloc.get_traced_memory()[0] - allocated_bytes_before
+        finally:
+            tracemalloc.stop()
+        lookup_seconds: float = timeit.timeit(
+            lambda: [index.search(prefix, BENCHMARK_MAX_SUGGESTIONS) for prefix in prefixes], number=1
+        )
+
+        self.stdout.write(f"Indexed books: {len(index)}")
+        self.stdout.write(f"Indexed words: {len(index.key_offsets)}")
+        self.stdout.write(f"Build time: {build_seconds:.2f} s")
+        self.stdout.write(f"Lookup time: {lookup_seconds / max(len(prefixes), 1) * 1e6:.1f} us")
+        self.stdout.write(f"Index memory: {index_bytes / BYTES_PER_MEBIBYTE:.1f} MiB")
+        index_mebibytes_per_100k_titles: float = index_bytes / max(title_count, 1) * 100_000 / BYTES_PER_MEBIBYTE
+        self.stdout.write(
+            self.style.SUCCESS(f"Index memory per 100k titles: {index_mebibytes_per_100k_titles:.1f} MiB")
+        )
+
+    @staticmethod
+    def make_words(generator: random.Random, word_count: int) -> str:
+        """Generate capitalized words of two to four syllables."""
+        return " ".join(
+            "".join(generator.choices(BENCHMARK_SYLLABLES, k=generator.randint(2, 4))).capitalize()
+            for _ in range(word_count)
+        )
@@ -0,0 +1,45 @@
+"""Management command for partitioning rent history by month of the rent date."""
+
+from typing import Any, Dict, List
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import NotSupportedError
+
+from rental_management.services.rent_partition_service import RentPartitionService
+
+
+class Command(BaseCommand):
+    """Create upcoming partitions of rent history and detach expired ones.
+
+    Rent history is converted into a monthly partitioned table by a migration on PostgreSQL.
+    """
+
+    help = "Manage monthly partitions of rent history on PostgreSQL."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add options for months created ahead and months of retention."""
+        parser.add_argument("--months-ahead", type=int, default=None, help="Number of months to create ahead.")
+        parser.add_argument(
+            "--retention-months", type=int, default=None, help="Detach partitions older than these months."
+        )
+
+    def handle(self, *args: Any, **options: Dict[str, Any]) -> None:
+        """Manage partitions and print what has changed."""
+        try:
+            if not RentPartitionService.is_partitioned():
+                raise CommandError("Rent history is not partitioned, run migrations on PostgreSQL first.")
+            created_partition_names: List[str] = RentPartitionService.create_future_partitions(
+                months_ahead=options["months_ahead"]
+            )
+            detached_partition_names: List[str] = RentPartitionService.detach_expired_partitions(
+                retention_months=options["retention_months"]
+            )
+        except NotSupportedError as error:
+            raise CommandError(str(error)) from error
+        for partition_name in detached_partition_names:
+            self.stdout.write(f"Detached {partition_name}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {len(created_partition_names)} and detached {len(detached_partition_names)} partitions."
+            )
+        )
@@ -0,0 +1,22 @@
+"""Management command for marking late rents as overdue."""
+
+from typing import Any, Dict
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from rental_management.services.overdue_rent_service import OverdueRentService
+
+
+class Command(BaseCommand):
+    """Mark every in progress rent kept longer than the due days as overdue, e.g. from a cron job."""
+
+    help = "Mark in progress rents kept longer than the due days as overdue in chunks."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add option for number of rents marked by each update."""
+        parser.add_argument("--chunk-size", type=int, default=None, help="Number of rents marked by each update.")
+
+    def handle(self, *args: Any, **options: Dict[str, Any]) -> None:
+        """Sweep overdue rents and print the number of marked rents."""
+        marked_count: int = OverdueRentService.mark_overdue_rents(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Marked {marked_count} rents as overdue."))
@@ -0,0 +1,33 @@
+"""Management command for rebuilding user rent account summaries."""
+
+from typing import Any, Dict, Tuple
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from rental_management.services.account_summary_service import AccountSummaryDelta, AccountSummaryService
+
+
+class Command(BaseCommand):
+    """Rebuild user account summaries from the rent history and report drift from the maintained summaries."""
+
+    help = "Rebuild user rent account summaries from rent history in one aggregate pass and report drift."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add option for only reporting drift without changing the summaries."""
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only report drift without rebuilding the account summaries."
+        )
+
+    def handle(self, *args: Any, **options: Dict[str, Any]) -> None:
+        """Rebuild the account summaries and print every drifted summary."""
+        drifted_summaries: Dict[int, Tuple[AccountSummaryDelta, AccountSummaryDelta]] = (
+            AccountSummaryService.rebuild_account_summaries(dry_run=options["dry_run"])
+        )
+        for user_id, (stored_summary, expected_summary) in sorted(drifted_summaries.items()):
+            self.stdout.write(f"Drifted summary of user {user_id}: {stored_summary} expected {expected_summary}")
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"Found {len(drifted_summaries)} drifted account summaries."))
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"Rebuilt account summaries and fixed {len(drifted_summaries)} drifts.")
+            )
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rental_management', '0007_alter_renthistorymodel_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='renthistorymodel',
+            index=models.Index(
+                condition=models.Q(('status', 'UNPAID')), fields=['user_id'], name='unpaid_rent_user_idx'
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='renthistorymodel',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('status__in', ['IN_PROGRESS', 'OVERDUE'])),
+                fields=('book_id',),
+                name='unique_active_rent_per_book',
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_book_current_rents(apps, schema_editor):
+    Book = apps.get_model('rental_management', 'Book')
+    RentHistoryModel = apps.get_model('rental_management', 'RentHistoryModel')
+    active_rents = RentHistoryModel.objects.filter(book_id=OuterRef('pk'), status__in=['IN_PROGRESS', 'OVERDUE'])
+    Book.objects.update(current_rent=Subquery(active_rents.order_by().values('pk')[:1]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rental_management', '0008_renthistorymodel_unique_active_rent_per_book'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='current_rent',
+            field=models.OneToOneField(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='current_book',
+                to='rental_management.renthistorymodel',
+            ),
+        ),
+        migrations.RunPython(populate_book_current_rents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:57
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def populate_user_account_summaries(apps, schema_editor):
+    RentHistoryModel = apps.get_model('rental_management', 'RentHistoryModel')
+    UserAccountSummary = apps.get_model('rental_management', 'UserAccountSummary')
+    unpaid_condition = Q(status='UNPAID')
+    UserAccountSummary.objects.bulk_create(
+        [
+            UserAccountSummary(
+                user_id_id=user_id, unpaid_count=unpaid_count, unpaid_total=unpaid_total, active_rentals=active_rentals
+            )
+            for user_id, unpaid_count, unpaid_total, active_rentals in (
+                RentHistoryModel.objects.filter(user_id__isnull=False)
+                .order_by()
+                .values('user_id')
+                .annotate(
+                    unpaid_count=Count('rent_id', filter=unpaid_condition),
+                    unpaid_total=Sum('late_return_fee', filter=unpaid_condition, default=0),
+                    active_rentals=Count('rent_id', filter=Q(status__in=['IN_PROGRESS', 'OVERDUE'])),
+                )
+                .values_list('user_id', 'unpaid_count', 'unpaid_total', 'active_rentals')
+            )
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rental_management', '0009_book_current_rent'),
+        ('user_management', '0009_alter_user_last_login'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserAccountSummary',
+            fields=[
+                (
+                    'user_id',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='account_summary',
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ('unpaid_count', models.IntegerField(default=0)),
+                ('unpaid_total', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('active_rentals', models.IntegerField(default=0)),
+                ('updated_date', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(populate_user_account_summaries, migrations.RunPython.noop),
+    ]
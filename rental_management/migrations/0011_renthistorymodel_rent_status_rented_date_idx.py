@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rental_management', '0010_useraccountsummary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='renthistorymodel',
+            index=models.Index(fields=['status', 'rented_date'], name='rent_status_rented_date_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rental_management', '0012_rent_rented_date_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='renthistorymodel',
+            name='rent_rented_date_idx',
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['created_date', 'book_id'], name='book_created_date_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='renthistorymodel',
+            index=models.Index(fields=['rented_date', 'rent_id'], name='rent_rented_date_id_idx'),
+        ),
+    ]
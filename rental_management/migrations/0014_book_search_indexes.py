@@ -0,0 +1,41 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+def get_book_search_indexes():
+    return [
+        GinIndex(
+            SearchVector('name', config='simple', weight='A') + SearchVector('author', config='simple', weight='B'),
+            name='book_search_vector_idx',
+        ),
+        GinIndex(fields=['name'], name='book_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        GinIndex(fields=['author'], name='book_author_trgm_idx', opclasses=['gin_trgm_ops']),
+    ]
+
+
+def create_book_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        Book = apps.get_model('rental_management', 'Book')
+        for index in get_book_search_indexes():
+            schema_editor.add_index(Book, index)
+
+
+def drop_book_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        Book = apps.get_model('rental_management', 'Book')
+        for index in get_book_search_indexes():
+            schema_editor.remove_index(Book, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rental_management', '0013_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_book_search_indexes, drop_book_search_indexes),
+    ]
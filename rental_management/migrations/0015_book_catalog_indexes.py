@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rental_management', '0014_book_search_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['name', 'book_id'], name='book_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['status', 'created_date', 'book_id'], name='book_status_created_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['status', 'name', 'book_id'], name='book_status_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['author', 'created_date', 'book_id'], name='book_author_created_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booktagbinding',
+            index=models.Index(fields=['tag_id', 'book_id'], name='book_tag_tag_book_idx'),
+        ),
+    ]
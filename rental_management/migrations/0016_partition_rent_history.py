@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def partition_rent_history(apps, schema_editor):
+    # Rent ids stay unique from their sequence, so the model keeps the rent id as primary key while the partitioned
+    # table keys rents by rent id with rent date.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    from rental_management.services.rent_partition_service import RentPartitionService
+
+    if not RentPartitionService.is_partitioned():
+        RentPartitionService.convert_to_partitioned_table()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rental_management', '0015_book_catalog_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='renthistorymodel',
+            name='unique_active_rent_per_book',
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='current_rent',
+            field=models.OneToOneField(
+                blank=True,
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='current_book',
+                to='rental_management.renthistorymodel',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='renthistorymodel',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('status__in', ['IN_PROGRESS', 'OVERDUE'])),
+                fields=('book_id', 'rented_date'),
+                name='unique_active_rent_per_book_date',
+            ),
+        ),
+        migrations.RunPython(partition_rent_history),
+    ]
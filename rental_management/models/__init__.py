@@ -5,5 +5,6 @@ from rental_management.models.book_review_model import BookReview
 from rental_management.models.book_tag_binding_model import BookTagBinding
 from rental_management.models.rent_history_model import RentHistoryModel
 from rental_management.models.tag_model import Tag
+from rental_management.models.user_account_summary_model import UserAccountSummary
 
-__all__ = ["Book", "BookReview", "BookTagBinding", "Tag", "RentHistoryModel"]
+__all__ = ["Book", "BookReview", "BookTagBinding", "Tag", "RentHistoryModel", "UserAccountSummary"]
@@ -15,8 +15,24 @@ class Book(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
     status = models.CharField(max_length=20, choices=BookStatusType.choices, default=BookStatusType.AVAILABLE)
     author = models.CharField(max_length=255, null=False, blank=False)
+    current_rent = models.OneToOneField(
+        "rental_management.RentHistoryModel",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="current_book",
+        # Partitioned rent history has no unique rent id to reference, so deleted rents are only cleared by the ORM
+        db_constraint=False,
+    )
 
     class Meta:
-        """Set up default ordering on query book model."""
+        """Set up default ordering on query book model and indexes of catalog filters and orderings."""
 
         ordering = ["-created_date"]
+        indexes = [
+            models.Index(fields=["created_date", "book_id"], name="book_created_date_id_idx"),
+            models.Index(fields=["name", "book_id"], name="book_name_id_idx"),
+            models.Index(fields=["status", "created_date", "book_id"], name="book_status_created_date_idx"),
+            models.Index(fields=["status", "name", "book_id"], name="book_status_name_idx"),
+            models.Index(fields=["author", "created_date", "book_id"], name="book_author_created_date_idx"),
+        ]
@@ -15,7 +15,8 @@ class BookTagBinding(models.Model):
     created_date = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        """Set up unique constraint for tag binding to prevent dupliate tag assignment and default ordering."""
+        """Set up unique constraint against duplicate tag assignment, default ordering and index of books by tag."""
 
         constraints = [models.UniqueConstraint(fields=['book_id', 'tag_id'], name='unique_tag_per_book_record')]
         ordering = ["-created_date"]
+        indexes = [models.Index(fields=["tag_id", "book_id"], name="book_tag_tag_book_idx")]
@@ -1,7 +1,9 @@
 """Model for recording book rent history of the store."""
 
+from typing import Any, Dict
+
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import models, transaction
 
 from rental_management.enums.rent_status_type import RentStatusType
 from rental_management.models.book_model import Book
@@ -26,6 +28,30 @@ class RentHistoryModel(models.Model):
     )
 
     class Meta:
-        """Set up default ordering on query rent history review model."""
+        """Set up default ordering, active rent lookup constraint and indexes of rent lookups.
+
+        Unique indexes of the table partitioned by rent date must contain the rent date, so the database only rejects
+        two active rents of a book with the same rent date, and rent flows lock or claim the book to keep a single
+        active rent per book.
+        """
 
         ordering = ["-rented_date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["book_id", "rented_date"],
+                condition=models.Q(status__in=[RentStatusType.IN_PROGRESS, RentStatusType.OVERDUE]),
+                name="unique_active_rent_per_book_date",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["user_id"], condition=models.Q(status=RentStatusType.UNPAID), name="unpaid_rent_user_idx"
+            ),
+            models.Index(fields=["status", "rented_date"], name="rent_status_rented_date_idx"),
+            models.Index(fields=["rented_date", "rent_id"], name="rent_rented_date_id_idx"),
+        ]
+
+    def save(self, *args: Any, **kwargs: Dict[str, Any]) -> None:
+        """Save the rent in a transaction, which keeps its previous row locked until the account summary is updated."""
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
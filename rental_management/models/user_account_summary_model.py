@@ -0,0 +1,19 @@
+"""User account summary model definition for rental service system."""
+
+from django.db import models
+
+from user_management.models.user_model import User
+
+
+class UserAccountSummary(models.Model):
+    """Model for keeping denormalized rent counters and outstanding balance of a user.
+
+    Rows are maintained incrementally by rent, return and fee settlement operations, so checkout eligibility and the
+    account balance of a user are a single primary key read instead of an aggregate over the rent history.
+    """
+
+    user_id = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="account_summary")
+    unpaid_count = models.IntegerField(default=0)
+    unpaid_total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    active_rentals = models.IntegerField(default=0)
+    updated_date = models.DateTimeField(auto_now=True)
@@ -0,0 +1,29 @@
+"""API serializers for query parameters and suggestions of book autocomplete."""
+
+from django.conf import settings
+from rest_framework import serializers
+
+MAX_BOOK_AUTOCOMPLETE_PREFIX_LENGTH = 100
+
+
+class BookAutocompleteQuerySerializer(serializers.Serializer):
+    """Serializer for validating the typed prefix and number of suggestions of book autocomplete."""
+
+    q = serializers.CharField(
+        max_length=MAX_BOOK_AUTOCOMPLETE_PREFIX_LENGTH, help_text="Prefix of a word in book name or author."
+    )
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=settings.BOOK_AUTOCOMPLETE_MAX_SUGGESTIONS,
+        default=settings.BOOK_AUTOCOMPLETE_MAX_SUGGESTIONS,
+        help_text="Number of suggestions.",
+    )
+
+
+class BookSuggestionSerializer(serializers.Serializer):
+    """Serializer for a book suggested by autocomplete with its number of rents."""
+
+    book_id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    author = serializers.CharField(read_only=True)
+    popularity = serializers.IntegerField(read_only=True, help_text="Number of rents of the book.")
@@ -0,0 +1,25 @@
+"""API serializers for input and output of bulk book return."""
+
+from rest_framework import serializers
+
+from rental_management.enums.rent_status_type import RentStatusType
+from rental_management.enums.return_outcome_type import ReturnOutcomeType
+
+MAX_BULK_RETURN_BOOK_COUNT = 1000
+
+
+class BookBulkReturnSerializer(serializers.Serializer):
+    """Serializer for validating the list of returned book ids."""
+
+    book_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=MAX_BULK_RETURN_BOOK_COUNT
+    )
+
+
+class BookReturnResultSerializer(serializers.Serializer):
+    """Serializer for the return outcome of each book."""
+
+    book_id = serializers.IntegerField()
+    outcome = serializers.ChoiceField(choices=ReturnOutcomeType.choices)
+    rent_status = serializers.ChoiceField(choices=RentStatusType.choices, allow_null=True)
+    late_return_fee = serializers.DecimalField(max_digits=10, decimal_places=2, allow_null=True)
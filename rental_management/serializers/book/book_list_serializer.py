@@ -0,0 +1,47 @@
+"""API serializer for query parameters of book catalog listing."""
+
+from typing import Any, Dict, List
+
+from rest_framework import serializers
+
+from rental_management.enums.book_status_type import BookStatusType
+from rental_management.services.book_catalog_service import BOOK_LIST_ORDERINGS, DEFAULT_BOOK_LIST_ORDERING
+
+MAX_BOOK_LIST_TAG_COUNT = 20
+UNKNOWN_QUERY_PARAM_DETAIL = "Unknown query parameter."
+
+
+class BookListQuerySerializer(serializers.Serializer):
+    """Serializer for validating the allow-listed filters and ordering of book catalog listing.
+
+    Query parameters other than the fields are rejected, except the extra query parameters given in the context.
+    """
+
+    status = serializers.ChoiceField(choices=BookStatusType.choices, required=False, help_text="Book status.")
+    author = serializers.CharField(max_length=255, required=False, help_text="Exact author name.")
+    tag_id = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=MAX_BOOK_LIST_TAG_COUNT,
+        help_text="Tag id, repeated to list books with any of the tags.",
+    )
+    created_after = serializers.DateTimeField(required=False, help_text="Books created at or after this date.")
+    created_before = serializers.DateTimeField(required=False, help_text="Books created before this date.")
+    ordering = serializers.ChoiceField(
+        choices=list(BOOK_LIST_ORDERINGS), default=DEFAULT_BOOK_LIST_ORDERING, help_text="Order of listed books."
+    )
+
+    def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        """Check that every query parameter is allowed and that the creation date range is not empty."""
+        allowed_query_params: List[str] = [*self.fields, *self.context.get("extra_query_params", [])]
+        unknown_query_params: List[str] = sorted(
+            query_param for query_param in self.initial_data if query_param not in allowed_query_params
+        )
+        if unknown_query_params:
+            raise serializers.ValidationError(
+                {query_param: UNKNOWN_QUERY_PARAM_DETAIL for query_param in unknown_query_params}
+            )
+        if "created_after" in attrs and "created_before" in attrs and attrs["created_after"] >= attrs["created_before"]:
+            raise serializers.ValidationError({"created_before": "Must be later than created_after."})
+        return attrs
@@ -0,0 +1,13 @@
+"""API serializer for query parameters of book search."""
+
+from rest_framework import serializers
+
+MAX_BOOK_SEARCH_TEXT_LENGTH = 100
+
+
+class BookSearchQuerySerializer(serializers.Serializer):
+    """Serializer for validating the search text of book search."""
+
+    q = serializers.CharField(
+        max_length=MAX_BOOK_SEARCH_TEXT_LENGTH, help_text="Text searched in book name and author."
+    )
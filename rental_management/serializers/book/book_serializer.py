@@ -1,14 +1,47 @@
 """API model serializer for input and output of book representation."""
 
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
+from rest_framework.request import Request
 
 from rental_management.models.book_model import Book
+from rental_management.models.rent_history_model import RentHistoryModel
+
+EXPAND_QUERY_PARAM = "expand"
+CURRENT_RENT_EXPAND = "current_rent"
+
+
+class BookCurrentRentSerializer(serializers.ModelSerializer):
+    """Model serializer for the active rent of a book with its renter and due date."""
+
+    username = serializers.CharField(source="user_id.username", read_only=True, default=None)
+    due_date = serializers.SerializerMethodField()
+
+    class Meta:
+        """Set up fields for serializing active rent of book."""
+
+        fields = ["rent_id", "user_id", "username", "rented_date", "due_date", "status"]
+        model = RentHistoryModel
+        read_only_fields = fields
+
+    @extend_schema_field(OpenApiTypes.DATETIME)
+    def get_due_date(self, rent_record: RentHistoryModel) -> str:
+        """Get the date when the rented book should be returned without late return fee."""
+        return serializers.DateTimeField().to_representation(
+            rent_record.rented_date + timedelta(days=settings.RENT_DUE_DAYS)
+        )
 
 
 class BookSerializer(serializers.ModelSerializer):
     """Model serializer for book CRUD operation.
 
-    Validating input and serialize output for book related endpoints.
+    Validating input and serialize output for book related endpoints. The current rent is maintained by rent and
+    return operations, and it is expanded into its renter and due date with `?expand=current_rent`.
     """
 
     class Meta:
@@ -16,3 +49,18 @@ class BookSerializer(serializers.ModelSerializer):
 
         fields = "__all__"
         model = Book
+        read_only_fields = ["current_rent"]
+
+    def get_fields(self) -> Dict[str, Any]:
+        """Replace current rent id with the expanded current rent when requested."""
+        fields: Dict[str, Any] = super().get_fields()
+        if self.is_current_rent_expanded(self.context.get("request")):
+            fields["current_rent"] = BookCurrentRentSerializer(read_only=True)
+        return fields
+
+    @staticmethod
+    def is_current_rent_expanded(request: Optional[Request]) -> bool:
+        """Check if the request asks for expanding current rent of books."""
+        if request is None:
+            return False
+        return CURRENT_RENT_EXPAND in request.query_params.get(EXPAND_QUERY_PARAM, "").split(",")
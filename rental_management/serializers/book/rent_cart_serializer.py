@@ -0,0 +1,18 @@
+"""API serializer for input of multi-book rent cart checkout."""
+
+from rest_framework import serializers
+
+from user_management.models.user_model import User
+
+MAX_RENT_CART_BOOK_COUNT = 50
+
+
+class RentCartSerializer(serializers.Serializer):
+    """Serializer for validating the books rented together to one user."""
+
+    user_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), required=True)
+    book_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=MAX_RENT_CART_BOOK_COUNT
+    )
+    rented_date = serializers.DateTimeField()
+    created_by = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), required=False, allow_null=True)
@@ -1,12 +1,16 @@
 """API model serializer for input and output of book rent record representation."""
 
-from django.db.models import Q
+from typing import Any, Dict
+
+from django.db import IntegrityError, transaction
+from django.db.models import Case, F, Value, When
 from rest_framework import serializers
 
 from rental_management.enums.book_status_type import BookStatusType
-from rental_management.enums.rent_status_type import RentStatusType
+from rental_management.enums.rent_status_type import ACTIVE_RENT_STATUSES
 from rental_management.models.book_model import Book
 from rental_management.models.rent_history_model import RentHistoryModel
+from rental_management.services.rent_service import BOOK_NOT_AVAILABLE_DETAIL
 from user_management.models.user_model import User
 
 
@@ -23,13 +27,60 @@ class RentHistorySerializer(serializers.ModelSerializer):
 
         fields = "__all__"
         model = RentHistoryModel
+        # Single active rent per book is enforced by rent service and update instead of a validator query.
+        validators = []
 
     def validate_book_id(self, validating_book: Book) -> Book:
-        """Validate book from book status if the book is currently rented by other users."""
-        book_id: int = validating_book.book_id
+        """Validate book from book status if the book is currently rented by other users.
+
+        Renting is guarded by the conditional book claim of rent service, so this is only an early check on the
+        already loaded book.
+        """
+        if validating_book.status != BookStatusType.AVAILABLE.value:
+            raise serializers.ValidationError(BOOK_NOT_AVAILABLE_DETAIL)
+        return validating_book
+
+    def update(self, instance: RentHistoryModel, validated_data: Dict[str, Any]) -> RentHistoryModel:
+        """Update rent record and keep a single active rent per book and the current rent of books in step.
+
+        The book of an active rent is locked and checked for another active rent before the update, since the database
+        constraint only covers active rents with the same rent date. A book whose current rent is no longer active, or
+        has moved to another book, is freed like a return does, and the book of an active rent is pointed at it.
+        """
+        try:
+            with transaction.atomic():
+                if validated_data.get("status", instance.status) in ACTIVE_RENT_STATUSES:
+                    self._lock_book_without_other_active_rent(validated_data.get("book_id", instance.book_id), instance)
+                updated_rent: RentHistoryModel = super().update(instance, validated_data)
+                released_books = Book.objects.filter(current_rent=updated_rent)
+                if updated_rent.status in ACTIVE_RENT_STATUSES:
+                    released_books = released_books.exclude(book_id=updated_rent.book_id_id)
+                released_books.update(
+                    current_rent=None,
+                    status=Case(
+                        When(status=BookStatusType.RENTED.value, then=Value(BookStatusType.AVAILABLE.value)),
+                        default=F("status"),
+                    ),
+                )
+                if updated_rent.status in ACTIVE_RENT_STATUSES:
+                    Book.objects.filter(book_id=updated_rent.book_id_id).update(
+                        current_rent=updated_rent,
+                        status=Case(
+                            When(status=BookStatusType.AVAILABLE.value, then=Value(BookStatusType.RENTED.value)),
+                            default=F("status"),
+                        ),
+                    )
+                return updated_rent
+        except IntegrityError:
+            raise serializers.ValidationError({"book_id": [BOOK_NOT_AVAILABLE_DETAIL]}) from None
+
+    @staticmethod
+    def _lock_book_without_other_active_rent(book: Book, rent_record: RentHistoryModel) -> None:
+        """Lock the book row and reject the book if it has an active rent other than the given rent."""
+        list(Book.objects.select_for_update().filter(book_id=book.book_id))
         if (
-            validating_book.status != BookStatusType.AVAILABLE.value
-            or RentHistoryModel.objects.filter(Q(book_id=book_id) & ~Q(status=RentStatusType.COMPLETED.value)).exists()
+            RentHistoryModel.objects.filter(book_id=book, status__in=ACTIVE_RENT_STATUSES)
+            .exclude(rent_id=rent_record.rent_id)
+            .exists()
         ):
-            raise serializers.ValidationError("The given book ID is already rented.")
-        return validating_book
+            raise serializers.ValidationError({"book_id": [BOOK_NOT_AVAILABLE_DETAIL]})
@@ -0,0 +1,16 @@
+"""API model serializer for output of user rent account summary."""
+
+from rest_framework import serializers
+
+from rental_management.models.user_account_summary_model import UserAccountSummary
+
+
+class UserAccountSummarySerializer(serializers.ModelSerializer):
+    """Model serializer for the rent counters and outstanding balance of a user."""
+
+    class Meta:
+        """Set up fields for serializing user account summary model."""
+
+        fields = ["user_id", "unpaid_count", "unpaid_total", "active_rentals", "updated_date"]
+        model = UserAccountSummary
+        read_only_fields = fields
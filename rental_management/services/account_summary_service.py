@@ -0,0 +1,268 @@
+"""Utility service for maintaining and reading per-user rent account summaries."""
+
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, Count, DecimalField, Exists, F, IntegerField, Q, QuerySet, Sum, Value, When
+
+from job_scheduler.services.task_queue_service import TaskQueueService
+from rental_management.enums.rent_status_type import ACTIVE_RENT_STATUSES, RentStatusType
+from rental_management.models.rent_history_model import RentHistoryModel
+from rental_management.models.user_account_summary_model import UserAccountSummary
+from user_management.models.user_model import User
+
+REFRESH_ACCOUNT_SUMMARIES_TASK = "refresh_user_account_summaries"
+
+
+class AccountSummaryDelta(NamedTuple):
+    """Change of the counters and outstanding balance of one user account summary."""
+
+    unpaid_count: int = 0
+    unpaid_total: Decimal = Decimal(0)
+    active_rentals: int = 0
+
+    def __add__(self, other: Any) -> "AccountSummaryDelta":
+        """Combine two changes of the same account summary."""
+        return AccountSummaryDelta(
+            self.unpaid_count + other.unpaid_count,
+            self.unpaid_total + other.unpaid_total,
+            self.active_rentals + other.active_rentals,
+        )
+
+    def __neg__(self) -> "AccountSummaryDelta":
+        """Get the change which reverts this change."""
+        return AccountSummaryDelta(-self.unpaid_count, -self.unpaid_total, -self.active_rentals)
+
+
+class AccountSummaryService:
+    """Function service to keep account summaries of users in step with their rent records.
+
+    Every flow changing a rent record applies the difference between the contribution of the rent before and after
+    the change, so the summary is updated with a single update statement instead of being recomputed. Changes which
+    only move active rental counts are deferred to a queued task which refreshes the summaries after the rent change
+    commits. The summary can be rebuilt from the rent history with one aggregate query per chunk of users when it has
+    drifted.
+    """
+
+    @classmethod
+    def has_unpaid_rent(cls, user_id: Any) -> bool:
+        """Check if the user has any unpaid rent with a primary key read of the account summary."""
+        return cls._unpaid_summaries(user_id).exists()
+
+    @classmethod
+    def unpaid_rent_condition(cls, user_id: Any) -> Exists:
+        """Build condition on whether the user has any unpaid rent from the account summary."""
+        return Exists(cls._unpaid_summaries(user_id))
+
+    @staticmethod
+    def get_rent_contribution(
+        user_id: Optional[int], status: Optional[str], late_return_fee: Optional[Decimal]
+    ) -> Dict[int, AccountSummaryDelta]:
+        """Get how a rent record with the given user, status and fee counts toward the account summary of its user."""
+        if user_id is None or status is None:
+            return {}
+        if status in ACTIVE_RENT_STATUSES:
+            return {user_id: AccountSummaryDelta(active_rentals=1)}
+        if status == RentStatusType.UNPAID.value:
+            return {user_id: AccountSummaryDelta(unpaid_count=1, unpaid_total=Decimal(late_return_fee or 0))}
+        return {}
+
+    @classmethod
+    def get_rents_contribution(
+        cls, rents: Iterable[Tuple[Optional[int], Optional[str], Optional[Decimal]]]
+    ) -> Dict[int, AccountSummaryDelta]:
+        """Get how rent records given as (user_id, status, late_return_fee) count toward account summaries."""
+        contribution: Dict[int, AccountSummaryDelta] = {}
+        for rent in rents:
+            for user_id, delta in cls.get_rent_contribution(*rent).items():
+                contribution[user_id] = contribution.get(user_id, AccountSummaryDelta()) + delta
+        return contribution
+
+    @classmethod
+    def apply_rent_change(
+        cls, previous_contribution: Dict[int, AccountSummaryDelta], contribution: Dict[int, AccountSummaryDelta]
+    ) -> None:
+        """Apply the difference between contributions of a rent record before and after it has changed."""
+        deltas: Dict[int, AccountSummaryDelta] = dict(contribution)
+        for user_id, previous_delta in previous_contribution.items():
+            deltas[user_id] = deltas.get(user_id, AccountSummaryDelta()) + -previous_delta
+        cls.record_deltas(deltas)
+
+    @classmethod
+    def record_deltas(cls, deltas: Dict[int, AccountSummaryDelta]) -> None:
+        """Apply changes which touch unpaid rents right away and defer changes which only move active rental counts.
+
+        Unpaid rents decide whether a user can rent, so their changes are applied in the transaction of the rent
+        change. Active rental counts are only displayed, so their summaries are refreshed by one queued task instead.
+        """
+        unpaid_deltas: Dict[int, AccountSummaryDelta] = {
+            user_id: delta for user_id, delta in deltas.items() if delta.unpaid_count or delta.unpaid_total
+        }
+        cls.apply_deltas(unpaid_deltas)
+        deferred_user_ids: List[int] = sorted(
+            user_id for user_id, delta in deltas.items() if delta.active_rentals and user_id not in unpaid_deltas
+        )
+        if deferred_user_ids:
+            TaskQueueService.enqueue(REFRESH_ACCOUNT_SUMMARIES_TASK, {"user_ids": deferred_user_ids})
+
+    @classmethod
+    def apply_deltas(cls, deltas: Dict[int, AccountSummaryDelta]) -> None:
+        """Apply changes to account summaries of many users with one update statement.
+
+        Summaries which do not exist yet are created first, so a user without a summary costs two more queries.
+        """
+        deltas = {user_id: delta for user_id, delta in deltas.items() if delta != AccountSummaryDelta()}
+        if not deltas:
+            return
+        updated_count: int = cls._update_summaries(deltas)
+        if updated_count == len(deltas):
+            return
+        existing_user_ids: Set[int] = set(
+            UserAccountSummary.objects.filter(user_id__in=list(deltas)).values_list("user_id", flat=True)
+        )
+        missing_deltas = {user_id: delta for user_id, delta in deltas.items() if user_id not in existing_user_ids}
+        UserAccountSummary.objects.bulk_create(
+            [UserAccountSummary(user_id_id=user_id) for user_id in missing_deltas], ignore_conflicts=True
+        )
+        cls._update_summaries(missing_deltas)
+
+    @classmethod
+    def refresh_account_summaries(cls, user_ids: List[int]) -> None:
+        """Recompute account summaries of the given users from their rent records.
+
+        Summaries are locked before rent records are read, so a rent change which commits during the refresh applies
+        its own change on top of the refreshed summary instead of being overwritten.
+        """
+        with transaction.atomic():
+            UserAccountSummary.objects.bulk_create(
+                [UserAccountSummary(user_id_id=user_id) for user_id in user_ids], ignore_conflicts=True
+            )
+            list(UserAccountSummary.objects.select_for_update().filter(user_id__in=user_ids).order_by("user_id"))
+            expected_summaries: Dict[int, AccountSummaryDelta] = cls.get_expected_account_summaries(user_ids)
+            UserAccountSummary.objects.bulk_create(
+                [
+                    UserAccountSummary(
+                        user_id_id=user_id, **expected_summaries.get(user_id, AccountSummaryDelta())._asdict()
+                    )
+                    for user_id in user_ids
+                ],
+                update_conflicts=True,
+                unique_fields=["user_id"],
+                update_fields=["unpaid_count", "unpaid_total", "active_rentals"],
+            )
+
+    @classmethod
+    def rebuild_account_summaries(
+        cls, dry_run: bool = False, chunk_size: Optional[int] = None
+    ) -> Dict[int, Tuple[AccountSummaryDelta, AccountSummaryDelta]]:
+        """Rebuild account summaries of every user from the rent history and report drifted summaries.
+
+        Users are walked in user id order in chunks of at most the configured chunk size, and each chunk is rebuilt
+        in its own transaction, so a rebuild only holds locks on the summaries of one chunk at a time. Return the
+        stored and the expected summary of every user whose summary has drifted.
+        """
+        chunk_size = chunk_size or settings.ACCOUNT_SUMMARY_REBUILD_CHUNK_SIZE
+        drifted_summaries: Dict[int, Tuple[AccountSummaryDelta, AccountSummaryDelta]] = {}
+        user_ids = User.objects.order_by("user_id").values_list("user_id", flat=True)
+        chunk_user_ids: List[int] = list(user_ids[:chunk_size])
+        while chunk_user_ids:
+            drifted_summaries.update(cls._rebuild_account_summaries_chunk(chunk_user_ids, dry_run))
+            if len(chunk_user_ids) < chunk_size:
+                break
+            chunk_user_ids = list(user_ids.filter(user_id__gt=chunk_user_ids[-1])[:chunk_size])
+        return drifted_summaries
+
+    @staticmethod
+    def get_expected_account_summaries(user_ids: Optional[Iterable[int]] = None) -> Dict[int, AccountSummaryDelta]:
+        """Compute account summaries from rent records grouped by user with a single aggregate query."""
+        rent_records = RentHistoryModel.objects.filter(user_id__isnull=False)
+        if user_ids is not None:
+            rent_records = rent_records.filter(user_id__in=user_ids)
+        unpaid_condition = Q(status=RentStatusType.UNPAID.value)
+        return {
+            user_id: AccountSummaryDelta(unpaid_count, unpaid_total, active_rentals)
+            for user_id, unpaid_count, unpaid_total, active_rentals in (
+                rent_records.order_by()
+                .values("user_id")
+                .annotate(
+                    unpaid_count=Count("rent_id", filter=unpaid_condition),
+                    unpaid_total=Sum("late_return_fee", filter=unpaid_condition, default=Decimal(0)),
+                    active_rentals=Count("rent_id", filter=Q(status__in=ACTIVE_RENT_STATUSES)),
+                )
+                .filter(Q(unpaid_count__gt=0) | Q(active_rentals__gt=0))
+                .values_list("user_id", "unpaid_count", "unpaid_total", "active_rentals")
+            )
+        }
+
+    @classmethod
+    def _rebuild_account_summaries_chunk(
+        cls, user_ids: List[int], dry_run: bool
+    ) -> Dict[int, Tuple[AccountSummaryDelta, AccountSummaryDelta]]:
+        """Rebuild account summaries of the given users and report their drifted summaries.
+
+        Summaries of the chunk are locked before rent records are read, like in a refresh, so a rent change which
+        commits during the rebuild applies its own change on top of the rebuilt summary instead of being overwritten.
+        """
+        with transaction.atomic():
+            stored_summaries: Dict[int, AccountSummaryDelta] = {
+                user_id: AccountSummaryDelta(unpaid_count, unpaid_total, active_rentals)
+                for user_id, unpaid_count, unpaid_total, active_rentals in (
+                    UserAccountSummary.objects.select_for_update()
+                    .filter(user_id__in=user_ids)
+                    .order_by("user_id")
+                    .values_list("user_id", "unpaid_count", "unpaid_total", "active_rentals")
+                )
+            }
+            expected_summaries: Dict[int, AccountSummaryDelta] = cls.get_expected_account_summaries(user_ids)
+            drifted_summaries: Dict[int, Tuple[AccountSummaryDelta, AccountSummaryDelta]] = {
+                user_id: (stored_summaries.get(user_id, AccountSummaryDelta()), expected_summary)
+                for user_id, expected_summary in expected_summaries.items()
+                if stored_summaries.get(user_id, AccountSummaryDelta()) != expected_summary
+            }
+            drifted_summaries.update(
+                {
+                    user_id: (stored_summary, AccountSummaryDelta())
+                    for user_id, stored_summary in stored_summaries.items()
+                    if user_id not in expected_summaries and stored_summary != AccountSummaryDelta()
+                }
+            )
+            if not dry_run and drifted_summaries:
+                UserAccountSummary.objects.bulk_create(
+                    [
+                        UserAccountSummary(user_id_id=user_id, **expected_summary._asdict())
+                        for user_id, (_, expected_summary) in drifted_summaries.items()
+                    ],
+                    update_conflicts=True,
+                    unique_fields=["user_id"],
+                    update_fields=["unpaid_count", "unpaid_total", "active_rentals"],
+                )
+        return drifted_summaries
+
+    @staticmethod
+    def _update_summaries(deltas: Dict[int, AccountSummaryDelta]) -> int:
+        """Add changes to existing account summaries with one update and return the number of updated summaries."""
+        field_deltas: Dict[str, Case] = {
+            field_name: Case(
+                *[
+                    When(user_id=user_id, then=Value(getattr(delta, field_name), output_field=output_field))
+                    for user_id, delta in deltas.items()
+                ],
+                default=Value(0, output_field=output_field),
+                output_field=output_field,
+            )
+            for field_name, output_field in (
+                ("unpaid_count", IntegerField()),
+                ("unpaid_total", DecimalField(max_digits=12, decimal_places=2)),
+                ("active_rentals", IntegerField()),
+            )
+        }
+        return UserAccountSummary.objects.filter(user_id__in=list(deltas)).update(
+            **{field_name: F(field_name) + field_delta for field_name, field_delta in field_deltas.items()}
+        )
+
+    @staticmethod
+    def _unpaid_summaries(user_id: Any) -> QuerySet:
+        """Get account summary of the user if it has any unpaid rent."""
+        return UserAccountSummary.objects.filter(user_id=user_id, unpaid_count__gt=0)
@@ -0,0 +1,360 @@
+"""Utility service for suggesting books by prefix of their name or author from a per-worker in-memory index."""
+
+import heapq
+import logging
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from typing import Collection, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from rental_management.models.book_model import Book
+from rental_management.models.rent_history_model import RentHistoryModel
+
+KEY_SEPARATOR = "\x00"
+FIELD_SEPARATOR = "\x1f"
+RECORD_SEPARATOR = "\x1e"
+# Prefixes up to this length match the widest key ranges, so their top books are computed when the index is built
+HEAD_PREFIX_LENGTH = 2
+NON_WORD_PATTERN = re.compile(r"[\W_]+")
+
+logger = logging.getLogger(__name__)
+
+
+class BookSuggestion(NamedTuple):
+    """Book suggested for a prefix with the number of its rents."""
+
+    book_id: int
+    name: str
+    author: str
+    popularity: int
+
+
+class ChangedBook(NamedTuple):
+    """Book changed in the worker since the index was built, which is None for a deleted book."""
+
+    change_sequence: int
+    suggestion: Optional[BookSuggestion]
+    normalized_texts: Tuple[str, ...] = ()
+
+
+class BookAutocompleteIndex:
+    """Immutable sorted array index of books by every word of their name and author, and the words after it.
+
+    Normalized names and authors of all books are concatenated into one key text, and the index is an array of offsets
+    of every word start in that text sorted by the text from the offset. Keys starting with a prefix are then one
+    contiguous range found by binary search, and multi-word prefixes match across words. Names and authors for display
+    are concatenated into a second text. Offsets, book ids and popularity live in typed arrays, so each word costs a
+    few bytes on top of the texts instead of a Python object per key.
+    """
+
+    def __init__(self, records: Iterable[Tuple[int, str, str, int]], max_suggestions: int) -> None:
+        """Build the index from book id, name, author and popularity of every book."""
+        self.max_suggestions = max_suggestions
+        self.book_ids = array("q")
+        self.popularities = array("Q")
+        self.display_offsets = array("I")
+        unsorted_key_offsets = array("I")
+        unsorted_key_books = array("I")
+        key_parts: List[str] = []
+        display_parts: List[str] = []
+        key_length: int = 0
+        display_length: int = 0
+        for position, (book_id, name, author, popularity) in enumerate(sorted(records, key=itemgetter(0))):
+            self.book_ids.append(book_id)
+            self.popularities.append(popularity)
+            self.display_offsets.append(display_length)
+            display_record: str = f"{name}{FIELD_SEPARATOR}{author}{RECORD_SEPARATOR}"
+            display_parts.append(display_record)
+            display_length += len(display_record)
+            for text in (name, author):
+                normalized_text: str = self.normalize_text(text)
+                if not normalized_text:
+                    continue
+                for word_start in self.get_word_starts(normalized_text):
+                    unsorted_key_offsets.append(key_length + word_start)
+                    unsorted_key_books.append(position)
+                key_parts.append(normalized_text + KEY_SEPARATOR)
+                key_length += len(normalized_text) + 1
+        self.key_text: str = "".join(key_parts)
+        self.display_text: str = "".join(display_parts)
+
+        key_order: List[int] = sorted(
+            range(len(unsorted_key_offsets)), key=lambda key: self._get_key(unsorted_key_offsets[key])
+        )
+        self.key_offsets = array("I", (unsorted_key_offsets[key] for key in key_order))
+        self.key_books = array("I", (unsorted_key_books[key] for key in key_order))
+        self.head_books: Dict[str, array] = self._build_head_books()
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Case fold the text and keep its words separated by single spaces."""
+        return NON_WORD_PATTERN.sub(" ", text.casefold()).strip()
+
+    @staticmethod
+    def get_word_starts(normalized_text: str) -> List[int]:
+        """Get offsets of every word start in a normalized text."""
+        return [0] + [offset + 1 for offset, character in enumerate(normalized_text) if character == " "]
+
+    @classmethod
+    def matches_prefix(cls, normalized_texts: Iterable[str], normalized_prefix: str) -> bool:
+        """Check if a word of the normalized name or author, with the words after it, starts with the prefix."""
+        return any(
+            normalized_text.startswith(normalized_prefix, word_start)
+            for normalized_text in normalized_texts
+            for word_start in cls.get_word_starts(normalized_text)
+        )
+
+    def __len__(self) -> int:
+        """Get number of indexed books."""
+        return len(self.book_ids)
+
+    def search(self, prefix: str, limit: int, excluded_book_ids: Collection[int] = ()) -> List[BookSuggestion]:
+        """Get the most popular books with a word of name or author starting with the prefix, newest first on ties."""
+        normalized_prefix: str = self.normalize_text(prefix)
+        if not normalized_prefix:
+            return []
+        head_books: Optional[array] = self.head_books.get(normalized_prefix)
+        if head_books is not None:
+            positions: List[int] = [
+                position for position in head_books if self.book_ids[position] not in excluded_book_ids
+            ]
+            if len(positions) >= limit or len(head_books) < self.max_suggestions:
+                return [self.get_suggestion(position) for position in positions[:limit]]
+
+        first_key, last_key = self._get_key_range(normalized_prefix)
+        matching_positions = set(self.key_books[first_key:last_key])
+        if excluded_book_ids:
+            matching_positions = {
+                position for position in matching_positions if self.book_ids[position] not in excluded_book_ids
+            }
+        return [self.get_suggestion(position) for position in self._get_top_positions(matching_positions, limit)]
+
+    def get_suggestion(self, position: int) -> BookSuggestion:
+        """Get indexed book at the position."""
+        display_offset: int = self.display_offsets[position]
+        name, author = self.display_text[
+            display_offset : self.display_text.index(RECORD_SEPARATOR, display_offset)
+        ].split(FIELD_SEPARATOR)
+        return BookSuggestion(self.book_ids[position], name, author, self.popularities[position])
+
+    def get_popularity(self, book_id: int) -> int:
+        """Get indexed popularity of a book, which is zero for books created after the index was built."""
+        position: int = bisect_left(self.book_ids, book_id)
+        if position < len(self.book_ids) and self.book_ids[position] == book_id:
+            return self.popularities[position]
+        return 0
+
+    def _get_key(self, key_offset: int) -> str:
+        """Get normalized text from the key offset to the end of its name or author."""
+        return self.key_text[key_offset : self.key_text.index(KEY_SEPARATOR, key_offset)]
+
+    def _get_top_positions(self, positions: Iterable[int], limit: int) -> List[int]:
+        """Get positions of the most popular books, newest first on ties."""
+        return heapq.nlargest(limit, positions, key=lambda position: (self.popularities[position], position))
+
+    def _get_key_range(self, prefix: str, first_key: int = 0) -> Tuple[int, int]:
+        """Get range of sorted keys starting with the prefix by binary search of keys truncated to its length."""
+
+        def get_key_prefix(key_offset: int) -> str:
+            """Get key truncated to the prefix length, which keeps the keys sorted."""
+            return self.key_text[key_offset : key_offset + len(prefix)]
+
+        first_key = bisect_left(self.key_offsets, prefix, lo=first_key, key=get_key_prefix)
+        return first_key, bisect_right(self.key_offsets, prefix, lo=first_key, key=get_key_prefix)
+
+    def _build_head_books(self) -> Dict[str, array]:
+        """Compute the most popular books of every prefix up to the head prefix length.
+
+        Keys sharing a prefix are contiguous, so each prefix is found by walking from one key range to the next.
+        """
+        head_books: Dict[str, array] = {}
+        for prefix_length in range(1, HEAD_PREFIX_LENGTH + 1):
+            first_key: int = 0
+            while first_key < len(self.key_offsets):
+                key_offset: int = self.key_offsets[first_key]
+                prefix: str = self.key_text[key_offset : key_offset + prefix_length]
+                first_key, last_key = self._get_key_range(prefix, first_key)
+                if KEY_SEPARATOR not in prefix:
+                    head_books[prefix] = array(
+                        "I", self._get_top_positions(set(self.key_books[first_key:last_key]), self.max_suggestions)
+                    )
+                first_key = last_key
+        return head_books
+
+
+class BookAutocompleteService:
+    """Function service to suggest books for a search-as-you-type prefix without querying the database.
+
+    Each worker builds its own index from all books with their rent count as popularity on first use, and rebuilds it
+    in a background thread once the rebuild interval has passed, while the previous index keeps answering until the
+    new one is swapped in. Books saved or deleted through the ORM in the worker are kept in a small overlay of changed
+    books, normalized once when recorded, which replaces their indexed entries in suggestions, so the worker suggests
+    its own changes right after they commit. An overlay which grows past its limit makes the index due for rebuild.
+    Changes made by other workers, bulk updates and new rents are picked up by the next rebuild, since a scheduled job
+    would only rebuild the index of one worker.
+    """
+
+    _lock = threading.Lock()
+    _rebuild_lock = threading.Lock()
+    _index: Optional[BookAutocompleteIndex] = None
+    _changed_books: Dict[int, ChangedBook] = {}
+    _change_sequence: int = 0
+    _next_rebuild_time: float = 0.0
+    _rebuild_thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def suggest_books(cls, prefix: str, limit: int) -> List[BookSuggestion]:
+        """Get the most popular books with a word of name or author starting with the prefix."""
+        if cls._index is None:
+            cls._build_first_index()
+        elif time.monotonic() >= cls._next_rebuild_time:
+            cls._start_background_rebuild()
+        with cls._lock:
+            index: BookAutocompleteIndex = cls._index
+            changed_books: Dict[int, ChangedBook] = cls._changed_books
+        suggestions: List[BookSuggestion] = index.search(prefix, limit, changed_books.keys())
+        normalized_prefix: str = BookAutocompleteIndex.normalize_text(prefix)
+        if changed_books and normalized_prefix:
+            suggestions.extend(
+                changed_book.suggestion
+                for changed_book in changed_books.values()
+                if changed_book.suggestion is not None
+                and BookAutocompleteIndex.matches_prefix(changed_book.normalized_texts, normalized_prefix)
+            )
+            suggestions = heapq.nlargest(
+                limit, suggestions, key=lambda suggestion: (suggestion.popularity, suggestion.book_id)
+            )
+        return suggestions
+
+    @classmethod
+    def rebuild_index(cls) -> BookAutocompleteIndex:
+        """Build the worker index from all books, waiting for a rebuild running in another thread to finish first."""
+        with cls._rebuild_lock:
+            return cls._build_index()
+
+    @classmethod
+    def record_book_saved(cls, book_id: int, name: str, author: str) -> None:
+        """Suggest the book with its saved name and author until the index is rebuilt."""
+        with cls._lock:
+            popularity: int = cls._index.get_popularity(book_id) if cls._index is not None else 0
+            cls._record_change(
+                book_id,
+                BookSuggestion(book_id, name, author, popularity),
+                (BookAutocompleteIndex.normalize_text(name), BookAutocompleteIndex.normalize_text(author)),
+            )
+
+    @classmethod
+    def record_book_deleted(cls, book_id: int) -> None:
+        """Stop suggesting the deleted book."""
+        with cls._lock:
+            cls._record_change(book_id, None)
+
+    @classmethod
+    def reset_index(cls) -> None:
+        """Drop the worker index so that it is rebuilt on next suggestion, after a running rebuild has finished."""
+        with cls._rebuild_lock, cls._lock:
+            cls._index = None
+            cls._changed_books = {}
+            cls._next_rebuild_time = 0.0
+
+    @classmethod
+    def wait_for_rebuild(cls) -> None:
+        """Wait until the background rebuild which is currently running, if any, has swapped in its index."""
+        rebuild_thread: Optional[threading.Thread] = cls._rebuild_thread
+        if rebuild_thread is not None:
+            rebuild_thread.join()
+
+    @classmethod
+    def _build_first_index(cls) -> None:
+        """Build the missing index, which is the only build that makes requests wait."""
+        with cls._rebuild_lock:
+            if cls._index is None:
+                cls._build_index()
+
+    @classmethod
+    def _start_background_rebuild(cls) -> None:
+        """Rebuild the index in a background thread unless a rebuild is already running.
+
+        The rebuild lock is taken here and released by the background thread once the new index is swapped in.
+        """
+        if not cls._rebuild_lock.acquire(blocking=False):
+            return
+        try:
+            cls._rebuild_thread = threading.Thread(
+                target=cls._rebuild_in_background, name="book-autocomplete-rebuild", daemon=True
+            )
+            cls._rebuild_thread.start()
+        except Exception:
+            cls._rebuild_lock.release()
+            raise
+
+    @classmethod
+    def _rebuild_in_background(cls) -> None:
+        """Rebuild the index, then release the rebuild lock and the database connections of the thread."""
+        try:
+            cls._build_index()
+        except Exception:
+            logger.exception("Book autocomplete index rebuild failed")
+        finally:
+            connections.close_all()
+            cls._rebuild_lock.release()
+
+    @classmethod
+    def _build_index(cls) -> BookAutocompleteIndex:
+        """Build the index from all books with their rent count, while holding the rebuild lock.
+
+        Changes recorded before books are read are part of the new index and leave the overlay with the previous
+        index, while changes recorded meanwhile are kept in the overlay, so no committed change is lost.
+        """
+        with cls._lock:
+            rebuild_sequence: int = cls._change_sequence
+        popularity = (
+            RentHistoryModel.objects.filter(book_id=OuterRef("pk"))
+            .order_by()
+            .values("book_id")
+            .annotate(rent_count=Count("pk"))
+            .values("rent_count")
+        )
+        records = (
+            Book.objects.order_by()
+            .annotate(popularity=Coalesce(Subquery(popularity), 0))
+            .values_list("book_id", "name", "author", "popularity")
+            .iterator()
+        )
+        index = BookAutocompleteIndex(records, settings.BOOK_AUTOCOMPLETE_MAX_SUGGESTIONS)
+        with cls._lock:
+            cls._index = index
+            cls._changed_books = {
+                book_id: changed_book
+                for book_id, changed_book in cls._changed_books.items()
+                if changed_book.change_sequence > rebuild_sequence
+            }
+            cls._next_rebuild_time = time.monotonic() + settings.BOOK_AUTOCOMPLETE_REBUILD_SECONDS
+        return index
+
+    @classmethod
+    def _record_change(
+        cls, book_id: int, suggestion: Optional[BookSuggestion], normalized_texts: Tuple[str, ...] = ()
+    ) -> None:
+        """Put a changed book in a copy of the overlay with the next change sequence, while holding the lock.
+
+        The overlay is replaced instead of changed in place, so suggestions read it without copying. Workers which
+        have not built an index yet do not keep changes, since their first index reads them anyway.
+        """
+        if cls._index is None and not cls._rebuild_lock.locked():
+            return
+        cls._change_sequence += 1
+        cls._changed_books = {
+            **cls._changed_books,
+            book_id: ChangedBook(cls._change_sequence, suggestion, normalized_texts),
+        }
+        if len(cls._changed_books) > settings.BOOK_AUTOCOMPLETE_MAX_CHANGED_BOOKS:
+            cls._next_rebuild_time = 0.0
@@ -0,0 +1,43 @@
+"""Utility service for filtering and ordering the book catalog by allow-listed parameters."""
+
+from typing import Any, Dict, Tuple
+
+from django.db.models import QuerySet
+
+from rental_management.models.book_tag_binding_model import BookTagBinding
+
+# Every ordering ends with the book id, so books with the same name or creation date keep a stable order across pages
+BOOK_LIST_ORDERINGS: Dict[str, Tuple[str, str]] = {
+    "created_date": ("created_date", "book_id"),
+    "-created_date": ("-created_date", "-book_id"),
+    "name": ("name", "book_id"),
+    "-name": ("-name", "-book_id"),
+}
+DEFAULT_BOOK_LIST_ORDERING = "-created_date"
+
+
+class BookCatalogService:
+    """Function service to apply catalog filters and ordering to a book queryset.
+
+    Only filters and orderings backed by an index are offered. Status and author lead composite indexes followed by
+    the creation date, so an equality filter is served with its creation date range and ordering from one index, and
+    status is also paired with name ordering. Without those filters, name and creation date orderings have their own
+    indexes, and tag filters go through the index of tag bindings by tag.
+    """
+
+    @staticmethod
+    def filter_books(queryset: QuerySet, filters: Dict[str, Any]) -> QuerySet:
+        """Filter books by status, author, any of the tag ids and creation date range, then apply the ordering."""
+        if "status" in filters:
+            queryset = queryset.filter(status=filters["status"])
+        if "author" in filters:
+            queryset = queryset.filter(author=filters["author"])
+        if "tag_id" in filters:
+            queryset = queryset.filter(
+                book_id__in=BookTagBinding.objects.filter(tag_id__in=filters["tag_id"]).values("book_id")
+            )
+        if "created_after" in filters:
+            queryset = queryset.filter(created_date__gte=filters["created_after"])
+        if "created_before" in filters:
+            queryset = queryset.filter(created_date__lt=filters["created_before"])
+        return queryset.order_by(*BOOK_LIST_ORDERINGS[filters.get("ordering", DEFAULT_BOOK_LIST_ORDERING)])
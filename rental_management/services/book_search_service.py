@@ -0,0 +1,141 @@
+"""Utility service for searching books by name and author."""
+
+from typing import List, Optional
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity
+from django.db import NotSupportedError, connection, connections
+from django.db.models import F, FloatField, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Greatest
+
+from rental_management.models.book_model import Book
+
+BOOK_SEARCH_CONFIG = "simple"
+BOOK_SEARCH_FTS_TABLE = "rental_management_book_fts"
+TRIGRAM_LENGTH = 3
+
+
+class BookSearchService:
+    """Function service to find books whose name or author matches a search text, ranked by relevance.
+
+    On PostgreSQL, books are matched by full text search over name and author with the simple configuration, which
+    keeps romanized titles and names as written instead of stemming them, or by trigram word similarity of name or
+    author, which tolerates typos. Matching books are found through GIN indexes of the search vector and of trigrams
+    of both columns, and only matching books are ranked. On SQLite, books are matched through an FTS5 table with the
+    trigram tokenizer kept in step by triggers, where any trigram shared with the search text is a match ranked by
+    bm25. Both rank name matches above author matches. The FTS5 table is created after migrate instead of by a
+    migration, so databases created without running migrations get it as well.
+    """
+
+    @classmethod
+    def search_books(cls, search_text: str, queryset: Optional[QuerySet] = None) -> QuerySet:
+        """Get books matching the search text annotated with their rank and ordered by relevance."""
+        queryset = Book.objects.all() if queryset is None else queryset
+        if connection.vendor == "postgresql":
+            return cls._search_with_postgresql(search_text, queryset)
+        if connection.vendor == "sqlite":
+            return cls._search_with_sqlite(search_text, queryset)
+        raise NotSupportedError(f"Searching books is not supported on {connection.vendor} database.")
+
+    @staticmethod
+    def create_sqlite_search_table(using: str) -> bool:
+        """Create the FTS5 table of book name and author with triggers keeping it in step, if it does not exist yet.
+
+        The table is filled from existing books when it is created. Return whether the table has been created.
+        """
+        sqlite_connection = connections[using]
+        if sqlite_connection.vendor != "sqlite":
+            return False
+        book_table: str = Book._meta.db_table
+        with sqlite_connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [BOOK_SEARCH_FTS_TABLE])
+            if cursor.fetchone() is not None:
+                return False
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE {BOOK_SEARCH_FTS_TABLE} USING fts5("
+                f"name, author, content='{book_table}', content_rowid='book_id', tokenize='trigram')"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER {BOOK_SEARCH_FTS_TABLE}_insert AFTER INSERT ON {book_table} BEGIN "
+                f"INSERT INTO {BOOK_SEARCH_FTS_TABLE}(rowid, name, author) VALUES (new.book_id, new.name, new.author); "
+                "END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER {BOOK_SEARCH_FTS_TABLE}_delete AFTER DELETE ON {book_table} BEGIN "
+                f"INSERT INTO {BOOK_SEARCH_FTS_TABLE}({BOOK_SEARCH_FTS_TABLE}, rowid, name, author) "
+                "VALUES ('delete', old.book_id, old.name, old.author); END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER {BOOK_SEARCH_FTS_TABLE}_update AFTER UPDATE OF name, author ON {book_table} BEGIN "
+                f"INSERT INTO {BOOK_SEARCH_FTS_TABLE}({BOOK_SEARCH_FTS_TABLE}, rowid, name, author) "
+                "VALUES ('delete', old.book_id, old.name, old.author); "
+                f"INSERT INTO {BOOK_SEARCH_FTS_TABLE}(rowid, name, author) VALUES (new.book_id, new.name, new.author); "
+                "END"
+            )
+            cursor.execute(f"INSERT INTO {BOOK_SEARCH_FTS_TABLE}({BOOK_SEARCH_FTS_TABLE}) VALUES ('rebuild')")
+        return True
+
+    @staticmethod
+    def get_search_vector() -> SearchVector:
+        """Get search vector of book name weighted above author, which is the expression of its GIN index."""
+        return SearchVector("name", config=BOOK_SEARCH_CONFIG, weight="A") + SearchVector(
+            "author", config=BOOK_SEARCH_CONFIG, weight="B"
+        )
+
+    @staticmethod
+    def get_fts_trigram_query(search_text: str) -> str:
+        """Build FTS5 query matching any trigram of the words of the search text."""
+        trigrams: List[str] = list(
+            dict.fromkeys(
+                word[position : position + TRIGRAM_LENGTH]
+                for word in search_text.lower().split()
+                for position in range(len(word) - TRIGRAM_LENGTH + 1)
+            )
+        )
+        return " OR ".join('"' + trigram.replace('"', '""') + '"' for trigram in trigrams)
+
+    @classmethod
+    def _search_with_postgresql(cls, search_text: str, queryset: QuerySet) -> QuerySet:
+        """Search books with full text search and trigram word similarity."""
+        search_query = SearchQuery(search_text, config=BOOK_SEARCH_CONFIG, search_type="websearch")
+        return (
+            queryset.alias(search_vector=cls.get_search_vector())
+            .filter(
+                Q(search_vector=search_query)
+                | Q(name__trigram_word_similar=search_text)
+                | Q(author__trigram_word_similar=search_text)
+            )
+            .annotate(
+                rank=SearchRank(F("search_vector"), search_query)
+                + Greatest(TrigramWordSimilarity(search_text, "name"), TrigramWordSimilarity(search_text, "author"))
+            )
+            .order_by("-rank", "-book_id")
+        )
+
+    @classmethod
+    def _search_with_sqlite(cls, search_text: str, queryset: QuerySet) -> QuerySet:
+        """Search books through the FTS5 trigram table, or by substring when the text is shorter than a trigram."""
+        fts_query: str = cls.get_fts_trigram_query(search_text)
+        if not fts_query:
+            return (
+                queryset.filter(Q(name__icontains=search_text) | Q(author__icontains=search_text))
+                .annotate(rank=Value(0.0, output_field=FloatField()))
+                .order_by("-rank", "-book_id")
+            )
+        quote_name = connection.ops.quote_name
+        fts_table: str = quote_name(BOOK_SEARCH_FTS_TABLE)
+        book_id_column: str = f"{quote_name(Book._meta.db_table)}.{quote_name('book_id')}"
+        return (
+            queryset.filter(
+                book_id__in=RawSQL(f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH %s", [fts_query])
+            )
+            .annotate(
+                rank=RawSQL(
+                    f"SELECT -bm25({fts_table}, 2.0, 1.0) FROM {fts_table} "
+                    f"WHERE {fts_table} MATCH %s AND rowid = {book_id_column}",
+                    [fts_query],
+                    output_field=FloatField(),
+                )
+            )
+            .order_by("-rank", "-book_id")
+        )
@@ -0,0 +1,44 @@
+"""Utility service for marking late rents as overdue in bulk."""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from rental_management.enums.rent_status_type import RentStatusType
+from rental_management.models.rent_history_model import RentHistoryModel
+
+
+class OverdueRentService:
+    """Function service to sweep in progress rents kept longer than the due days into overdue status.
+
+    A rent becomes overdue once a whole day has passed after its due days, which is the same day count that charges a
+    late return fee on return. Rents are marked with set based updates of at most the configured chunk size, each in
+    its own transaction, so a sweep never holds locks on the whole backlog. The sweep runs as a periodic job of the
+    scheduler, and running it concurrently is still safe since each update only matches rents which are still in
+    progress.
+    """
+
+    @classmethod
+    def mark_overdue_rents(cls, now: Optional[datetime] = None, chunk_size: Optional[int] = None) -> int:
+        """Mark every in progress rent which is late at the given time as overdue and return the number of rents."""
+        now = now or timezone.now()
+        chunk_size = chunk_size or settings.OVERDUE_SWEEP_CHUNK_SIZE
+        overdue_rents = RentHistoryModel.objects.filter(
+            status=RentStatusType.IN_PROGRESS.value, rented_date__lte=cls.get_overdue_cutoff_date(now)
+        )
+        marked_count: int = 0
+        while True:
+            chunk_rent_ids = overdue_rents.order_by("rented_date").values("rent_id")[:chunk_size]
+            chunk_marked_count: int = overdue_rents.filter(rent_id__in=chunk_rent_ids).update(
+                status=RentStatusType.OVERDUE.value
+            )
+            marked_count += chunk_marked_count
+            if chunk_marked_count < chunk_size:
+                return marked_count
+
+    @staticmethod
+    def get_overdue_cutoff_date(now: datetime) -> datetime:
+        """Get the latest rent date of rents which are overdue at the given time."""
+        return now - timedelta(days=settings.RENT_DUE_DAYS + 1)
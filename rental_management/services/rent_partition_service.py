@@ -0,0 +1,265 @@
+"""Utility service for managing monthly range partitions of rent history on PostgreSQL."""
+
+import re
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.db import NotSupportedError, connection, transaction
+from django.db.backends.utils import CursorWrapper
+from django.utils import timezone
+
+from rental_management.enums.rent_status_type import RentStatusType
+from rental_management.models.rent_history_model import RentHistoryModel
+
+UNPARTITIONED_TABLE_SUFFIX = "_unpartitioned"
+DEFAULT_PARTITION_SUFFIX = "_default"
+MOVED_RENTS_TABLE_SUFFIX = "_moved_rents"
+
+
+class RentPartitionService:
+    """Function service to keep rent history in one range partition of the rent date per month.
+
+    The rent history table is converted once by a migration into a partitioned table under the same name, so the ORM
+    keeps reading and writing it through the rent history model. PostgreSQL requires every unique index of a
+    partitioned table to contain the partition key, so the primary key becomes the rent id with the rent date, which
+    rent ids from their sequence keep unique, and the active rent constraint of the model covers the book with the
+    rent date. Indexes and constraints of the table are recreated from the table itself, so the partitioned table
+    keeps the schema of the migration state. Partitions for the coming months are created ahead of time, and
+    partitions older than the retention which only hold completed rents are detached from the table and kept as
+    standalone tables.
+    """
+
+    @classmethod
+    def is_partitioned(cls) -> bool:
+        """Check if the rent history table is a partitioned table."""
+        if connection.vendor != "postgresql":
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))",
+                [cls._get_table_name()],
+            )
+            return cursor.fetchone()[0]
+
+    @classmethod
+    def convert_to_partitioned_table(cls, now: Optional[datetime] = None, months_ahead: Optional[int] = None) -> int:
+        """Move rent history into a table partitioned by month of the rent date and return the number of partitions.
+
+        The table is locked and rebuilt in one transaction, so rent operations wait for the conversion to finish.
+        Other tables must not reference rent records with foreign keys, since a partitioned table has no unique rent id.
+        """
+        cls._check_supported()
+        if cls.is_partitioned():
+            raise NotSupportedError("Rent history table is already partitioned.")
+        now = now or timezone.now()
+        months_ahead = settings.RENT_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+        table_name: str = cls._get_table_name()
+        unpartitioned_table_name: str = f"{table_name}{UNPARTITIONED_TABLE_SUFFIX}"
+        quote_name = connection.ops.quote_name
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {quote_name(table_name)} IN ACCESS EXCLUSIVE MODE")
+            cursor.execute(f"SELECT MIN({quote_name('rented_date')}) FROM {quote_name(table_name)}")
+            first_rented_date: datetime = cursor.fetchone()[0] or now
+            cursor.execute(
+                "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+                "WHERE contype = 'f' AND conrelid = to_regclass(%s)",
+                [table_name],
+            )
+            foreign_keys: List[Tuple[str, str]] = cursor.fetchall()
+            cursor.execute(
+                "SELECT pg_get_indexdef(indexrelid) FROM pg_index "
+                "WHERE indrelid = to_regclass(%s) AND NOT indisprimary",
+                [table_name],
+            )
+            index_definitions: List[str] = [index_definition for (index_definition,) in cursor.fetchall()]
+
+            cursor.execute(f"ALTER TABLE {quote_name(table_name)} RENAME TO {quote_name(unpartitioned_table_name)}")
+            cursor.execute(
+                f"CREATE TABLE {quote_name(table_name)} "
+                f"(LIKE {quote_name(unpartitioned_table_name)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+                f"PARTITION BY RANGE ({quote_name('rented_date')})"
+            )
+            month_starts: List[datetime] = cls.get_month_starts(
+                first_rented_date, cls.add_months(cls.get_month_start(now), months_ahead)
+            )
+            for month_start in month_starts:
+                cls._create_partition(cursor, month_start)
+            cursor.execute(
+                f"CREATE TABLE {quote_name(table_name + DEFAULT_PARTITION_SUFFIX)} "
+                f"PARTITION OF {quote_name(table_name)} DEFAULT"
+            )
+            cursor.execute(f"INSERT INTO {quote_name(table_name)} SELECT * FROM {quote_name(unpartitioned_table_name)}")
+            cursor.execute(f"DROP TABLE {quote_name(unpartitioned_table_name)}")
+
+            sequence_name: str = f"{table_name}_rent_id_seq"
+            cursor.execute(f"CREATE SEQUENCE {quote_name(sequence_name)} OWNED BY {quote_name(table_name)}.rent_id")
+            cursor.execute(
+                f"SELECT setval(%s, COALESCE(MAX(rent_id), 0) + 1, false) FROM {quote_name(table_name)}",
+                [sequence_name],
+            )
+            cursor.execute(
+                f"ALTER TABLE {quote_name(table_name)} ALTER COLUMN rent_id SET DEFAULT nextval(%s::regclass)",
+                [sequence_name],
+            )
+            cursor.execute(f"ALTER TABLE {quote_name(table_name)} ADD PRIMARY KEY (rent_id, rented_date)")
+            for constraint_name, constraint_definition in foreign_keys:
+                cursor.execute(
+                    f"ALTER TABLE {quote_name(table_name)} "
+                    f"ADD CONSTRAINT {quote_name(constraint_name)} {constraint_definition}"
+                )
+            # Index names are freed by dropping the unpartitioned table, and the definitions still name this table.
+            for index_definition in index_definitions:
+                cursor.execute(index_definition)
+        return len(month_starts)
+
+    @classmethod
+    def maintain_partitions(cls) -> None:
+        """Create upcoming partitions and detach expired ones when rent history is partitioned."""
+        if cls.is_partitioned():
+            cls.create_future_partitions()
+            cls.detach_expired_partitions()
+
+    @classmethod
+    def create_future_partitions(cls, now: Optional[datetime] = None, months_ahead: Optional[int] = None) -> List[str]:
+        """Create missing partitions from the current month up to the given months ahead and return their names."""
+        cls._check_supported()
+        now = now or timezone.now()
+        months_ahead = settings.RENT_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+        existing_partition_names: List[str] = [partition_name for partition_name, _ in cls.get_monthly_partitions()]
+        created_partition_names: List[str] = []
+        with transaction.atomic(), connection.cursor() as cursor:
+            for month_start in cls.get_month_starts(now, cls.add_months(cls.get_month_start(now), months_ahead)):
+                partition_name: str = cls.get_partition_name(month_start)
+                if partition_name not in existing_partition_names:
+                    cls._create_partition(cursor, month_start)
+                    created_partition_names.append(partition_name)
+        return created_partition_names
+
+    @classmethod
+    def detach_expired_partitions(
+        cls, now: Optional[datetime] = None, retention_months: Optional[int] = None
+    ) -> List[str]:
+        """Detach partitions of months before the retention which only hold completed rents and return their names.
+
+        Detaching is disabled when the retention is zero. Partitions still holding active or unpaid rents are kept, so
+        books and account summaries never lose their rents.
+        """
+        cls._check_supported()
+        retention_months = settings.RENT_PARTITION_RETENTION_MONTHS if retention_months is None else retention_months
+        if retention_months <= 0:
+            return []
+        cutoff_month_start: datetime = cls.add_months(cls.get_month_start(now or timezone.now()), -retention_months)
+        quote_name = connection.ops.quote_name
+        detached_partition_names: List[str] = []
+        for partition_name, month_start in cls.get_monthly_partitions():
+            if cls.add_months(month_start, 1) > cutoff_month_start:
+                continue
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT EXISTS (SELECT 1 FROM {quote_name(partition_name)} WHERE status <> %s)",
+                    [RentStatusType.COMPLETED.value],
+                )
+                if cursor.fetchone()[0]:
+                    continue
+                cursor.execute(
+                    f"ALTER TABLE {quote_name(cls._get_table_name())} DETACH PARTITION {quote_name(partition_name)}"
+                )
+            detached_partition_names.append(partition_name)
+        return detached_partition_names
+
+    @classmethod
+    def get_monthly_partitions(cls) -> List[Tuple[str, datetime]]:
+        """Get name and month of every monthly partition attached to the rent history table in month order."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT child.relname FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = to_regclass(%s)",
+                [cls._get_table_name()],
+            )
+            partition_names: List[str] = [partition_name for (partition_name,) in cursor.fetchall()]
+        partition_name_pattern = re.compile(rf"^{re.escape(cls._get_table_name())}_p(\d{{4}})_(\d{{2}})$")
+        monthly_partitions: List[Tuple[str, datetime]] = []
+        for partition_name in partition_names:
+            partition_match = partition_name_pattern.match(partition_name)
+            if partition_match:
+                month_start = datetime(
+                    int(partition_match.group(1)), int(partition_match.group(2)), 1, tzinfo=dt_timezone.utc
+                )
+                monthly_partitions.append((partition_name, month_start))
+        return sorted(monthly_partitions, key=lambda monthly_partition: monthly_partition[1])
+
+    @classmethod
+    def get_partition_name(cls, month_start: datetime) -> str:
+        """Get name of the partition holding rents of the given month."""
+        return f"{cls._get_table_name()}_p{month_start.year:04d}_{month_start.month:02d}"
+
+    @classmethod
+    def get_month_starts(cls, first_date: datetime, last_date: datetime) -> List[datetime]:
+        """Get start of every month in UTC from the month of the first date through the month of the last date."""
+        month_start: datetime = cls.get_month_start(first_date)
+        month_starts: List[datetime] = []
+        while month_start <= last_date:
+            month_starts.append(month_start)
+            month_start = cls.add_months(month_start, 1)
+        return month_starts
+
+    @staticmethod
+    def get_month_start(date: datetime) -> datetime:
+        """Get start of the month of the given date in UTC."""
+        utc_date: datetime = date.astimezone(dt_timezone.utc)
+        return datetime(utc_date.year, utc_date.month, 1, tzinfo=dt_timezone.utc)
+
+    @staticmethod
+    def add_months(month_start: datetime, months: int) -> datetime:
+        """Move a month start by the given number of months."""
+        month_index: int = month_start.year * 12 + month_start.month - 1 + months
+        return month_start.replace(year=month_index // 12, month=month_index % 12 + 1)
+
+    @classmethod
+    def _create_partition(cls, cursor: CursorWrapper, month_start: datetime) -> None:
+        """Create the partition holding rents of the given month, moving its rents out of the default partition.
+
+        Rents dated beyond the created months land in the default partition, and PostgreSQL refuses a partition whose
+        range matches rows of the default partition, so those rents are set aside and inserted again once the
+        partition exists.
+        """
+        quote_name = connection.ops.quote_name
+        table_name: str = cls._get_table_name()
+        partition_name: str = cls.get_partition_name(month_start)
+        default_partition_name: str = table_name + DEFAULT_PARTITION_SUFFIX
+        moved_rents_table_name: str = partition_name + MOVED_RENTS_TABLE_SUFFIX
+        partition_bounds: List[datetime] = [month_start, cls.add_months(month_start, 1)]
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [default_partition_name])
+        has_default_partition: bool = cursor.fetchone()[0]
+        if has_default_partition:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {quote_name(moved_rents_table_name)} "
+                f"(LIKE {quote_name(default_partition_name)})"
+            )
+            cursor.execute(
+                f"WITH moved_rents AS (DELETE FROM {quote_name(default_partition_name)} "
+                f"WHERE {quote_name('rented_date')} >= %s AND {quote_name('rented_date')} < %s RETURNING *) "
+                f"INSERT INTO {quote_name(moved_rents_table_name)} SELECT * FROM moved_rents",
+                partition_bounds,
+            )
+        cursor.execute(
+            f"CREATE TABLE {quote_name(partition_name)} "
+            f"PARTITION OF {quote_name(table_name)} FOR VALUES FROM (%s) TO (%s)",
+            partition_bounds,
+        )
+        if has_default_partition:
+            cursor.execute(f"INSERT INTO {quote_name(table_name)} SELECT * FROM {quote_name(moved_rents_table_name)}")
+            cursor.execute(f"DROP TABLE {quote_name(moved_rents_table_name)}")
+
+    @staticmethod
+    def _check_supported() -> None:
+        """Raise error on databases without declarative partitioning."""
+        if connection.vendor != "postgresql":
+            raise NotSupportedError(f"Partitioning rent history is not supported on {connection.vendor} database.")
+
+    @staticmethod
+    def _get_table_name() -> str:
+        """Get database table name of rent history."""
+        return RentHistoryModel._meta.db_table
@@ -0,0 +1,330 @@
+"""Utility service for book rent operations."""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set
+
+from django.conf import settings
+from django.db import IntegrityError, NotSupportedError, connection, transaction
+from django.db.models import Case, Exists, OuterRef, When
+from django.http import Http404
+from django.utils import timezone
+
+from rental_management.enums.book_status_type import BookStatusType
+from rental_management.enums.rent_status_type import ACTIVE_RENT_STATUSES, RentStatusType
+from rental_management.enums.return_outcome_type import ReturnOutcomeType
+from rental_management.models.book_model import Book
+from rental_management.models.rent_history_model import RentHistoryModel
+from rental_management.services.account_summary_service import AccountSummaryService
+
+UNPAID_RENT_DETAIL = "Can not borrow book because you have unpaid rent penalty fee"
+BOOK_NOT_AVAILABLE_DETAIL = "The given book ID is already rented."
+CART_CONFLICT_DETAIL = "Some books in the cart are not available, no book was rented."
+BOOK_OUT_OF_SERVICE_DETAIL = "Book is out of service"
+BOOK_ALREADY_RETURNED_DETAIL = "Book is already returned"
+# Number of whole days between rent date and the return date parameter for each supported database vendor
+RENT_DAYS_SQL: Dict[str, str] = {
+    "postgresql": "EXTRACT(DAY FROM (CAST(%s AS timestamp with time zone) - {rented_date}))",
+    "sqlite": "CAST(julianday(%s) - julianday({rented_date}) AS INTEGER)",
+}
+
+
+class RentCheckoutError(Exception):
+    """Error raised when a book can not be rented, carrying the detail message for API response."""
+
+    def __init__(self, detail: str) -> None:
+        """Keep detail message of the failed checkout."""
+        super().__init__(detail)
+        self.detail = detail
+
+
+class RentCartConflictError(RentCheckoutError):
+    """Error raised when some books of a cart can not be rented, carrying every conflicting book."""
+
+    def __init__(self, conflicts: List[Dict[str, Any]]) -> None:
+        """Keep conflicting books with their current status, which is None for unknown books."""
+        super().__init__(CART_CONFLICT_DETAIL)
+        self.conflicts = conflicts
+
+
+class RentReturnError(Exception):
+    """Error raised when a book can not be returned, carrying the detail message for API response."""
+
+    def __init__(self, detail: str) -> None:
+        """Keep detail message of the failed return."""
+        super().__init__(detail)
+        self.detail = detail
+
+
+class ClosedRent(NamedTuple):
+    """Rent record closed by a return as reported back by the database."""
+
+    rent_id: int
+    book_id: int
+    user_id: Optional[int]
+    status: str
+    late_return_fee: Decimal
+
+
+class BookReturnResult(NamedTuple):
+    """Result of returning one book of a bulk return."""
+
+    book_id: int
+    outcome: str
+    rent_status: Optional[str] = None
+    late_return_fee: Optional[Decimal] = None
+
+
+class RentService:
+    """Function service to share book rent related operations."""
+
+    @classmethod
+    def checkout_book(cls, rent_data: Dict[str, Any]) -> RentHistoryModel:
+        """Rent a book by inserting its rent record and claiming the book in one transaction.
+
+        The rent record is inserted first, and the book is then claimed with a conditional update from available to
+        rented status which also points the book at the new rent and requires the renting user to have no unpaid rent
+        record and the book to have no other active rent, so concurrent checkouts of the same book can not both
+        succeed. The active rent constraint of the database only covers rents with the same rent date, so the claim
+        keeps a single active rent per book. The unpaid rent check reads the account summary of the user by primary
+        key. A successful checkout costs one insert, one update of the book and one
+        insert of the queued account summary refresh, and the reason of a failed checkout is only looked up after it
+        fails.
+        """
+        book: Book = rent_data["book_id"]
+        try:
+            with transaction.atomic():
+                rent_record: RentHistoryModel = RentHistoryModel.objects.create(**rent_data)
+                claimed_book_count: int = (
+                    Book.objects.filter(book_id=book.book_id, status=BookStatusType.AVAILABLE.value)
+                    .filter(~AccountSummaryService.unpaid_rent_condition(rent_data["user_id"]))
+                    .filter(~cls._active_rent_condition(excluded_rent_id=rent_record.rent_id))
+                    .update(status=BookStatusType.RENTED.value, current_rent=rent_record)
+                )
+                if claimed_book_count != 1:
+                    raise RentCheckoutError(cls._get_checkout_failure_detail(rent_data["user_id"]))
+        except IntegrityError:
+            raise RentCheckoutError(cls._get_checkout_failure_detail(rent_data["user_id"])) from None
+        book.status = BookStatusType.RENTED.value
+        book.current_rent = rent_record
+        return rent_record
+
+    @classmethod
+    def checkout_books(cls, rent_data: Dict[str, Any], book_ids: Sequence[int]) -> List[RentHistoryModel]:
+        """Rent every book of a cart to one user in one transaction, or none of them.
+
+        The unpaid rent check runs once, every available book without an active rent is claimed with one conditional
+        update, the rent records are inserted with one bulk insert, the books are pointed at their new rents with one
+        more update, and the account summary refresh of the user is queued with one more insert. If any book was not
+        available, nothing is rented and every conflicting book is reported, including available books which still
+        have an active rent. The claim checks active rents itself, since the active rent constraint of the database
+        only covers rents with the same rent date.
+        """
+        unique_book_ids: List[int] = list(dict.fromkeys(book_ids))
+        if AccountSummaryService.has_unpaid_rent(rent_data["user_id"]):
+            raise RentCheckoutError(UNPAID_RENT_DETAIL)
+        try:
+            with transaction.atomic():
+                claimed_book_count: int = (
+                    Book.objects.filter(book_id__in=unique_book_ids, status=BookStatusType.AVAILABLE.value)
+                    .filter(~cls._active_rent_condition())
+                    .update(status=BookStatusType.RENTED.value)
+                )
+                if claimed_book_count != len(unique_book_ids):
+                    raise RentCartConflictError([])
+                rent_records: List[RentHistoryModel] = RentHistoryModel.objects.bulk_create(
+                    [RentHistoryModel(book_id_id=book_id, **rent_data) for book_id in unique_book_ids]
+                )
+                Book.objects.filter(book_id__in=unique_book_ids).update(
+                    current_rent=Case(
+                        *[
+                            When(book_id=rent_record.book_id_id, then=rent_record.rent_id)
+                            for rent_record in rent_records
+                        ]
+                    )
+                )
+                AccountSummaryService.record_deltas(
+                    AccountSummaryService.get_rents_contribution(
+                        (rent_record.user_id_id, rent_record.status, rent_record.late_return_fee)
+                        for rent_record in rent_records
+                    )
+                )
+                return rent_records
+        except (RentCartConflictError, IntegrityError):
+            raise RentCartConflictError(cls._get_cart_conflicts(unique_book_ids)) from None
+
+    @classmethod
+    def return_book(cls, book_id: int, return_date: Optional[datetime] = None) -> ClosedRent:
+        """Return a rented book by closing the current rent of the book and freeing the book with conditional updates.
+
+        The rent is closed through the current rent of the book, which is locked first and must still be rented, so
+        concurrent returns of the same book can not both succeed. The late return fee is computed by the database from
+        the rent date, and the closed rent is read back from the update, so a successful return costs two update
+        statements and either an update of the account summary for a late return or an insert of the queued account
+        summary refresh.
+        """
+        return_date = return_date or timezone.now()
+        with transaction.atomic():
+            closed_rents: List[ClosedRent] = cls.close_active_rents([book_id], return_date)
+            if not closed_rents:
+                raise RentReturnError(cls._get_return_failure_detail(book_id))
+            Book.objects.filter(book_id=book_id, status=BookStatusType.RENTED.value).update(
+                status=BookStatusType.AVAILABLE.value, current_rent=None
+            )
+        return closed_rents[0]
+
+    @classmethod
+    def return_books(cls, book_ids: Sequence[int], return_date: Optional[datetime] = None) -> List[BookReturnResult]:
+        """Return many books at once and report the outcome of each book in the given order.
+
+        Book statuses are loaded and the books are locked in book id order with one query, current rents of rented
+        books are closed with one UPDATE ... RETURNING statement and the books of closed rents are freed with one
+        update, whatever the number of books. Books are locked before their rents like in a single return, so
+        concurrent returns and checkouts always lock rows in the same order, and a rent closed by another request no
+        longer matches the update.
+        """
+        return_date = return_date or timezone.now()
+        unique_book_ids: List[int] = list(dict.fromkeys(book_ids))
+        with transaction.atomic():
+            book_statuses: Dict[int, str] = dict(
+                Book.objects.select_for_update()
+                .filter(book_id__in=unique_book_ids)
+                .order_by("book_id")
+                .values_list("book_id", "status")
+            )
+            rented_book_ids: List[int] = [
+                book_id for book_id in unique_book_ids if book_statuses.get(book_id) == BookStatusType.RENTED.value
+            ]
+            closed_rents: Dict[int, ClosedRent] = {
+                closed_rent.book_id: closed_rent for closed_rent in cls.close_active_rents(rented_book_ids, return_date)
+            }
+            if closed_rents:
+                Book.objects.filter(book_id__in=list(closed_rents), status=BookStatusType.RENTED.value).update(
+                    status=BookStatusType.AVAILABLE.value, current_rent=None
+                )
+        return [cls._get_book_return_result(book_id, book_statuses, closed_rents) for book_id in unique_book_ids]
+
+    @classmethod
+    def close_active_rents(cls, book_ids: Sequence[int], return_date: datetime) -> List[ClosedRent]:
+        """Close current rents of the given rented books with a single UPDATE ... RETURNING statement.
+
+        Rents are found by the current rent of each book, whose row is locked by the same statement and must still be
+        rented, so rent history is never searched by book and status. Rents which are overdue or kept longer than the
+        due days become unpaid with a late return fee for each day after the due days, and other rents are completed.
+        Account summaries of the renters are then updated with one more update statement.
+        """
+        if not book_ids:
+            return []
+        if connection.vendor not in RENT_DAYS_SQL:
+            raise NotSupportedError(f"Returning books is not supported on {connection.vendor} database.")
+        quote_name = connection.ops.quote_name
+        rent_fields = {field.name: quote_name(field.column) for field in RentHistoryModel._meta.concrete_fields}
+        rent_days_sql: str = RENT_DAYS_SQL[connection.vendor].format(rented_date=rent_fields["rented_date"])
+        late_condition_sql: str = f"({rent_fields['status']} = %s OR {rent_days_sql} > %s)"
+        late_return_fee_sql: str = f"CASE WHEN {rent_days_sql} > %s THEN ({rent_days_sql} - %s) * %s ELSE 0 END"
+        adapted_return_date = connection.ops.adapt_datetimefield_value(return_date)
+        book_fields = {field.name: quote_name(field.column) for field in Book._meta.concrete_fields}
+        book_id_placeholders: str = ", ".join(["%s"] * len(book_ids))
+        lock_sql: str = " FOR UPDATE" if connection.features.has_select_for_update else ""
+        due_days: int = settings.RENT_DUE_DAYS
+        late_return_fee_per_day: int = settings.LATE_RETURN_FEE_PER_DAY
+        # Every SET expression reads column values from before the update, so status and fee see the active status.
+        sql: str = (
+            f"UPDATE {quote_name(RentHistoryModel._meta.db_table)} SET "
+            f"{rent_fields['return_date']} = %s, "
+            f"{rent_fields['late_return_fee']} = {late_return_fee_sql}, "
+            f"{rent_fields['status']} = CASE WHEN {late_condition_sql} THEN %s ELSE %s END "
+            f"WHERE {rent_fields['rent_id']} IN ("
+            f"SELECT {book_fields['current_rent']} FROM {quote_name(Book._meta.db_table)} "
+            f"WHERE {book_fields['book_id']} IN ({book_id_placeholders}) AND {book_fields['status']} = %s{lock_sql}"
+            f") AND {rent_fields['status']} IN (%s, %s) "
+            f"RETURNING {rent_fields['rent_id']}, {rent_fields['book_id']}, {rent_fields['user_id']}, "
+            f"{rent_fields['status']}, {rent_fields['late_return_fee']}"
+        )
+        params: List[Any] = [
+            adapted_return_date,
+            adapted_return_date,
+            due_days,
+            adapted_return_date,
+            due_days,
+            late_return_fee_per_day,
+            RentStatusType.OVERDUE.value,
+            adapted_return_date,
+            due_days,
+            RentStatusType.UNPAID.value,
+            RentStatusType.COMPLETED.value,
+            *book_ids,
+            BookStatusType.RENTED.value,
+            *ACTIVE_RENT_STATUSES,
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            closed_rents: List[ClosedRent] = [
+                ClosedRent(rent_id, book_id, user_id, status, Decimal(late_return_fee))
+                for rent_id, book_id, user_id, status, late_return_fee in cursor.fetchall()
+            ]
+        AccountSummaryService.apply_rent_change(
+            AccountSummaryService.get_rents_contribution(
+                (closed_rent.user_id, RentStatusType.IN_PROGRESS.value, None) for closed_rent in closed_rents
+            ),
+            AccountSummaryService.get_rents_contribution(
+                (closed_rent.user_id, closed_rent.status, closed_rent.late_return_fee) for closed_rent in closed_rents
+            ),
+        )
+        return closed_rents
+
+    @staticmethod
+    def _active_rent_condition(excluded_rent_id: Optional[int] = None) -> Exists:
+        """Build condition on whether the book has an active rent other than the excluded rent."""
+        active_rents = RentHistoryModel.objects.filter(book_id=OuterRef("book_id"), status__in=ACTIVE_RENT_STATUSES)
+        if excluded_rent_id is not None:
+            active_rents = active_rents.exclude(rent_id=excluded_rent_id)
+        return Exists(active_rents)
+
+    @staticmethod
+    def _get_book_return_result(
+        book_id: int, book_statuses: Dict[int, str], closed_rents: Dict[int, ClosedRent]
+    ) -> BookReturnResult:
+        """Get return outcome of a book from its loaded status and its closed rent."""
+        if book_id in closed_rents:
+            closed_rent: ClosedRent = closed_rents[book_id]
+            return BookReturnResult(
+                book_id, ReturnOutcomeType.RETURNED.value, closed_rent.status, closed_rent.late_return_fee
+            )
+        if book_id not in book_statuses:
+            return BookReturnResult(book_id, ReturnOutcomeType.NOT_FOUND.value)
+        if book_statuses[book_id] == BookStatusType.OUT_OF_SERVICE.value:
+            return BookReturnResult(book_id, ReturnOutcomeType.OUT_OF_SERVICE.value)
+        return BookReturnResult(book_id, ReturnOutcomeType.ALREADY_RETURNED.value)
+
+    @classmethod
+    def _get_return_failure_detail(cls, book_id: int) -> str:
+        """Get the reason why a book could not be freed, raising not found error for unknown book."""
+        book_status: Optional[str] = Book.objects.filter(book_id=book_id).values_list("status", flat=True).first()
+        if book_status is None:
+            raise Http404("No Book matches the given query.")
+        if book_status == BookStatusType.OUT_OF_SERVICE.value:
+            return BOOK_OUT_OF_SERVICE_DETAIL
+        return BOOK_ALREADY_RETURNED_DETAIL
+
+    @staticmethod
+    def _get_cart_conflicts(book_ids: Sequence[int]) -> List[Dict[str, Any]]:
+        """Get books of a cart which are not available or still have an active rent with their current status."""
+        book_statuses: Dict[int, str] = dict(Book.objects.filter(book_id__in=book_ids).values_list("book_id", "status"))
+        actively_rented_book_ids: Set[int] = set(
+            RentHistoryModel.objects.filter(book_id__in=book_ids, status__in=ACTIVE_RENT_STATUSES).values_list(
+                "book_id", flat=True
+            )
+        )
+        return [
+            {"book_id": book_id, "status": book_statuses.get(book_id)}
+            for book_id in book_ids
+            if book_statuses.get(book_id) != BookStatusType.AVAILABLE.value or book_id in actively_rented_book_ids
+        ]
+
+    @classmethod
+    def _get_checkout_failure_detail(cls, user_id: Any) -> str:
+        """Get the reason why a book could not be claimed for the user."""
+        if AccountSummaryService.has_unpaid_rent(user_id):
+            return UNPAID_RENT_DETAIL
+        return BOOK_NOT_AVAILABLE_DETAIL
@@ -0,0 +1,59 @@
+"""Signal receivers for maintaining account summaries of users when rent records are saved or deleted.
+
+Rent operations which change rent records with bulk or raw update statements apply their changes to account
+summaries themselves, since no signal is sent for them.
+"""
+
+from typing import Any, Dict, Type
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from rental_management.models.rent_history_model import RentHistoryModel
+from rental_management.services.account_summary_service import AccountSummaryService
+
+
+@receiver(pre_save, sender=RentHistoryModel, dispatch_uid="remember_previous_rent_account_contribution")
+def remember_previous_rent_account_contribution(
+    sender: Type[RentHistoryModel], instance: RentHistoryModel, raw: bool, **kwargs: Dict[str, Any]
+) -> None:
+    """Keep the previous user, status and fee of the rent so only the difference is applied after saving.
+
+    The previous row is locked until the save commits, so concurrent saves of the same rent, e.g. two settlements of
+    an unpaid rent, apply their changes one after the other and only the first one sees the unpaid status.
+    """
+    if raw or instance._state.adding:
+        return
+    previous_rent = (
+        RentHistoryModel.objects.select_for_update()
+        .filter(pk=instance.pk)
+        .values_list("user_id", "status", "late_return_fee")
+        .first()
+    )
+    instance._previous_account_contribution = (
+        AccountSummaryService.get_rent_contribution(*previous_rent) if previous_rent else {}
+    )
+
+
+@receiver(post_save, sender=RentHistoryModel, dispatch_uid="update_account_summary_on_rent_saved")
+def update_account_summary_on_rent_saved(
+    sender: Type[RentHistoryModel], instance: RentHistoryModel, raw: bool, **kwargs: Dict[str, Any]
+) -> None:
+    """Apply the change of the rent, e.g. a new rent or a settled fee, to account summaries of its users."""
+    previous_contribution = instance.__dict__.pop("_previous_account_contribution", {})
+    if not raw:
+        AccountSummaryService.apply_rent_change(
+            previous_contribution,
+            AccountSummaryService.get_rent_contribution(instance.user_id_id, instance.status, instance.late_return_fee),
+        )
+
+
+@receiver(post_delete, sender=RentHistoryModel, dispatch_uid="update_account_summary_on_rent_deleted")
+def update_account_summary_on_rent_deleted(
+    sender: Type[RentHistoryModel], instance: RentHistoryModel, **kwargs: Dict[str, Any]
+) -> None:
+    """Remove the deleted rent from the account summary of its user."""
+    AccountSummaryService.apply_rent_change(
+        AccountSummaryService.get_rent_contribution(instance.user_id_id, instance.status, instance.late_return_fee),
+        {},
+    )
@@ -0,0 +1,27 @@
+"""Signal receivers for keeping the book autocomplete index of the worker in step with saved and deleted books."""
+
+from typing import Any, Dict, Type
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from rental_management.models.book_model import Book
+from rental_management.services.book_autocomplete_service import BookAutocompleteService
+
+
+@receiver(post_save, sender=Book, dispatch_uid="update_book_autocomplete_on_book_saved")
+def update_book_autocomplete_on_book_saved(
+    sender: Type[Book], instance: Book, raw: bool, **kwargs: Dict[str, Any]
+) -> None:
+    """Suggest the book with its saved name and author once the change commits."""
+    if not raw:
+        book_id, name, author = instance.book_id, instance.name, instance.author
+        transaction.on_commit(lambda: BookAutocompleteService.record_book_saved(book_id, name, author))
+
+
+@receiver(post_delete, sender=Book, dispatch_uid="update_book_autocomplete_on_book_deleted")
+def update_book_autocomplete_on_book_deleted(sender: Type[Book], instance: Book, **kwargs: Dict[str, Any]) -> None:
+    """Stop suggesting the book once the deletion commits."""
+    book_id: int = instance.book_id
+    transaction.on_commit(lambda: BookAutocompleteService.record_book_deleted(book_id))
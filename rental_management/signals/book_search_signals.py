@@ -0,0 +1,16 @@
+"""Signal receivers for creating the SQLite search table of books after migrate."""
+
+from typing import Any, Dict
+
+from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+
+from rental_management.services.book_search_service import BookSearchService
+
+
+@receiver(post_migrate, dispatch_uid="create_book_search_table")
+def create_book_search_table(sender: AppConfig, using: str, **kwargs: Dict[str, Any]) -> None:
+    """Create the FTS5 search table of books on SQLite once the book table of the app exists."""
+    if sender.name == "rental_management":
+        BookSearchService.create_sqlite_search_table(using)
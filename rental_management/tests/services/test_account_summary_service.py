@@ -0,0 +1,186 @@
+"""Unittest for user rent account summary service."""
+
+import threading
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+from io import StringIO
+from typing import List
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.utils import timezone
+from model_bakery.recipe import Recipe
+
+from job_scheduler.models.queued_task_model import QueuedTask
+from job_scheduler.services.task_queue_service import TaskQueueService
+from rental_management.enums.rent_status_type import RentStatusType
+from rental_management.models.book_model import Book
+from rental_management.models.rent_history_model import RentHistoryModel
+from rental_management.models.user_account_summary_model import UserAccountSummary
+from rental_management.services.account_summary_service import (
+    REFRESH_ACCOUNT_SUMMARIES_TASK,
+    AccountSummaryDelta,
+    AccountSummaryService,
+)
+from rental_management.services.rent_service import RentService
+from rental_management.tests.baker_recipe.book_recipe import available_book_recipe
+from user_management.models.user_model import User
+from user_management.tests.baker_recipe.user_recipe import normal_user_recipe
+
+CONCURRENT_SETTLEMENT_COUNT = 4
+
+
+class TestAccountSummaryService(TestCase):
+    """Test case for maintaining user account summaries from rent flows."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data."""
+        cls.user: User = normal_user_recipe.make()
+        cls.available_book: Book = available_book_recipe.make()
+
+    def get_account_summary(self) -> AccountSummaryDelta:
+        """Get the stored account summary of the test user."""
+        account_summary: UserAccountSummary = UserAccountSummary.objects.get(user_id=self.user)
+        return AccountSummaryDelta(
+            account_summary.unpaid_count, account_summary.unpaid_total, account_summary.active_rentals
+        )
+
+    def test_maintain_summary_through_rent_return_and_settlement(self) -> None:
+        """Test counting active rent on checkout, unpaid fee on late return and clearing it on settlement."""
+        rented_date: datetime = datetime(2025, 10, 5, 12, 0, 0, tzinfo=dt_timezone.utc)
+        rent_record: RentHistoryModel = RentService.checkout_book(
+            {"book_id": self.available_book, "user_id": self.user, "rented_date": rented_date}
+        )
+        self.assertFalse(UserAccountSummary.objects.filter(user_id=self.user).exists())
+        self.assertEqual(TaskQueueService.run_pending_tasks(), 1)
+        self.assertEqual(self.get_account_summary(), AccountSummaryDelta(active_rentals=1))
+
+        RentService.return_book(self.available_book.book_id, rented_date + timedelta(days=10))
+        self.assertEqual(self.get_account_summary(), AccountSummaryDelta(unpaid_count=1, unpaid_total=Decimal(150)))
+        self.assertTrue(AccountSummaryService.has_unpaid_rent(self.user.user_id))
+
+        rent_record.refresh_from_db()
+        rent_record.status = RentStatusType.COMPLETED.value
+        rent_record.save()
+        self.assertEqual(self.get_account_summary(), AccountSummaryDelta())
+        self.assertFalse(AccountSummaryService.has_unpaid_rent(self.user.user_id))
+
+    def test_maintain_summary_on_cart_checkout_and_bulk_return(self) -> None:
+        """Test counting every rent of a cart and closing them with a bulk return."""
+        other_book: Book = available_book_recipe.make()
+        book_ids = [self.available_book.book_id, other_book.book_id]
+        RentService.checkout_books({"user_id": self.user, "rented_date": timezone.now()}, book_ids)
+        self.assertEqual(TaskQueueService.run_pending_tasks(), 1)
+        self.assertEqual(self.get_account_summary(), AccountSummaryDelta(active_rentals=2))
+        RentService.return_books(book_ids)
+        self.assertEqual(self.get_account_summary(), AccountSummaryDelta(active_rentals=2))
+        self.assertEqual(TaskQueueService.run_pending_tasks(), 1)
+        self.assertEqual(self.get_account_summary(), AccountSummaryDelta())
+
+    def test_refresh_summary_from_rent_history(self) -> None:
+        """Test refreshing drifted summaries from rent records of the queued users only."""
+        other_user: User = normal_user_recipe.make()
+        Recipe(RentHistoryModel, user_id=self.user, status=RentStatusType.IN_PROGRESS.value).make(_quantity=2)
+        UserAccountSummary.objects.create(user_id=other_user, active_rentals=5)
+        QueuedTask.objects.all().delete()
+
+        AccountSummaryService.refresh_account_summaries([self.user.user_id])
+        self.assertEqual(self.get_account_summary(), AccountSummaryDelta(active_rentals=2))
+        self.assertEqual(UserAccountSummary.objects.get(user_id=other_user).active_rentals, 5)
+
+        TaskQueueService.enqueue(REFRESH_ACCOUNT_SUMMARIES_TASK, {"user_ids": [other_user.user_id]})
+        TaskQueueService.run_pending_tasks()
+        self.assertEqual(UserAccountSummary.objects.get(user_id=other_user).active_rentals, 0)
+
+    def test_maintain_summary_on_rent_deleted(self) -> None:
+        """Test removing unpaid fee of a deleted rent record."""
+        rent_record: RentHistoryModel = Recipe(
+            RentHistoryModel, user_id=self.user, status=RentStatusType.UNPAID.value, late_return_fee=Decimal(50)
+        ).make()
+        self.assertEqual(self.get_account_summary(), AccountSummaryDelta(unpaid_count=1, unpaid_total=Decimal(50)))
+        rent_record.delete()
+        self.assertEqual(self.get_account_summary(), AccountSummaryDelta())
+
+    def test_check_unpaid_rent_with_single_query(self) -> None:
+        """Test checking checkout eligibility with one primary key read regardless of rent history size."""
+        Recipe(RentHistoryModel, user_id=self.user, status=RentStatusType.COMPLETED.value).make(_quantity=5)
+        with self.assertNumQueries(1):
+            self.assertFalse(AccountSummaryService.has_unpaid_rent(self.user.user_id))
+
+    def test_rebuild_account_summaries_with_drift(self) -> None:
+        """Test reporting and fixing drift between account summaries and rent history."""
+        Recipe(
+            RentHistoryModel, user_id=self.user, status=RentStatusType.UNPAID.value, late_return_fee=Decimal(50)
+        ).make()
+        UserAccountSummary.objects.filter(user_id=self.user).update(unpaid_count=0, unpaid_total=0, active_rentals=3)
+
+        output = StringIO()
+        call_command("rebuild_user_account_summaries", "--dry-run", stdout=output)
+        self.assertIn("Found 1 drifted account summaries.", output.getvalue())
+        self.assertEqual(self.get_account_summary(), AccountSummaryDelta(active_rentals=3))
+
+        call_command("rebuild_user_account_summaries", stdout=output)
+        self.assertEqual(self.get_account_summary(), AccountSummaryDelta(unpaid_count=1, unpaid_total=Decimal(50)))
+        self.assertEqual(AccountSummaryService.rebuild_account_summaries(dry_run=True), {})
+
+    def test_rebuild_account_summaries_in_chunks(self) -> None:
+        """Test finding and fixing drifted summaries of users spread over many chunks."""
+        other_users: List[User] = normal_user_recipe.make(_quantity=2)
+        for user in [self.user, *other_users]:
+            Recipe(RentHistoryModel, user_id=user, status=RentStatusType.IN_PROGRESS.value).make()
+        TaskQueueService.run_pending_tasks()
+        UserAccountSummary.objects.filter(user_id__in=[self.user, other_users[1]]).delete()
+
+        drifted_summaries = AccountSummaryService.rebuild_account_summaries(chunk_size=1)
+        self.assertEqual(
+            drifted_summaries,
+            {
+                user.user_id: (AccountSummaryDelta(), AccountSummaryDelta(active_rentals=1))
+                for user in [self.user, other_users[1]]
+            },
+        )
+        self.assertEqual(UserAccountSummary.objects.filter(active_rentals=1).count(), 3)
+        self.assertEqual(AccountSummaryService.rebuild_account_summaries(dry_run=True, chunk_size=2), {})
+
+
+@skipUnlessDBFeature("has_select_for_update")
+class TestConcurrentRentSettlement(TransactionTestCase):
+    """Test case for settling one unpaid rent from many concurrent requests.
+
+    It runs only on databases with row level locking, since SQLite rejects concurrent writers with table lock errors.
+    """
+
+    def test_settle_unpaid_rent_once(self) -> None:
+        """Test that concurrent settlements of the same unpaid rent remove its unpaid fee only once."""
+        user: User = normal_user_recipe.make()
+        Recipe(RentHistoryModel, user_id=user, status=RentStatusType.UNPAID.value, late_return_fee=Decimal(30)).make()
+        rent_record: RentHistoryModel = Recipe(
+            RentHistoryModel, user_id=user, status=RentStatusType.UNPAID.value, late_return_fee=Decimal(50)
+        ).make()
+        start_barrier = threading.Barrier(CONCURRENT_SETTLEMENT_COUNT)
+        errors: List[Exception] = []
+
+        def settle() -> None:
+            start_barrier.wait()
+            try:
+                settled_rent: RentHistoryModel = RentHistoryModel.objects.get(pk=rent_record.pk)
+                settled_rent.status = RentStatusType.COMPLETED.value
+                settled_rent.save()
+            except Exception as error:
+                errors.append(error)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=settle) for _ in range(CONCURRENT_SETTLEMENT_COUNT)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        account_summary: UserAccountSummary = UserAccountSummary.objects.get(user_id=user)
+        self.assertEqual(account_summary.unpaid_count, 1)
+        self.assertEqual(account_summary.unpaid_total, Decimal(30))
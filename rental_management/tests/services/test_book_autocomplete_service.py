@@ -0,0 +1,162 @@
+"""Unittest for book autocomplete service."""
+
+from io import StringIO
+from typing import List
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from rental_management.enums.rent_status_type import RentStatusType
+from rental_management.models.book_model import Book
+from rental_management.models.rent_history_model import RentHistoryModel
+from rental_management.services.book_autocomplete_service import (
+    BookAutocompleteIndex,
+    BookAutocompleteService,
+    BookSuggestion,
+)
+from rental_management.tests.baker_recipe.book_recipe import available_book_recipe
+
+
+class TestBookAutocompleteIndex(TestCase):
+    """Test case for looking up books by prefix in the sorted array index."""
+
+    def setUp(self) -> None:
+        """Build index of a few books."""
+        self.index = BookAutocompleteIndex(
+            [
+                (3, "Doraemon: Nobita's Dinosaur", "Fujiko F. Fujio", 5),
+                (1, "Doraemon", "Fujiko F. Fujio", 9),
+                (2, "Dorohedoro", "Q Hayashida", 5),
+                (4, "Perman", "Fujiko F. Fujio", 0),
+            ],
+            max_suggestions=3,
+        )
+
+    def get_book_ids(self, suggestions: List[BookSuggestion]) -> List[int]:
+        """Get book ids of suggestions in their order."""
+        return [suggestion.book_id for suggestion in suggestions]
+
+    def test_rank_prefix_matches_by_popularity(self) -> None:
+        """Test suggesting books by prefix of any word, most popular first and newest first on ties."""
+        self.assertEqual(self.get_book_ids(self.index.search("dor", 3)), [1, 3, 2])
+        self.assertEqual(self.get_book_ids(self.index.search("D", 2)), [1, 3])
+        self.assertEqual(self.get_book_ids(self.index.search("nobi", 3)), [3])
+        self.assertEqual(self.index.search("dor", 1)[0], BookSuggestion(1, "Doraemon", "Fujiko F. Fujio", 9))
+
+    def test_match_prefix_across_words(self) -> None:
+        """Test matching prefix spanning several words of name or author regardless of case and punctuation."""
+        self.assertEqual(self.get_book_ids(self.index.search("nobita s di", 3)), [3])
+        self.assertEqual(self.get_book_ids(self.index.search("FUJIKO F. FU", 3)), [1, 3, 4])
+        self.assertEqual(self.index.search("dinosaurs", 3), [])
+        self.assertEqual(self.index.search("  ", 3), [])
+
+    def test_exclude_books_from_full_head(self) -> None:
+        """Test finding the next books when excluded books are part of the precomputed top books of a prefix."""
+        self.assertEqual(self.get_book_ids(self.index.search("d", 3, excluded_book_ids={1, 3})), [2])
+        self.assertEqual(self.get_book_ids(self.index.search("f", 3, excluded_book_ids={1})), [3, 4])
+
+
+class TestBookAutocompleteService(TestCase):
+    """Test case for suggesting books from the worker index kept in step with book changes."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up books with rents."""
+        cls.popular_book: Book = available_book_recipe.make(name="Slam Dunk", author="Takehiko Inoue")
+        cls.other_book: Book = available_book_recipe.make(name="Slayers", author="Hajime Kanzaka")
+        RentHistoryModel.objects.create(
+            book_id=cls.popular_book, rented_date=timezone.now(), status=RentStatusType.COMPLETED
+        )
+
+    def setUp(self) -> None:
+        """Drop the worker index before and after each test."""
+        BookAutocompleteService.reset_index()
+        self.addCleanup(BookAutocompleteService.reset_index)
+
+    def get_book_ids(self, prefix: str) -> List[int]:
+        """Get book ids suggested for the prefix."""
+        return [suggestion.book_id for suggestion in BookAutocompleteService.suggest_books(prefix, 10)]
+
+    def test_suggest_books_by_rent_count(self) -> None:
+        """Test suggesting the most rented book first from an index built once."""
+        self.assertEqual(self.get_book_ids("sla"), [self.popular_book.book_id, self.other_book.book_id])
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                BookAutocompleteService.suggest_books("inoue", 10),
+                [BookSuggestion(self.popular_book.book_id, "Slam Dunk", "Takehiko Inoue", 1)],
+            )
+
+    def test_suggest_committed_book_changes(self) -> None:
+        """Test suggesting created and renamed books and not deleted books once their changes commit."""
+        self.assertEqual(self.get_book_ids("vaga"), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            new_book: Book = available_book_recipe.make(name="Vagabond", author="Takehiko Inoue")
+            self.popular_book.name = "Real"
+            self.popular_book.save()
+            self.other_book.delete()
+
+        self.assertEqual(self.get_book_ids("vaga"), [new_book.book_id])
+        self.assertEqual(self.get_book_ids("sla"), [])
+        self.assertEqual(self.get_book_ids("takehiko"), [self.popular_book.book_id, new_book.book_id])
+        self.assertEqual(BookAutocompleteService.suggest_books("real", 10)[0].popularity, 1)
+
+        BookAutocompleteService.rebuild_index()
+        self.assertEqual(BookAutocompleteService._changed_books, {})
+        self.assertEqual(self.get_book_ids("takehiko"), [self.popular_book.book_id, new_book.book_id])
+
+    def test_ignore_uncommitted_book_changes(self) -> None:
+        """Test keeping suggestions unchanged when the book change is rolled back."""
+        self.get_book_ids("sla")
+        with self.captureOnCommitCallbacks(execute=False):
+            available_book_recipe.make(name="Slam Dunk Vol. 2", author="Takehiko Inoue")
+        self.assertEqual(self.get_book_ids("sla"), [self.popular_book.book_id, self.other_book.book_id])
+
+    def test_benchmark_command(self) -> None:
+        """Test reporting memory and lookup time of the index built from generated books."""
+        output = StringIO()
+        call_command("benchmark_book_autocomplete", "--titles", "200", "--lookups", "10", stdout=output)
+        self.assertIn("Indexed books: 200", output.getvalue())
+        self.assertIn("Index memory per 100k titles:", output.getvalue())
+
+
+class TestBookAutocompleteBackgroundRebuild(TransactionTestCase):
+    """Test case for rebuilding the worker index in a background thread while the previous index keeps answering."""
+
+    def setUp(self) -> None:
+        """Drop the worker index before and after each test."""
+        BookAutocompleteService.reset_index()
+        self.addCleanup(BookAutocompleteService.reset_index)
+
+    def get_book_ids(self, prefix: str) -> List[int]:
+        """Get book ids suggested for the prefix."""
+        return [suggestion.book_id for suggestion in BookAutocompleteService.suggest_books(prefix, 10)]
+
+    def test_swap_index_rebuilt_in_background(self) -> None:
+        """Test answering from the previous index without query until the index rebuilt in background is swapped in."""
+        book: Book = available_book_recipe.make(name="Slam Dunk", author="Takehiko Inoue")
+        with override_settings(BOOK_AUTOCOMPLETE_REBUILD_SECONDS=0):
+            self.assertEqual(self.get_book_ids("sla"), [book.book_id])
+            Book.objects.filter(pk=book.pk).update(name="Real")
+            with self.assertNumQueries(0):
+                self.assertEqual(self.get_book_ids("sla"), [book.book_id])
+            BookAutocompleteService.wait_for_rebuild()
+        self.assertEqual(self.get_book_ids("real"), [book.book_id])
+        self.assertEqual(self.get_book_ids("sla"), [])
+
+    def test_rebuild_index_when_too_many_books_changed(self) -> None:
+        """Test rebuilding the index in background once more books than the limit have changed in the worker."""
+        book: Book = available_book_recipe.make(name="Slam Dunk", author="Takehiko Inoue")
+        other_book: Book = available_book_recipe.make(name="Slayers", author="Hajime Kanzaka")
+        self.assertEqual(self.get_book_ids("sla"), [other_book.book_id, book.book_id])
+        with override_settings(BOOK_AUTOCOMPLETE_MAX_CHANGED_BOOKS=1):
+            book.name = "Real"
+            book.save()
+            self.assertEqual(self.get_book_ids("sla"), [other_book.book_id])
+            BookAutocompleteService.wait_for_rebuild()
+            self.assertEqual(len(BookAutocompleteService._changed_books), 1)
+            other_book.delete()
+            self.assertEqual(self.get_book_ids("sla"), [])
+            BookAutocompleteService.wait_for_rebuild()
+        self.assertEqual(BookAutocompleteService._changed_books, {})
+        self.assertEqual(self.get_book_ids("real"), [book.book_id])
@@ -0,0 +1,92 @@
+"""Unittest for book catalog filtering and ordering service."""
+
+import itertools
+import json
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from typing import Any, Dict, Iterable, List
+
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from rental_management.enums.book_status_type import BookStatusType
+from rental_management.models.book_model import Book
+from rental_management.models.book_tag_binding_model import BookTagBinding
+from rental_management.services.book_catalog_service import BOOK_LIST_ORDERINGS, BookCatalogService
+
+CATALOG_FILTERS: Dict[str, Any] = {
+    "status": BookStatusType.AVAILABLE.value,
+    "author": "Takehiko Inoue",
+    "tag_id": [1, 2],
+    "created_after": datetime(2025, 1, 1, tzinfo=dt_timezone.utc),
+    "created_before": datetime(2025, 7, 1, tzinfo=dt_timezone.utc),
+}
+LARGE_TABLES: List[str] = [Book._meta.db_table, BookTagBinding._meta.db_table]
+
+
+class TestBookCatalogService(TestCase):
+    """Test case for serving every allow-listed catalog filter and ordering from an index."""
+
+    def get_full_scans(self, queryset: QuerySet, allow_index_walk: bool) -> List[str]:
+        """Get steps of the query plan which read a whole table, or walk a whole index unless allowed.
+
+        PostgreSQL plans with sequential scans disabled, so a sequential scan in the plan means no index can serve
+        the query, while tiny test tables would otherwise be scanned whatever indexes exist, and an index scan without
+        index condition walks the whole index like a table scan. Walking an index in the order of the listing is
+        allowed for unfiltered listings, which stop after the first page.
+        """
+        sql, params = queryset.query.sql_with_params()
+        with transaction.atomic(), connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+                return [
+                    f"{plan_node['Node Type']} on {plan_node['Relation Name']}"
+                    for plan_node in self.get_plan_nodes(json.loads(plan) if isinstance(plan, str) else plan)
+                    if plan_node.get("Relation Name") in LARGE_TABLES and self.is_full_scan(plan_node, allow_index_walk)
+                ]
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan_details: List[str] = [plan_row[-1] for plan_row in cursor.fetchall()]
+        return [
+            plan_detail
+            for plan_detail in plan_details
+            if plan_detail.startswith("SCAN ") and not (allow_index_walk and " USING INDEX " in plan_detail)
+        ]
+
+    @staticmethod
+    def is_full_scan(plan_node: Dict[str, Any], allow_index_walk: bool) -> bool:
+        """Check if a PostgreSQL plan node reads a whole table, or walks a whole index without index condition."""
+        if plan_node.get("Node Type") == "Seq Scan":
+            return True
+        return (
+            plan_node.get("Node Type") in ("Index Scan", "Index Only Scan")
+            and "Index Cond" not in plan_node
+            and not allow_index_walk
+        )
+
+    def get_plan_nodes(self, plan: Any) -> Iterable[Dict[str, Any]]:
+        """Walk every node of a PostgreSQL JSON plan."""
+        if isinstance(plan, list):
+            for plan_item in plan:
+                yield from self.get_plan_nodes(plan_item)
+        elif isinstance(plan, dict):
+            yield plan
+            for plan_value in plan.values():
+                if isinstance(plan_value, (list, dict)):
+                    yield from self.get_plan_nodes(plan_value)
+
+    def test_every_filter_and_ordering_uses_index(self) -> None:
+        """Test that no combination of catalog filters and ordering reads books or tag bindings by full scan."""
+        for filter_count in range(len(CATALOG_FILTERS) + 1):
+            for filter_names in itertools.combinations(CATALOG_FILTERS, filter_count):
+                for ordering in BOOK_LIST_ORDERINGS:
+                    filters: Dict[str, Any] = {
+                        filter_name: CATALOG_FILTERS[filter_name] for filter_name in filter_names
+                    }
+                    queryset: QuerySet = BookCatalogService.filter_books(
+                        Book.objects.all(), {**filters, "ordering": ordering}
+                    )
+                    with self.subTest(filters=filter_names, ordering=ordering):
+                        self.assertEqual(self.get_full_scans(queryset[:10], allow_index_walk=not filters), [])
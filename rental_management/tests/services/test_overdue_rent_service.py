@@ -0,0 +1,54 @@
+"""Unittest for overdue rent sweeper service."""
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from io import StringIO
+from typing import List
+
+from django.core.management import call_command
+from django.test import TestCase
+from model_bakery.recipe import Recipe
+
+from rental_management.enums.rent_status_type import RentStatusType
+from rental_management.models.rent_history_model import RentHistoryModel
+from rental_management.services.overdue_rent_service import OverdueRentService
+
+SWEEP_DATE = datetime(2025, 10, 20, 12, 0, 0, tzinfo=dt_timezone.utc)
+
+
+class TestOverdueRentService(TestCase):
+    """Test case for marking late rents as overdue."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data."""
+        cls.late_rents: List[RentHistoryModel] = Recipe(
+            RentHistoryModel, status=RentStatusType.IN_PROGRESS.value, rented_date=SWEEP_DATE - timedelta(days=8)
+        ).make(_quantity=5)
+        cls.due_today_rent: RentHistoryModel = Recipe(
+            RentHistoryModel,
+            status=RentStatusType.IN_PROGRESS.value,
+            rented_date=SWEEP_DATE - timedelta(days=7, hours=23),
+        ).make()
+        cls.completed_rent: RentHistoryModel = Recipe(
+            RentHistoryModel, status=RentStatusType.COMPLETED.value, rented_date=SWEEP_DATE - timedelta(days=30)
+        ).make()
+
+    def test_mark_overdue_rents_in_chunks(self) -> None:
+        """Test marking only late in progress rents with one update per chunk."""
+        with self.assertNumQueries(3):
+            self.assertEqual(OverdueRentService.mark_overdue_rents(SWEEP_DATE, chunk_size=2), 5)
+        self.assertEqual(
+            RentHistoryModel.objects.filter(status=RentStatusType.OVERDUE.value).count(), len(self.late_rents)
+        )
+        self.due_today_rent.refresh_from_db()
+        self.assertEqual(self.due_today_rent.status, RentStatusType.IN_PROGRESS.value)
+        self.completed_rent.refresh_from_db()
+        self.assertEqual(self.completed_rent.status, RentStatusType.COMPLETED.value)
+        self.assertEqual(OverdueRentService.mark_overdue_rents(SWEEP_DATE, chunk_size=2), 0)
+
+    def test_mark_overdue_rents_command(self) -> None:
+        """Test sweeping overdue rents from management command."""
+        output = StringIO()
+        call_command("mark_overdue_rents", "--chunk-size", "10", stdout=output)
+        self.assertIn("Marked 6 rents as overdue.", output.getvalue())
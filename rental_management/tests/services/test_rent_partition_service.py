@@ -0,0 +1,205 @@
+"""Unittest for rent history partition service."""
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from io import StringIO
+from unittest import skipIf, skipUnless
+
+from django.core.management import CommandError, call_command
+from django.db import NotSupportedError, connection
+from django.test import TestCase
+from django.utils import timezone
+from model_bakery.recipe import Recipe
+from rest_framework.exceptions import ValidationError
+
+from rental_management.enums.book_status_type import BookStatusType
+from rental_management.enums.rent_status_type import ACTIVE_RENT_STATUSES, RentStatusType
+from rental_management.models.book_model import Book
+from rental_management.models.rent_history_model import RentHistoryModel
+from rental_management.serializers.book.rent_history_serializer import RentHistorySerializer
+from rental_management.services.rent_partition_service import RentPartitionService
+from rental_management.services.rent_service import (
+    BOOK_NOT_AVAILABLE_DETAIL,
+    RentCartConflictError,
+    RentCheckoutError,
+    RentService,
+)
+from rental_management.tests.baker_recipe.book_recipe import available_book_recipe
+from user_management.models.user_model import User
+from user_management.tests.baker_recipe.user_recipe import normal_user_recipe
+
+PARTITION_DATE = datetime(2025, 11, 15, 12, 0, 0, tzinfo=dt_timezone.utc)
+
+
+class TestRentPartitionMonths(TestCase):
+    """Test case for computing monthly partition ranges."""
+
+    def test_get_month_starts_across_years(self) -> None:
+        """Test listing month starts from the first through the last month, crossing a year."""
+        self.assertEqual(
+            RentPartitionService.get_month_starts(
+                datetime(2025, 11, 30, 23, 0, 0, tzinfo=dt_timezone.utc), PARTITION_DATE + timedelta(days=60)
+            ),
+            [
+                datetime(2025, 11, 1, tzinfo=dt_timezone.utc),
+                datetime(2025, 12, 1, tzinfo=dt_timezone.utc),
+                datetime(2026, 1, 1, tzinfo=dt_timezone.utc),
+            ],
+        )
+        self.assertEqual(
+            RentPartitionService.add_months(datetime(2025, 1, 1, tzinfo=dt_timezone.utc), -13),
+            datetime(2023, 12, 1, tzinfo=dt_timezone.utc),
+        )
+
+    def test_get_partition_name(self) -> None:
+        """Test naming partition after the table and its month."""
+        self.assertEqual(
+            RentPartitionService.get_partition_name(datetime(2025, 3, 1, tzinfo=dt_timezone.utc)),
+            "rental_management_renthistorymodel_p2025_03",
+        )
+
+    @skipIf(connection.vendor == "postgresql", "Partitioning is supported on PostgreSQL.")
+    def test_reject_partitioning_without_postgresql(self) -> None:
+        """Test refusing to partition rent history on databases without declarative partitioning."""
+        self.assertFalse(RentPartitionService.is_partitioned())
+        RentPartitionService.maintain_partitions()
+        with self.assertRaisesMessage(NotSupportedError, "not supported"):
+            RentPartitionService.convert_to_partitioned_table()
+        with self.assertRaisesMessage(CommandError, "not partitioned"):
+            call_command("manage_rent_history_partitions", stdout=StringIO())
+
+
+@skipUnless(connection.vendor == "postgresql", "Declarative partitioning requires PostgreSQL.")
+class TestRentPartitionService(TestCase):
+    """Test case for managing monthly partitions of rent history partitioned by the migration."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up partitions and rents of past months."""
+        RentPartitionService.create_future_partitions(datetime(2025, 6, 1, tzinfo=dt_timezone.utc), months_ahead=1)
+        cls.completed_rent: RentHistoryModel = Recipe(
+            RentHistoryModel,
+            status=RentStatusType.COMPLETED.value,
+            rented_date=datetime(2025, 6, 10, tzinfo=dt_timezone.utc),
+        ).make()
+        cls.unpaid_rent: RentHistoryModel = Recipe(
+            RentHistoryModel,
+            status=RentStatusType.UNPAID.value,
+            rented_date=datetime(2025, 7, 10, tzinfo=dt_timezone.utc),
+        ).make()
+
+    def test_keep_orm_access_to_partitioned_table(self) -> None:
+        """Test reading and writing rents of monthly partitions through the model."""
+        self.assertTrue(RentPartitionService.is_partitioned())
+        with self.assertRaisesMessage(NotSupportedError, "already partitioned"):
+            RentPartitionService.convert_to_partitioned_table()
+        self.assertEqual(RentHistoryModel.objects.get(pk=self.completed_rent.pk).status, RentStatusType.COMPLETED)
+
+        new_rent: RentHistoryModel = RentHistoryModel.objects.create(
+            book_id=available_book_recipe.make(), rented_date=PARTITION_DATE
+        )
+        self.assertGreater(new_rent.rent_id, self.unpaid_rent.rent_id)
+        self.assertEqual(
+            RentPartitionService.create_future_partitions(datetime(2030, 1, 1, tzinfo=dt_timezone.utc), months_ahead=1),
+            [
+                RentPartitionService.get_partition_name(datetime(2030, 1, 1, tzinfo=dt_timezone.utc)),
+                RentPartitionService.get_partition_name(datetime(2030, 2, 1, tzinfo=dt_timezone.utc)),
+            ],
+        )
+        self.assertEqual(
+            RentPartitionService.create_future_partitions(datetime(2030, 1, 1, tzinfo=dt_timezone.utc), months_ahead=1),
+            [],
+        )
+
+    def test_create_partition_of_far_future_rent(self) -> None:
+        """Test creating partitions of months whose rents were dated beyond the created months."""
+        far_future_rent: RentHistoryModel = Recipe(
+            RentHistoryModel,
+            status=RentStatusType.IN_PROGRESS.value,
+            rented_date=datetime(2031, 3, 10, tzinfo=dt_timezone.utc),
+        ).make()
+        far_future_partition_name: str = RentPartitionService.get_partition_name(
+            datetime(2031, 3, 1, tzinfo=dt_timezone.utc)
+        )
+        self.assertEqual(
+            RentPartitionService.create_future_partitions(datetime(2031, 2, 1, tzinfo=dt_timezone.utc), months_ahead=1),
+            [
+                RentPartitionService.get_partition_name(datetime(2031, 2, 1, tzinfo=dt_timezone.utc)),
+                far_future_partition_name,
+            ],
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rent_id FROM {connection.ops.quote_name(far_future_partition_name)}",
+            )
+            self.assertEqual(cursor.fetchall(), [(far_future_rent.rent_id,)])
+        self.assertEqual(RentHistoryModel.objects.get(pk=far_future_rent.pk).status, RentStatusType.IN_PROGRESS)
+
+    def test_detach_expired_partitions_with_only_completed_rents(self) -> None:
+        """Test detaching old partitions except those which still hold unpaid rents."""
+        self.assertEqual(RentPartitionService.detach_expired_partitions(PARTITION_DATE, retention_months=0), [])
+        self.assertEqual(
+            RentPartitionService.detach_expired_partitions(PARTITION_DATE, retention_months=3),
+            [RentPartitionService.get_partition_name(datetime(2025, 6, 1, tzinfo=dt_timezone.utc))],
+        )
+        self.assertFalse(RentHistoryModel.objects.filter(pk=self.completed_rent.pk).exists())
+        self.assertTrue(RentHistoryModel.objects.filter(pk=self.unpaid_rent.pk).exists())
+
+    def test_reject_reopening_rent_of_book_with_active_rent(self) -> None:
+        """Test rejecting a rent update which would give a book a second active rent with another rent date."""
+        book: Book = available_book_recipe.make()
+        RentService.checkout_book(
+            {"book_id": book, "user_id": normal_user_recipe.make(), "rented_date": timezone.now()}
+        )
+        closed_rent: RentHistoryModel = Recipe(
+            RentHistoryModel, book_id=book, status=RentStatusType.COMPLETED.value, rented_date=PARTITION_DATE
+        ).make()
+        rent_serializer = RentHistorySerializer(
+            closed_rent, data={"status": RentStatusType.IN_PROGRESS.value}, partial=True
+        )
+        rent_serializer.is_valid(raise_exception=True)
+        with self.assertRaises(ValidationError):
+            rent_serializer.save()
+        self.assertEqual(RentHistoryModel.objects.filter(book_id=book, status__in=ACTIVE_RENT_STATUSES).count(), 1)
+
+    def test_rent_and_return_books_on_partitioned_table(self) -> None:
+        """Test keeping a single active rent per book through checkouts and returns on the partitioned table."""
+        user: User = normal_user_recipe.make()
+        book: Book = available_book_recipe.make()
+        cart_books = available_book_recipe.make(_quantity=2)
+
+        rent_record: RentHistoryModel = RentService.checkout_book(
+            {"book_id": book, "user_id": user, "rented_date": timezone.now()}
+        )
+        self.assertEqual(Book.objects.get(pk=book.pk).current_rent_id, rent_record.rent_id)
+        Book.objects.filter(pk=book.pk).update(status=BookStatusType.AVAILABLE.value)
+        with self.assertRaisesMessage(RentCheckoutError, BOOK_NOT_AVAILABLE_DETAIL):
+            RentService.checkout_book({"book_id": book, "user_id": user, "rented_date": timezone.now()})
+        with self.assertRaises(RentCartConflictError) as conflict_error:
+            RentService.checkout_books(
+                {"user_id": user, "rented_date": timezone.now()}, [cart_books[0].book_id, book.book_id]
+            )
+        self.assertEqual(
+            conflict_error.exception.conflicts, [{"book_id": book.book_id, "status": BookStatusType.AVAILABLE.value}]
+        )
+        self.assertEqual(
+            RentHistoryModel.objects.filter(book_id=book, status__in=[RentStatusType.IN_PROGRESS.value]).count(), 1
+        )
+
+        Book.objects.filter(pk=book.pk).update(status=BookStatusType.RENTED.value)
+        RentService.return_book(book.book_id)
+        RentService.checkout_books(
+            {"user_id": user, "rented_date": timezone.now()}, [cart_books[0].book_id, cart_books[1].book_id]
+        )
+        returned_books = RentService.return_books([cart_books[0].book_id, cart_books[1].book_id])
+        self.assertEqual(
+            [returned_book.rent_status for returned_book in returned_books], [RentStatusType.COMPLETED] * 2
+        )
+        self.assertFalse(
+            RentHistoryModel.objects.filter(book_id__in=[book, *cart_books], status=RentStatusType.IN_PROGRESS).exists()
+        )
+        self.assertFalse(
+            Book.objects.filter(pk__in=[book.pk, *[cart_book.pk for cart_book in cart_books]])
+            .exclude(status=BookStatusType.AVAILABLE.value)
+            .exists()
+        )
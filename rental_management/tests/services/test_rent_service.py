@@ -0,0 +1,215 @@
+"""Unittest for book rent and return utility service."""
+
+import threading
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from django.db import connection
+from django.http import Http404
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.utils import timezone
+from model_bakery.recipe import Recipe
+
+from rental_management.enums.book_status_type import BookStatusType
+from rental_management.enums.rent_status_type import RentStatusType
+from rental_management.models.book_model import Book
+from rental_management.models.rent_history_model import RentHistoryModel
+from rental_management.models.user_account_summary_model import UserAccountSummary
+from rental_management.services.rent_service import (
+    BOOK_ALREADY_RETURNED_DETAIL,
+    BOOK_NOT_AVAILABLE_DETAIL,
+    UNPAID_RENT_DETAIL,
+    ClosedRent,
+    RentCartConflictError,
+    RentCheckoutError,
+    RentReturnError,
+    RentService,
+)
+from rental_management.tests.baker_recipe.book_recipe import available_book_recipe, rented_book_1_recipe
+from user_management.models.user_model import User
+from user_management.tests.baker_recipe.user_recipe import normal_user_recipe
+
+CONCURRENT_CHECKOUT_COUNT = 8
+
+
+class TestRentService(TestCase):
+    """Test case for book checkout."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data."""
+        cls.user: User = normal_user_recipe.make()
+        cls.available_book: Book = available_book_recipe.make()
+        cls.rented_book: Book = rented_book_1_recipe.make()
+
+    def get_rent_data(self, book: Book, user: User) -> Dict[str, Any]:
+        """Get validated rent data of the given book and user."""
+        return {"book_id": book, "user_id": user, "rented_date": timezone.now()}
+
+    def test_checkout_book_with_single_update_and_insert(self) -> None:
+        """Test inserting rent record and claiming available book with one insert and two updates."""
+        Recipe(UserAccountSummary, user_id=self.user).make()
+        with self.assertNumQueries(5):  # savepoint, insert, account summary update, book update and savepoint release
+            rent_record: RentHistoryModel = RentService.checkout_book(
+                self.get_rent_data(self.available_book, self.user)
+            )
+        self.assertEqual(rent_record.status, RentStatusType.IN_PROGRESS.value)
+        self.available_book.refresh_from_db()
+        self.assertEqual(self.available_book.status, BookStatusType.RENTED.value)
+        self.assertEqual(self.available_book.current_rent_id, rent_record.rent_id)
+
+    def test_checkout_rented_book(self) -> None:
+        """Test rejecting checkout of a book which is not available."""
+        with self.assertRaisesMessage(RentCheckoutError, BOOK_NOT_AVAILABLE_DETAIL):
+            RentService.checkout_book(self.get_rent_data(self.rented_book, self.user))
+        self.assertFalse(RentHistoryModel.objects.filter(book_id=self.rented_book).exists())
+
+    def test_checkout_book_with_unpaid_rent(self) -> None:
+        """Test rejecting checkout of a user with unpaid rent record without claiming the book."""
+        Recipe(RentHistoryModel, user_id=self.user, book_id=self.rented_book, status=RentStatusType.UNPAID.value).make()
+        with self.assertRaisesMessage(RentCheckoutError, UNPAID_RENT_DETAIL):
+            RentService.checkout_book(self.get_rent_data(self.available_book, self.user))
+        self.available_book.refresh_from_db()
+        self.assertEqual(self.available_book.status, BookStatusType.AVAILABLE.value)
+
+    def test_checkout_available_book_with_active_rent(self) -> None:
+        """Test rejecting checkout of an available book which still has an active rent."""
+        Recipe(RentHistoryModel, book_id=self.available_book, status=RentStatusType.OVERDUE.value).make()
+        with self.assertRaisesMessage(RentCheckoutError, BOOK_NOT_AVAILABLE_DETAIL):
+            RentService.checkout_book(self.get_rent_data(self.available_book, self.user))
+        self.available_book.refresh_from_db()
+        self.assertEqual(self.available_book.status, BookStatusType.AVAILABLE.value)
+        self.assertEqual(RentHistoryModel.objects.filter(book_id=self.available_book).count(), 1)
+
+    def test_checkout_cart_with_active_rent_conflict(self) -> None:
+        """Test reporting available book with an active rent as cart conflict and renting nothing."""
+        other_available_book: Book = available_book_recipe.make()
+        Recipe(RentHistoryModel, book_id=self.available_book, status=RentStatusType.IN_PROGRESS.value).make()
+        with self.assertRaises(RentCartConflictError) as conflict_error:
+            RentService.checkout_books(
+                {"user_id": self.user, "rented_date": timezone.now()},
+                [other_available_book.book_id, self.available_book.book_id],
+            )
+        self.assertEqual(
+            conflict_error.exception.conflicts,
+            [{"book_id": self.available_book.book_id, "status": BookStatusType.AVAILABLE.value}],
+        )
+        other_available_book.refresh_from_db()
+        self.assertEqual(other_available_book.status, BookStatusType.AVAILABLE.value)
+
+    def test_rent_completed_or_unpaid_book_again(self) -> None:
+        """Test allowing new rent of a book whose previous rents are closed."""
+        Recipe(RentHistoryModel, book_id=self.available_book, status=RentStatusType.COMPLETED.value).make()
+        Recipe(RentHistoryModel, book_id=self.available_book, status=RentStatusType.UNPAID.value).make()
+        rent_record: RentHistoryModel = RentService.checkout_book(self.get_rent_data(self.available_book, self.user))
+        self.assertEqual(rent_record.status, RentStatusType.IN_PROGRESS.value)
+
+    def test_return_book_with_two_updates(self) -> None:
+        """Test freeing book and closing its rent with late return fee computed by database in two updates."""
+        rented_date: datetime = datetime(2025, 10, 5, 12, 0, 0, tzinfo=dt_timezone.utc)
+        rent_record: RentHistoryModel = Recipe(
+            RentHistoryModel, book_id=self.rented_book, status=RentStatusType.IN_PROGRESS.value, rented_date=rented_date
+        ).make()
+        Book.objects.filter(book_id=self.rented_book.book_id).update(current_rent=rent_record)
+        with self.assertNumQueries(4):  # savepoint, book update, rent update and savepoint release
+            closed_rent: ClosedRent = RentService.return_book(
+                self.rented_book.book_id, rented_date + timedelta(days=10, hours=23)
+            )
+        self.assertEqual(closed_rent.rent_id, rent_record.rent_id)
+        self.assertEqual(closed_rent.status, RentStatusType.UNPAID.value)
+        self.assertEqual(closed_rent.late_return_fee, Decimal(150))
+        rent_record.refresh_from_db()
+        self.assertEqual(rent_record.late_return_fee, Decimal(150))
+        self.assertEqual(rent_record.return_date, rented_date + timedelta(days=10, hours=23))
+        self.rented_book.refresh_from_db()
+        self.assertIsNone(self.rented_book.current_rent_id)
+
+    def test_return_overdue_book(self) -> None:
+        """Test closing overdue rent as unpaid without negative late return fee."""
+        rent_record: RentHistoryModel = Recipe(
+            RentHistoryModel, book_id=self.rented_book, status=RentStatusType.OVERDUE.value, rented_date=timezone.now()
+        ).make()
+        Book.objects.filter(book_id=self.rented_book.book_id).update(current_rent=rent_record)
+        closed_rent: ClosedRent = RentService.return_book(self.rented_book.book_id)
+        self.assertEqual(closed_rent.status, RentStatusType.UNPAID.value)
+        self.assertEqual(closed_rent.late_return_fee, Decimal(0))
+
+    def test_return_book_without_active_rent(self) -> None:
+        """Test rejecting return of a rented book without active rent and keeping the book rented."""
+        with self.assertRaisesMessage(RentReturnError, BOOK_ALREADY_RETURNED_DETAIL):
+            RentService.return_book(self.rented_book.book_id)
+        self.rented_book.refresh_from_db()
+        self.assertEqual(self.rented_book.status, BookStatusType.RENTED.value)
+        with self.assertRaises(Http404):
+            RentService.return_book(self.rented_book.book_id + self.available_book.book_id)
+
+
+@skipUnlessDBFeature("has_select_for_update")
+class TestConcurrentRentCheckout(TransactionTestCase):
+    """Test case for renting and returning one book from many concurrent requests.
+
+    It runs only on databases with row level locking, since SQLite rejects concurrent writers with table lock errors.
+    """
+
+    def test_only_one_concurrent_checkout_wins(self) -> None:
+        """Test that exactly one of many concurrent checkouts of the same book succeeds."""
+        book: Book = available_book_recipe.make()
+        users: List[User] = normal_user_recipe.make(_quantity=CONCURRENT_CHECKOUT_COUNT)
+        start_barrier = threading.Barrier(CONCURRENT_CHECKOUT_COUNT)
+        results: List[str] = []
+
+        def checkout(user: User) -> None:
+            start_barrier.wait()
+            try:
+                RentService.checkout_book(
+                    {"book_id": Book(book_id=book.book_id), "user_id": user, "rented_date": timezone.now()}
+                )
+                results.append("rented")
+            except RentCheckoutError:
+                results.append("rejected")
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=checkout, args=(user,)) for user in users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results.count("rented"), 1)
+        self.assertEqual(results.count("rejected"), CONCURRENT_CHECKOUT_COUNT - 1)
+        self.assertEqual(RentHistoryModel.objects.filter(book_id=book).count(), 1)
+        book.refresh_from_db()
+        self.assertEqual(book.status, BookStatusType.RENTED.value)
+
+    def test_only_one_concurrent_return_wins(self) -> None:
+        """Test that exactly one of many concurrent returns of the same book succeeds."""
+        book: Book = rented_book_1_recipe.make()
+        rent_record: RentHistoryModel = Recipe(
+            RentHistoryModel, book_id=book, status=RentStatusType.IN_PROGRESS.value, rented_date=timezone.now()
+        ).make()
+        Book.objects.filter(pk=book.pk).update(current_rent=rent_record)
+        start_barrier = threading.Barrier(CONCURRENT_CHECKOUT_COUNT)
+        results: List[str] = []
+
+        def return_book() -> None:
+            start_barrier.wait()
+            try:
+                RentService.return_book(book.book_id)
+                results.append("returned")
+            except RentReturnError:
+                results.append("rejected")
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=return_book) for _ in range(CONCURRENT_CHECKOUT_COUNT)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results.count("returned"), 1)
+        self.assertEqual(results.count("rejected"), CONCURRENT_CHECKOUT_COUNT - 1)
+        self.assertEqual(RentHistoryModel.objects.get(book_id=book).status, RentStatusType.COMPLETED.value)
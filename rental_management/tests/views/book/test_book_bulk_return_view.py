@@ -0,0 +1,112 @@
+"""Unit test for bulk book return service."""
+
+import datetime
+
+from django.urls import reverse
+from freezegun import freeze_time
+from model_bakery.recipe import Recipe
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from rental_management.enums.book_status_type import BookStatusType
+from rental_management.enums.rent_status_type import RentStatusType
+from rental_management.enums.return_outcome_type import ReturnOutcomeType
+from rental_management.models.book_model import Book
+from rental_management.models.rent_history_model import RentHistoryModel
+from rental_management.tests.baker_recipe.book_recipe import (
+    available_book_recipe,
+    out_of_service_book_recipe,
+    rented_book_1_recipe,
+    rented_book_2_recipe,
+)
+from user_management.tests.baker_recipe.user_recipe import admin_user_recipe, normal_user_recipe
+
+
+class TestBookBulkReturnView(APITestCase):
+    """Test case for bulk book return API."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data."""
+        cls.admin_user = admin_user_recipe.make()
+        cls.normal_user = normal_user_recipe.make()
+        cls.on_time_book: Book = rented_book_1_recipe.make()
+        cls.late_book: Book = rented_book_2_recipe.make()
+        cls.on_time_rent: RentHistoryModel = Recipe(
+            RentHistoryModel,
+            book_id=cls.on_time_book,
+            status=RentStatusType.IN_PROGRESS,
+            rented_date=datetime.datetime(2025, 10, 8, 12, 0, 0, tzinfo=datetime.timezone.utc),
+        ).make()
+        cls.late_rent: RentHistoryModel = Recipe(
+            RentHistoryModel,
+            book_id=cls.late_book,
+            status=RentStatusType.IN_PROGRESS,
+            rented_date=datetime.datetime(2025, 10, 1, 12, 0, 0, tzinfo=datetime.timezone.utc),
+        ).make()
+        Book.objects.filter(pk=cls.on_time_book.pk).update(current_rent=cls.on_time_rent)
+        Book.objects.filter(pk=cls.late_book.pk).update(current_rent=cls.late_rent)
+        cls.available_book: Book = available_book_recipe.make()
+        cls.out_of_service_book: Book = out_of_service_book_recipe.make()
+        cls.url: str = reverse("books:bulk-return-books")
+
+    def setUp(self) -> None:
+        """Login with admin user."""
+        self.client.force_authenticate(user=self.admin_user)
+
+    @freeze_time("2025-10-10 12:00:00")
+    def test_bulk_return_books(self) -> None:
+        """Test returning books in one request and reporting the outcome of each book."""
+        missing_book_id: int = self.out_of_service_book.book_id + 1
+        book_ids = [
+            self.on_time_book.book_id,
+            self.late_book.book_id,
+            self.available_book.book_id,
+            self.out_of_service_book.book_id,
+            missing_book_id,
+            self.on_time_book.book_id,
+        ]
+        with self.assertNumQueries(5):  # savepoint, book statuses, rent update, book update and savepoint release
+            response: Response = self.client.post(self.url, data={"book_ids": book_ids}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(result["book_id"], result["outcome"]) for result in response.data],
+            [
+                (self.on_time_book.book_id, ReturnOutcomeType.RETURNED),
+                (self.late_book.book_id, ReturnOutcomeType.RETURNED),
+                (self.available_book.book_id, ReturnOutcomeType.ALREADY_RETURNED),
+                (self.out_of_service_book.book_id, ReturnOutcomeType.OUT_OF_SERVICE),
+                (missing_book_id, ReturnOutcomeType.NOT_FOUND),
+            ],
+        )
+        self.assertEqual(response.data[0]["rent_status"], RentStatusType.COMPLETED)
+        self.assertEqual(response.data[0]["late_return_fee"], "0.00")
+        self.assertEqual(response.data[1]["rent_status"], RentStatusType.UNPAID)
+        self.assertEqual(response.data[1]["late_return_fee"], "100.00")
+
+        self.late_rent.refresh_from_db()
+        self.assertEqual(self.late_rent.status, RentStatusType.UNPAID.value)
+        self.assertEqual(self.late_rent.late_return_fee, 100)
+        self.assertEqual(
+            set(
+                Book.objects.filter(book_id__in=[self.on_time_book.book_id, self.late_book.book_id]).values_list(
+                    "status", flat=True
+                )
+            ),
+            {BookStatusType.AVAILABLE.value},
+        )
+
+        response = self.client.post(self.url, data={"book_ids": [self.late_book.book_id]}, format="json")
+        self.assertEqual(response.data[0]["outcome"], ReturnOutcomeType.ALREADY_RETURNED)
+
+    def test_bulk_return_without_book_ids(self) -> None:
+        """Test rejecting bulk return without any book."""
+        response: Response = self.client.post(self.url, data={"book_ids": []}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_return_with_insufficient_permission(self) -> None:
+        """Test bulk returning books without permission."""
+        self.client.force_authenticate(user=self.normal_user)
+        response: Response = self.client.post(self.url, data={"book_ids": [self.late_book.book_id]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -10,6 +10,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.test import APITestCase
 
+from rental_management.enums.book_status_type import BookStatusType
 from rental_management.enums.rent_status_type import RentStatusType
 from rental_management.models.book_model import Book
 from rental_management.models.rent_history_model import RentHistoryModel
@@ -87,6 +88,15 @@ class TestBookRentViewSet(APITestCase):
         self.assertEqual(response.data["count"], 1)
         self.assertEqual(response.data["results"], expected_result)
 
+    def test_list_book_rent_records_with_keyset_cursor(self) -> None:
+        """Test listing scoped book rent records by keyset cursor."""
+        url: str = reverse("books:list-book-rent")
+        self.client.force_authenticate(user=self.book_rent_user_1)
+        response: Response = self.client.get(url, {"cursor": ""})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [RentHistorySerializer(self.rent_history_1).data])
+        self.assertIsNone(response.data["next"])
+
     def test_list_book_rent_records_with_read_all_permission(self) -> None:
         """Test listing all book rent records with normal user that have read all permission."""
         url: str = reverse("books:list-book-rent")
@@ -100,6 +110,21 @@ class TestBookRentViewSet(APITestCase):
         self.assertEqual(response.data["count"], 2)
         self.assertEqual(response.data["results"], expected_result)
 
+    def test_list_book_rent_records_without_permission_query(self) -> None:
+        """Test scoping book rent records with cached read all decision and a single filter."""
+        url: str = reverse("books:list-book-rent")
+        for user in [self.book_rent_user_1, self.book_rent_user_2]:
+            self.client.force_authenticate(user=user)
+            self.client.get(url)
+            with self.assertNumQueries(2):
+                response: Response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Role changes are picked up on the next request
+        UserRoleBinding.objects.filter(user_id=self.book_rent_user_2).delete()
+        response = self.client.get(url)
+        self.assertEqual(response.data["count"], 1)
+
     def test_retrieve_book_rent_record(self) -> None:
         """Test retrieving book rent record with ID."""
         url: str = reverse("books:retrieve-book-rent", args=[self.rent_history_1.rent_id])
@@ -191,7 +216,10 @@ class TestBookRentViewSet(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_create_book_rent_record_with_unverify_book_record(self) -> None:
-        """Test renting book with invalid field on book record."""
+        """Test renting book with invalid field on book record.
+
+        Checkout only claims the book status, so other invalid fields of the book record do not block renting.
+        """
         url: str = reverse("books:create-book-rent")
         current_datetime: datetime = timezone.now()
         invalid_book_rent_record_input: Dict[str, Union[str, int]] = {
@@ -200,7 +228,8 @@ class TestBookRentViewSet(APITestCase):
             "rented_date": current_datetime.strftime("%Y-%m-%dT%H:%M:%SZ"),
         }
         response: Response = self.client.post(url, data=invalid_book_rent_record_input)
-        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Book.objects.get(book_id=self.unverify_book_record.book_id).status, BookStatusType.RENTED)
 
     def test_create_book_rent_record_with_unpaid_late_fee(self) -> None:
         """Test renting book with user that has unpaid rent record."""
@@ -214,6 +243,61 @@ class TestBookRentViewSet(APITestCase):
         response: Response = self.client.post(url, data=invalid_book_rent_record_input)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_checkout_rent_cart(self) -> None:
+        """Test renting many books to one user at once."""
+        url: str = reverse("books:checkout-book-rent-cart")
+        cart_books: List[Book] = [self.available_book, *available_book_recipe.make(_quantity=2)]
+        cart_input: Dict[str, Union[str, int, List[int]]] = {
+            "user_id": self.book_rent_user_2.user_id,
+            "book_ids": [book.book_id for book in cart_books],
+            "rented_date": timezone.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        response: Response = self.client.post(url, data=cart_input, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([rent["book_id"] for rent in response.data], cart_input["book_ids"])
+        self.assertTrue(all(rent["rent_id"] for rent in response.data))
+        self.assertEqual(
+            set(Book.objects.filter(book_id__in=cart_input["book_ids"]).values_list("status", flat=True)),
+            {BookStatusType.RENTED.value},
+        )
+        self.assertEqual(
+            dict(Book.objects.filter(book_id__in=cart_input["book_ids"]).values_list("book_id", "current_rent")),
+            {rent["book_id"]: rent["rent_id"] for rent in response.data},
+        )
+
+    def test_checkout_rent_cart_with_rented_book(self) -> None:
+        """Test renting nothing and reporting conflicts when a book of the cart is not available."""
+        url: str = reverse("books:checkout-book-rent-cart")
+        missing_book_id: int = self.admin_user.user_id + self.unverify_book_record.book_id + 100
+        cart_input: Dict[str, Union[str, int, List[int]]] = {
+            "user_id": self.book_rent_user_2.user_id,
+            "book_ids": [self.available_book.book_id, self.rented_book_1.book_id, missing_book_id],
+            "rented_date": timezone.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        response: Response = self.client.post(url, data=cart_input, format="json")
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(
+            response.data["conflicts"],
+            [
+                {"book_id": self.rented_book_1.book_id, "status": BookStatusType.RENTED.value},
+                {"book_id": missing_book_id, "status": None},
+            ],
+        )
+        self.available_book.refresh_from_db()
+        self.assertEqual(self.available_book.status, BookStatusType.AVAILABLE.value)
+        self.assertFalse(RentHistoryModel.objects.filter(book_id=self.available_book).exists())
+
+    def test_checkout_rent_cart_with_unpaid_late_fee(self) -> None:
+        """Test renting cart with user that has unpaid rent record."""
+        url: str = reverse("books:checkout-book-rent-cart")
+        cart_input: Dict[str, Union[str, int, List[int]]] = {
+            "user_id": self.book_rent_user_1.user_id,
+            "book_ids": [self.available_book.book_id],
+            "rented_date": timezone.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        response: Response = self.client.post(url, data=cart_input, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_update_book_rent_record(self) -> None:
         """Test updating book rent record."""
         url: str = reverse("books:update-book-rent", args=[self.rent_history_1.rent_id])
@@ -232,6 +316,31 @@ class TestBookRentViewSet(APITestCase):
         self.assertEqual(response.data["book_id"], valid_book_rent_record_input["book_id"])
         self.assertEqual(response.data["rented_date"], valid_book_rent_record_input["rented_date"])
 
+    def test_update_book_rent_record_with_second_active_rent(self) -> None:
+        """Test rejecting update which would give a book a second active rent."""
+        Recipe(RentHistoryModel, book_id=self.available_book, status=RentStatusType.IN_PROGRESS.value).make()
+        url: str = reverse("books:update-book-rent", args=[self.rent_history_1.rent_id])
+        invalid_book_rent_record_input: Dict[str, Union[str, int]] = {
+            "user_id": self.book_rent_user_1.user_id,
+            "book_id": self.available_book.book_id,
+            "rented_date": timezone.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "status": RentStatusType.OVERDUE.value,
+        }
+        response: Response = self.client.put(url, data=invalid_book_rent_record_input)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.rent_history_1.refresh_from_db()
+        self.assertEqual(self.rent_history_1.status, RentStatusType.UNPAID.value)
+
+    def test_close_book_rent_record_and_free_book(self) -> None:
+        """Test freeing the book and clearing its current rent when its rent is completed by an update."""
+        Book.objects.filter(book_id=self.rent_history_2.book_id_id).update(current_rent=self.rent_history_2)
+        url: str = reverse("books:update-book-rent", args=[self.rent_history_2.rent_id])
+        response: Response = self.client.patch(url, data={"status": RentStatusType.COMPLETED.value})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rented_book: Book = Book.objects.get(book_id=self.rent_history_2.book_id_id)
+        self.assertEqual(rented_book.status, BookStatusType.AVAILABLE.value)
+        self.assertIsNone(rented_book.current_rent_id)
+
     def test_partial_update_book_rent_record(self) -> None:
         """Test partially updating book rent record."""
         url: str = reverse("books:update-book-rent", args=[self.rent_history_1.rent_id])
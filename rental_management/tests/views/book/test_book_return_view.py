@@ -11,6 +11,7 @@ from rest_framework.test import APITestCase
 
 from rental_management.enums.book_status_type import BookStatusType
 from rental_management.enums.rent_status_type import RentStatusType
+from rental_management.models.book_model import Book
 from rental_management.models.rent_history_model import RentHistoryModel
 from rental_management.tests.baker_recipe.book_recipe import (
     available_book_recipe,
@@ -51,6 +52,7 @@ class TestBookReturnView(APITestCase):
         cls.rent_history = Recipe(
             RentHistoryModel, book_id=rented_book, status=RentStatusType.IN_PROGRESS, rented_date=rented_date
         ).make()
+        Book.objects.filter(pk=rented_book.pk).update(current_rent=cls.rent_history)
         cls.rented_book = rented_book
         cls.available_book = available_book_recipe.make()
         cls.out_of_service_book = out_of_service_book_recipe.make()
@@ -101,6 +103,12 @@ class TestBookReturnView(APITestCase):
         response: Response = self.client.patch(url)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_return_non_existing_book(self) -> None:
+        """Test returning book that does not exist."""
+        url = reverse("books:return-book", args=[self.out_of_service_book.book_id + 1])
+        response: Response = self.client.patch(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     @freeze_time("2025-10-10 12:00:00")
     def test_return_book_with_normal_user(self) -> None:
         """Test returning book with user that has update permission."""
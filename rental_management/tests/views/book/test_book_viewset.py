@@ -1,15 +1,30 @@
 """Unittest scenario for book related CRUD API."""
 
-from typing import Dict, List
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from typing import Any, Dict, List
+from unittest import skipUnless
 
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from model_bakery.recipe import Recipe
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.test import APITestCase
 
 from rental_management.enums.book_status_type import BookStatusType
+from rental_management.enums.rent_status_type import RentStatusType
+from rental_management.models.book_model import Book
+from rental_management.models.book_tag_binding_model import BookTagBinding
+from rental_management.models.rent_history_model import RentHistoryModel
+from rental_management.models.tag_model import Tag
 from rental_management.serializers.book.book_serializer import BookSerializer
-from rental_management.tests.baker_recipe.book_recipe import available_book_recipe
+from rental_management.services.book_autocomplete_service import BookAutocompleteService
+from rental_management.tests.baker_recipe.book_recipe import available_book_recipe, rented_book_1_recipe
+from rental_management.tests.baker_recipe.tag_recipe import tag_1_recipe, tag_2_recipe
 from user_management.tests.baker_recipe.user_recipe import admin_user_recipe
 
 
@@ -83,6 +98,216 @@ class TestBookViewSet(APITestCase):
         self.assertEqual(response.data["count"], 1)
         self.assertEqual(response.data["results"], expected_result)
 
+    def test_list_book_with_filters(self) -> None:
+        """Test listing books by status, author, any of the tags and creation date range."""
+        rented_book: Book = rented_book_1_recipe.make(author="Takehiko Inoue")
+        tagged_book: Book = available_book_recipe.make(author="Takehiko Inoue")
+        other_tagged_book: Book = available_book_recipe.make()
+        education_tag: Tag = tag_1_recipe.make()
+        comedy_tag: Tag = tag_2_recipe.make()
+        BookTagBinding.objects.create(book_id=tagged_book, tag_id=education_tag)
+        BookTagBinding.objects.create(book_id=other_tagged_book, tag_id=comedy_tag)
+        Book.objects.filter(pk=rented_book.pk).update(created_date=datetime(2025, 1, 1, tzinfo=dt_timezone.utc))
+        url: str = reverse("books:list-books")
+
+        def get_book_ids(query_params: Dict[str, Any]) -> List[int]:
+            """Get ids of books listed with the query parameters."""
+            response: Response = self.client.get(url, query_params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return [book["book_id"] for book in response.data["results"]]
+
+        self.assertEqual(get_book_ids({"status": BookStatusType.RENTED.value}), [rented_book.book_id])
+        self.assertEqual(
+            get_book_ids({"author": "Takehiko Inoue", "ordering": "created_date"}),
+            [rented_book.book_id, tagged_book.book_id],
+        )
+        self.assertEqual(get_book_ids({"tag_id": education_tag.tag_id}), [tagged_book.book_id])
+        self.assertEqual(
+            get_book_ids({"tag_id": [education_tag.tag_id, comedy_tag.tag_id]}),
+            [other_tagged_book.book_id, tagged_book.book_id],
+        )
+        self.assertEqual(
+            get_book_ids({"created_before": "2025-06-01T00:00:00Z", "status": BookStatusType.RENTED.value}),
+            [rented_book.book_id],
+        )
+        self.assertNotIn(rented_book.book_id, get_book_ids({"created_after": "2025-06-01T00:00:00Z"}))
+
+    def test_list_book_ordered_by_name(self) -> None:
+        """Test listing books by name in both directions with ties broken by book id."""
+        self.available_book.name = "Bleach"
+        self.available_book.save()
+        first_book: Book = available_book_recipe.make(name="Akira")
+        tied_book: Book = available_book_recipe.make(name="Bleach")
+        url: str = reverse("books:list-books")
+        self.assertEqual(
+            [book["book_id"] for book in self.client.get(url, {"ordering": "name"}).data["results"]],
+            [first_book.book_id, self.available_book.book_id, tied_book.book_id],
+        )
+        self.assertEqual(
+            [book["book_id"] for book in self.client.get(url, {"ordering": "-name", "cursor": ""}).data["results"]],
+            [tied_book.book_id, self.available_book.book_id, first_book.book_id],
+        )
+
+    def test_list_book_with_invalid_filters(self) -> None:
+        """Test rejecting filters and orderings outside the allow-list."""
+        url: str = reverse("books:list-books")
+        for query_params in [
+            {"ordering": "author"},
+            {"status": "LOST"},
+            {"tag_id": "comedy"},
+            {"created_after": "2025-06-01T00:00:00Z", "created_before": "2025-01-01T00:00:00Z"},
+            {"foo": "bar"},
+            {"status": BookStatusType.AVAILABLE.value, "page_size": "1000"},
+        ]:
+            with self.subTest(query_params=query_params):
+                self.assertEqual(self.client.get(url, query_params).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_book_with_unknown_query_param(self) -> None:
+        """Test reporting every unknown query parameter while accepting pagination, expand and format parameters."""
+        url: str = reverse("books:list-books")
+        response: Response = self.client.get(url, {"foo": "bar", "sort": "name", "page": 1, "expand": "current_rent"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data), {"foo", "sort"})
+        self.assertEqual(self.client.get(url, {"page": 1, "expand": "current_rent"}).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(url, {"format": "json"}).status_code, status.HTTP_200_OK)
+
+    def test_list_book_with_expanded_current_rent(self) -> None:
+        """Test listing books with renter and due date of the current rent joined in one query."""
+        rented_date: datetime = datetime(2025, 10, 5, 12, 0, 0, tzinfo=dt_timezone.utc)
+        rented_book: Book = rented_book_1_recipe.make()
+        rent_record: RentHistoryModel = Recipe(
+            RentHistoryModel, book_id=rented_book, user_id=self.admin_user, rented_date=rented_date
+        ).make()
+        Book.objects.filter(book_id=rented_book.book_id).update(current_rent=rent_record)
+        url: str = reverse("books:list-books")
+        with self.assertNumQueries(2):  # count and books joined with current rent and renter
+            response: Response = self.client.get(url, {"expand": "current_rent"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results: Dict[int, Dict[str, Any]] = {book["book_id"]: book for book in response.data["results"]}
+        self.assertIsNone(results[self.available_book.book_id]["current_rent"])
+        self.assertEqual(
+            results[rented_book.book_id]["current_rent"],
+            {
+                "rent_id": rent_record.rent_id,
+                "user_id": self.admin_user.user_id,
+                "username": self.admin_user.username,
+                "rented_date": "2025-10-05T12:00:00Z",
+                "due_date": "2025-10-12T12:00:00Z",
+                "status": RentStatusType.IN_PROGRESS.value,
+            },
+        )
+
+    def test_list_book_with_keyset_cursor(self) -> None:
+        """Test walking books forward and back by keyset cursor with ties broken by book id, without count."""
+        available_book_recipe.make(_quantity=11)
+        Book.objects.filter(book_id__gt=self.available_book.book_id + 5).update(
+            created_date=self.available_book.created_date
+        )
+        expected_book_ids: List[int] = list(
+            Book.objects.order_by("-created_date", "-book_id").values_list("book_id", flat=True)
+        )
+        url: str = reverse("books:list-books")
+
+        with CaptureQueriesContext(connection) as first_page_queries:
+            first_page: Response = self.client.get(url, {"cursor": ""})
+        self.assertEqual(first_page.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", first_page.data)
+        self.assertIsNone(first_page.data["previous"])
+        with CaptureQueriesContext(connection) as second_page_queries:
+            second_page: Response = self.client.get(first_page.data["next"])
+        self.assertEqual(len(second_page_queries), len(first_page_queries))
+        self.assertIsNone(second_page.data["next"])
+        self.assertEqual(
+            [book["book_id"] for book in first_page.data["results"] + second_page.data["results"]], expected_book_ids
+        )
+
+        previous_page: Response = self.client.get(second_page.data["previous"])
+        self.assertEqual(previous_page.data["results"], first_page.data["results"])
+        self.assertIsNone(previous_page.data["previous"])
+
+    def test_list_book_with_invalid_keyset_cursor(self) -> None:
+        """Test rejecting cursor which was not issued by the listing."""
+        response: Response = self.client.get(reverse("books:list-books"), {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(PAGINATION_ESTIMATED_COUNT_THRESHOLD=3)
+    def test_list_book_with_cached_exact_count(self) -> None:
+        """Test caching exact count of a listing at the threshold for its filter signature."""
+        self.addCleanup(cache.clear)
+        available_book_recipe.make(_quantity=2)
+        url: str = reverse("books:list-books")
+        response: Response = self.client.get(url)
+        self.assertEqual(response.data["count"], 3)
+        self.assertFalse(response.data["count_estimated"])
+
+        available_book_recipe.make()
+        self.assertEqual(self.client.get(url).data["count"], 3)
+
+    @skipUnless(connection.vendor == "postgresql", "Planner estimates require PostgreSQL.")
+    @override_settings(PAGINATION_ESTIMATED_COUNT_THRESHOLD=1)
+    def test_list_book_with_estimated_count(self) -> None:
+        """Test estimating count of a large listing and finding the next page from an extra record."""
+        available_book_recipe.make(_quantity=10)
+        url: str = reverse("books:list-books")
+        response: Response = self.client.get(url)
+        self.assertTrue(response.data["count_estimated"])
+        self.assertEqual(len(response.data["results"]), 10)
+        second_page: Response = self.client.get(response.data["next"])
+        self.assertEqual(len(second_page.data["results"]), 1)
+        self.assertIsNone(second_page.data["next"])
+        self.assertEqual(self.client.get(url, {"page": 3}).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_search_book_by_name_with_typo(self) -> None:
+        """Test finding book whose name is misspelled in the search text, without unrelated books."""
+        doraemon_book: Book = available_book_recipe.make(name="Doraemon", author="Fujiko F. Fujio")
+        unrelated_book: Book = available_book_recipe.make(name="Sherlock Holmes", author="Arthur Conan Doyle")
+        response: Response = self.client.get(reverse("books:search-books"), {"q": "doramon"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        book_ids: List[int] = [book["book_id"] for book in response.data["results"]]
+        self.assertEqual(book_ids[0], doraemon_book.book_id)
+        self.assertNotIn(unrelated_book.book_id, book_ids)
+
+    def test_search_book_ranks_name_above_author(self) -> None:
+        """Test ranking book matching by name above book matching by author."""
+        name_match_book: Book = available_book_recipe.make(name="Fujio Stories", author="Lorem")
+        author_match_book: Book = available_book_recipe.make(name="Perman", author="Fujiko Fujio")
+        response: Response = self.client.get(reverse("books:search-books"), {"q": "fujio"})
+        book_ids: List[int] = [book["book_id"] for book in response.data["results"]]
+        self.assertEqual(book_ids[:2], [name_match_book.book_id, author_match_book.book_id])
+
+    def test_search_book_after_rename(self) -> None:
+        """Test searching book by its new name once it is renamed."""
+        book: Book = available_book_recipe.make(name="Dragon Ball", author="Akira Toriyama")
+        self.client.patch(reverse("books:update-book", args=[book.book_id]), data={"name": "Slam Dunk"})
+        url: str = reverse("books:search-books")
+        self.assertIn(book.book_id, [found["book_id"] for found in self.client.get(url, {"q": "slam"}).data["results"]])
+        self.assertNotIn(
+            book.book_id, [found["book_id"] for found in self.client.get(url, {"q": "dragon"}).data["results"]]
+        )
+
+    def test_search_book_without_search_text(self) -> None:
+        """Test rejecting book search without search text and keyset pagination of search results."""
+        url: str = reverse("books:search-books")
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(url, {"q": "dragon", "cursor": ""}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_autocomplete_book(self) -> None:
+        """Test suggesting books for a typed prefix of name or author."""
+        self.addCleanup(BookAutocompleteService.reset_index)
+        BookAutocompleteService.reset_index()
+        book: Book = available_book_recipe.make(name="Vagabond", author="Takehiko Inoue")
+        response: Response = self.client.get(reverse("books:autocomplete-books"), {"q": "takehiko in", "limit": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data, [{"book_id": book.book_id, "name": "Vagabond", "author": "Takehiko Inoue", "popularity": 0}]
+        )
+
+    def test_autocomplete_book_with_invalid_query(self) -> None:
+        """Test rejecting autocomplete without prefix or with too many suggestions."""
+        url: str = reverse("books:autocomplete-books")
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(url, {"q": "va", "limit": 100}).status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_retrieve_book_id(self) -> None:
         """Test getting book information by id."""
         url: str = reverse("books:retrieve-book", args=[self.available_book.book_id])
@@ -0,0 +1,60 @@
+"""Unit test for user rent account summary API."""
+
+from decimal import Decimal
+
+from django.urls import reverse
+from model_bakery.recipe import Recipe
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from job_scheduler.services.task_queue_service import TaskQueueService
+from rental_management.enums.rent_status_type import RentStatusType
+from rental_management.models.rent_history_model import RentHistoryModel
+from rental_management.tests.baker_recipe.book_recipe import rented_book_1_recipe
+from user_management.tests.baker_recipe.user_recipe import admin_user_recipe, normal_user_recipe, normal_user_recipe_2
+
+
+class TestUserAccountSummaryViewSet(APITestCase):
+    """Test case for reading rent account summary of users."""
+
+    fixtures = ['fixtures/user_role_permission.json']
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data."""
+        cls.admin_user = admin_user_recipe.make()
+        cls.renter = normal_user_recipe.make()
+        cls.other_user = normal_user_recipe_2.make()
+        Recipe(RentHistoryModel, user_id=cls.renter, book_id=rented_book_1_recipe.make()).make()
+        Recipe(
+            RentHistoryModel, user_id=cls.renter, status=RentStatusType.UNPAID.value, late_return_fee=Decimal(100)
+        ).make()
+        TaskQueueService.run_pending_tasks()
+
+    def test_retrieve_own_account_summary(self) -> None:
+        """Test reading own outstanding balance and active rent count."""
+        self.client.force_authenticate(user=self.renter)
+        url: str = reverse("books:retrieve-rent-account-summary", args=[self.renter.user_id])
+        response: Response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["user_id"], self.renter.user_id)
+        self.assertEqual(response.data["unpaid_count"], 1)
+        self.assertEqual(response.data["unpaid_total"], "100.00")
+        self.assertEqual(response.data["active_rentals"], 1)
+
+    def test_retrieve_account_summary_of_user_without_rent(self) -> None:
+        """Test reading empty account summary of a user who has never rented."""
+        self.client.force_authenticate(user=self.admin_user)
+        url: str = reverse("books:retrieve-rent-account-summary", args=[self.other_user.user_id])
+        response: Response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["unpaid_count"], 0)
+        self.assertEqual(response.data["active_rentals"], 0)
+
+    def test_retrieve_account_summary_of_other_user(self) -> None:
+        """Test hiding account summary of other users from user without read all permission."""
+        self.client.force_authenticate(user=self.other_user)
+        url: str = reverse("books:retrieve-rent-account-summary", args=[self.renter.user_id])
+        response: Response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -2,13 +2,17 @@
 
 from django.urls import path
 
+from rental_management.views.book.book_bulk_return_view import BookBulkReturnView
 from rental_management.views.book.book_rent_viewset import BookRentViewSet
 from rental_management.views.book.book_return_view import BookReturnView
 from rental_management.views.book.book_review_viewset import BookReviewViewSet
 from rental_management.views.book.book_viewset import BookViewSet
+from rental_management.views.book.user_account_summary_viewset import UserAccountSummaryViewSet
 
 book_urls = [
     path("list", BookViewSet.as_view({"get": "list"}), name="list-books"),
+    path("search", BookViewSet.as_view({"get": "search"}), name="search-books"),
+    path("autocomplete", BookViewSet.as_view({"get": "autocomplete"}), name="autocomplete-books"),
     path("<int:book_id>", BookViewSet.as_view({"get": "retrieve"}), name="retrieve-book"),
     path("create", BookViewSet.as_view({"post": "create"}), name="create-book"),
     path("update/<int:book_id>", BookViewSet.as_view({"put": "update", "patch": "partial_update"}), name="update-book"),
@@ -25,11 +29,18 @@ book_urls = [
     path("rent/list", BookRentViewSet.as_view({"get": "list"}), name="list-book-rent"),
     path("rent/<int:rent_id>", BookRentViewSet.as_view({"get": "retrieve"}), name="retrieve-book-rent"),
     path("rent/create", BookRentViewSet.as_view({"post": "create"}), name="create-book-rent"),
+    path("rent/cart", BookRentViewSet.as_view({"post": "checkout_cart"}), name="checkout-book-rent-cart"),
     path(
         "rent/update/<int:rent_id>",
         BookRentViewSet.as_view({"put": "update", "patch": "partial_update"}),
         name="update-book-rent",
     ),
     path("rent/delete/<int:rent_id>", BookRentViewSet.as_view({"delete": "destroy"}), name="delete-book-rent"),
+    path(
+        "rent/summary/<int:user_id>",
+        UserAccountSummaryViewSet.as_view({"get": "retrieve"}),
+        name="retrieve-rent-account-summary",
+    ),
     path("return/<int:book_id>", BookReturnView.as_view(), name="return-book"),
+    path("return/bulk", BookBulkReturnView.as_view(), name="bulk-return-books"),
 ]
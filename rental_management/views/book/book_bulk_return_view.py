@@ -0,0 +1,38 @@
+"""API for returning many rented books at once."""
+
+from typing import Dict, List, Tuple
+
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from rental_management.access_policies.book_return_api_access_policy import BookeReturnApiAccessPolicy
+from rental_management.serializers.book.book_bulk_return_serializer import (
+    BookBulkReturnSerializer,
+    BookReturnResultSerializer,
+)
+from rental_management.services.rent_service import BookReturnResult, RentService
+
+
+class BookBulkReturnView(GenericAPIView):
+    """API for returning a batch of books, e.g. books collected from the drop box at closing time.
+
+    View provide the following:
+    - POST: return every given book and report whether each book was returned, already returned or out of service
+    """
+
+    serializer_class = BookBulkReturnSerializer
+    permission_classes = [BookeReturnApiAccessPolicy]
+
+    @extend_schema(request=BookBulkReturnSerializer, responses={200: BookReturnResultSerializer(many=True)})
+    def post(self, request: Request, *args: Tuple[str, str], **kwargs: Dict[str, int]) -> Response:
+        """Return the given books with a fixed number of queries and report the outcome of each book."""
+        input_serializer: BookBulkReturnSerializer = self.get_serializer(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+        return_results: List[BookReturnResult] = RentService.return_books(input_serializer.validated_data["book_ids"])
+        output_serializer = BookReturnResultSerializer(
+            [return_result._asdict() for return_result in return_results], many=True
+        )
+        return Response(data=output_serializer.data, status=status.HTTP_200_OK)
@@ -1,30 +1,32 @@
 """Model viewset for book rent."""
 
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 from django.db import transaction
 from django.db.models import QuerySet
+from drf_spectacular.utils import extend_schema
 from rest_access_policy.access_view_set_mixin import AccessViewSetMixin
 from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from cartoon_rent_api.identity_map import IdentityMapMixin
 from rental_management.access_policies.rent_api_access_policy import RentApiAccessPolicy
-from rental_management.enums.book_status_type import BookStatusType
-from rental_management.enums.rent_status_type import RentStatusType
 from rental_management.models.rent_history_model import RentHistoryModel
+from rental_management.serializers.book.rent_cart_serializer import RentCartSerializer
 from rental_management.serializers.book.rent_history_serializer import RentHistorySerializer
-from rental_management.services.book_service import BookService
+from rental_management.services.rent_service import RentCartConflictError, RentCheckoutError, RentService
 
 
-class BookRentViewSet(AccessViewSetMixin, ModelViewSet):
+class BookRentViewSet(IdentityMapMixin, AccessViewSetMixin, ModelViewSet):
     """CRUD viewset for book rent service.
 
     Viewset provide the following:
     - GET: list all book rent history.
     - GET (with rent id): retrieve a specific book rent information
     - POST: create a new book review
+    - POST (cart): rent many books to one user at once
     - PUT/PATCH (with rent id): update a specific book rent by ID
     - DELETE (with book rent id): delete a specific book rent by ID
     """
@@ -35,32 +37,32 @@ class BookRentViewSet(AccessViewSetMixin, ModelViewSet):
 
     @transaction.atomic
     def create(self, request: Request, *args: Tuple[str, str], **kwargs: Dict[str, int]) -> Response:
-        """Create a book rent service and update book status."""
+        """Create a book rent record and claim the book as rented atomically."""
         rent_information_input_serializer: RentHistorySerializer = self.get_serializer(data=request.data)
         rent_information_input_serializer.is_valid(raise_exception=True)
+        try:
+            rent_record: RentHistoryModel = RentService.checkout_book(rent_information_input_serializer.validated_data)
+        except RentCheckoutError as checkout_error:
+            return Response(data={"detail": checkout_error.detail}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(data=self.get_serializer(rent_record).data, status=status.HTTP_200_OK)
 
-        # Verify if user has an unpaid book rent records.
-        unpaid_rent_records: QuerySet = self.get_queryset().filter(
-            user_id=rent_information_input_serializer.validated_data["user_id"], status=RentStatusType.UNPAID.value
-        )
-        if unpaid_rent_records.exists():
+    @extend_schema(request=RentCartSerializer, responses={200: RentHistorySerializer(many=True)})
+    def checkout_cart(self, request: Request, *args: Tuple[str, str], **kwargs: Dict[str, int]) -> Response:
+        """Rent every book of the cart to one user, or report every conflicting book and rent nothing."""
+        cart_input_serializer: RentCartSerializer = RentCartSerializer(data=request.data)
+        cart_input_serializer.is_valid(raise_exception=True)
+        rent_data: Dict[str, Any] = dict(cart_input_serializer.validated_data)
+        book_ids: List[int] = rent_data.pop("book_ids")
+        try:
+            rent_records: List[RentHistoryModel] = RentService.checkout_books(rent_data, book_ids)
+        except RentCartConflictError as conflict_error:
             return Response(
-                data={"detail": "Can not borrow book because you have unpaid rent penalty fee"},
-                status=status.HTTP_400_BAD_REQUEST,
+                data={"detail": conflict_error.detail, "conflicts": conflict_error.conflicts},
+                status=status.HTTP_409_CONFLICT,
             )
-
-        # Update book status from available to rented book
-        book_update_status: bool = BookService.update_book_status(
-            update_book=rent_information_input_serializer.validated_data["book_id"],
-            new_status=BookStatusType.RENTED.value,
-        )
-        if not book_update_status:
-            return Response(
-                data={"detail": "Can not update book status. Please contact admin."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-        rent_information_input_serializer.save()
-        return Response(data=rent_information_input_serializer.data, status=status.HTTP_200_OK)
+        except RentCheckoutError as checkout_error:
+            return Response(data={"detail": checkout_error.detail}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(data=self.get_serializer(rent_records, many=True).data, status=status.HTTP_200_OK)
 
     def get_queryset(self) -> QuerySet:
         """Get scope query records categorized by access policy."""
@@ -8,6 +8,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from cartoon_rent_api.identity_map import IdentityMapMixin
 from rental_management.access_policies.book_review_api_access_policy import BookReviewApiAccessPolicy
 from rental_management.enums.rent_status_type import RentStatusType
 from rental_management.models.book_review_model import BookReview
@@ -15,7 +16,7 @@ from rental_management.models.rent_history_model import RentHistoryModel
 from rental_management.serializers.book.book_review_serializer import BookReviewSerializer
 
 
-class BookReviewViewSet(ModelViewSet):
+class BookReviewViewSet(IdentityMapMixin, ModelViewSet):
     """CRUD viewset for book review.
 
     Viewset provide the following:
@@ -1,17 +1,37 @@
 """Model viewset for book."""
 
+from typing import Dict, List, Tuple
+
+from django.db.models import QuerySet
+from drf_spectacular.utils import extend_schema
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.viewsets import ModelViewSet
 
+from cartoon_rent_api.identity_map import IdentityMapMixin
 from rental_management.access_policies.book_api_access_policy import BookApiAccessPolicy
 from rental_management.models.book_model import Book
-from rental_management.serializers.book.book_serializer import BookSerializer
+from rental_management.serializers.book.book_autocomplete_serializer import (
+    BookAutocompleteQuerySerializer,
+    BookSuggestionSerializer,
+)
+from rental_management.serializers.book.book_list_serializer import BookListQuerySerializer
+from rental_management.serializers.book.book_search_serializer import BookSearchQuerySerializer
+from rental_management.serializers.book.book_serializer import EXPAND_QUERY_PARAM, BookSerializer
+from rental_management.services.book_autocomplete_service import BookAutocompleteService, BookSuggestion
+from rental_management.services.book_catalog_service import BookCatalogService
+from rental_management.services.book_search_service import BookSearchService
 
 
-class BookViewSet(ModelViewSet):
+class BookViewSet(IdentityMapMixin, ModelViewSet):
     """CRUD viewset for book.
 
     Viewset provide the following:
-    - GET: list all available books
+    - GET: list all available books, with renter and due date of rented books with `?expand=current_rent`, filtered by
+      `status`, `author`, `tag_id`, `created_after` and `created_before` and ordered by name or creation date
+    - GET (search): search books by name and author with `?q=`, ranked by relevance and tolerating typos
+    - GET (autocomplete): suggest the most rented books for a typed prefix of name or author with `?q=`
     - GET (with book id): retrieve a specific book information
     - POST: create a  new book
     - PUT/PATCH (with book id): update a specific book by ID
@@ -22,3 +42,56 @@ class BookViewSet(ModelViewSet):
     queryset = Book.objects.all()
     permission_classes = [BookApiAccessPolicy]
     lookup_field = "book_id"
+
+    def get_queryset(self) -> QuerySet:
+        """Get books joined with their current rent and renter when current rent is expanded.
+
+        Listed books are filtered and ordered by the allow-listed query parameters, and any other query parameter than
+        those, the pagination parameters, the expand parameter and the format override parameter is rejected.
+        """
+        queryset: QuerySet = super().get_queryset()
+        if BookSerializer.is_current_rent_expanded(self.request):
+            queryset = queryset.select_related("current_rent__user_id")
+        if self.action == "list":
+            list_query_serializer: BookListQuerySerializer = BookListQuerySerializer(
+                data=self.request.query_params,
+                context={
+                    "extra_query_params": [
+                        self.paginator.page_query_param,
+                        self.paginator.cursor_query_param,
+                        EXPAND_QUERY_PARAM,
+                        api_settings.URL_FORMAT_OVERRIDE,
+                    ]
+                },
+            )
+            list_query_serializer.is_valid(raise_exception=True)
+            queryset = BookCatalogService.filter_books(queryset, list_query_serializer.validated_data)
+        return queryset
+
+    @extend_schema(parameters=[BookListQuerySerializer])
+    def list(self, request: Request, *args: Tuple[str, str], **kwargs: Dict[str, int]) -> Response:
+        """List books matching the catalog filters in the requested ordering."""
+        return super().list(request, *args, **kwargs)
+
+    @extend_schema(parameters=[BookSearchQuerySerializer], responses={200: BookSerializer(many=True)})
+    def search(self, request: Request, *args: Tuple[str, str], **kwargs: Dict[str, int]) -> Response:
+        """Search books by name and author, with the most relevant books first."""
+        search_query_serializer: BookSearchQuerySerializer = BookSearchQuerySerializer(data=request.query_params)
+        search_query_serializer.is_valid(raise_exception=True)
+        books: QuerySet = BookSearchService.search_books(
+            search_query_serializer.validated_data["q"], self.get_queryset()
+        )
+        page = self.paginate_queryset(books)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+    @extend_schema(parameters=[BookAutocompleteQuerySerializer], responses={200: BookSuggestionSerializer(many=True)})
+    def autocomplete(self, request: Request, *args: Tuple[str, str], **kwargs: Dict[str, int]) -> Response:
+        """Suggest the most rented books for a prefix from the in-memory index, without querying books."""
+        autocomplete_query_serializer: BookAutocompleteQuerySerializer = BookAutocompleteQuerySerializer(
+            data=request.query_params
+        )
+        autocomplete_query_serializer.is_valid(raise_exception=True)
+        suggestions: List[BookSuggestion] = BookAutocompleteService.suggest_books(
+            autocomplete_query_serializer.validated_data["q"], autocomplete_query_serializer.validated_data["limit"]
+        )
+        return Response(BookSuggestionSerializer(suggestions, many=True).data)
@@ -0,0 +1,45 @@
+"""Viewset for rent account summary of users."""
+
+from typing import Dict, Tuple
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import QuerySet
+from rest_access_policy.access_view_set_mixin import AccessViewSetMixin
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
+
+from cartoon_rent_api.identity_map import IdentityMapMixin
+from rental_management.access_policies.rent_api_access_policy import RentApiAccessPolicy
+from rental_management.models.user_account_summary_model import UserAccountSummary
+from rental_management.serializers.book.user_account_summary_serializer import UserAccountSummarySerializer
+from user_management.models.user_model import User
+
+
+class UserAccountSummaryViewSet(IdentityMapMixin, AccessViewSetMixin, GenericViewSet):
+    """Read only viewset for rent account summary of users.
+
+    Viewset provide the following:
+    - GET (with user id): retrieve outstanding balance, unpaid rent count and active rent count of a user
+    """
+
+    serializer_class = UserAccountSummarySerializer
+    access_policy = RentApiAccessPolicy
+    lookup_field = "user_id"
+
+    def retrieve(self, request: Request, *args: Tuple[str, str], **kwargs: Dict[str, int]) -> Response:
+        """Get account summary of the user with one query, which is empty for users who have never rented."""
+        user: User = self.get_object()
+        try:
+            account_summary: UserAccountSummary = user.account_summary
+        except ObjectDoesNotExist:
+            account_summary = UserAccountSummary(user_id=user)
+        return Response(data=self.get_serializer(account_summary).data, status=status.HTTP_200_OK)
+
+    def get_queryset(self) -> QuerySet:
+        """Get users joined with their account summary, scoped to the request user without read all permission."""
+        queryset: QuerySet = User.objects.select_related("account_summary")
+        if self.access_policy.can_read_all_rent_records(self.request):
+            return queryset
+        return queryset.filter(user_id=self.request.user.user_id)
@@ -2,12 +2,13 @@
 
 from rest_framework.viewsets import ModelViewSet
 
+from cartoon_rent_api.identity_map import IdentityMapMixin
 from rental_management.access_policies.tag_api_access_policy import TagApiAccessPolicy
 from rental_management.models.book_tag_binding_model import BookTagBinding
 from rental_management.serializers.tag.tag_binding_serializer import TagBindingSerializer
 
 
-class TagBindingViewSet(ModelViewSet):
+class TagBindingViewSet(IdentityMapMixin, ModelViewSet):
     """CRUD viewset for tag assigning.
 
     Viewset provide the following:
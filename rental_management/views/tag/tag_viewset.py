@@ -2,12 +2,13 @@
 
 from rest_framework.viewsets import ModelViewSet
 
+from cartoon_rent_api.identity_map import IdentityMapMixin
 from rental_management.access_policies.tag_api_access_policy import TagApiAccessPolicy
 from rental_management.models.tag_model import Tag
 from rental_management.serializers.tag.tag_serializer import TagSerializer
 
 
-class TagViewSet(ModelViewSet):
+class TagViewSet(IdentityMapMixin, ModelViewSet):
     """CRUD viewset for tag.
 
     Viewset provide the following:
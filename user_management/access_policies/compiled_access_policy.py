@@ -0,0 +1,162 @@
+"""Access policy base class evaluating statements through dispatch tables compiled at import time."""
+
+import inspect
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from rest_access_policy import AccessPolicy, AccessPolicyException
+from rest_access_policy.access_policy import AccessEnforcement
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+WILDCARD_ACTION = "*"
+
+
+class CompiledCondition(NamedTuple):
+    """Condition method of a statement resolved from its condition name."""
+
+    name: str
+    method: Callable[..., bool]
+    argument: Optional[str]
+
+
+class CompiledStatement(NamedTuple):
+    """Statement with principal check and condition methods resolved in evaluation order."""
+
+    allow: bool
+    principal_check: Callable[[Any], bool]
+    conditions: Tuple[CompiledCondition, ...]
+
+
+PRINCIPAL_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "*": lambda user: True,
+    "authenticated": lambda user: not user.is_anonymous,
+    "anonymous": lambda user: user.is_anonymous,
+    "admin": lambda user: getattr(user, "is_superuser", False),
+    "staff": lambda user: getattr(user, "is_staff", False),
+}
+
+
+class CompiledAccessPolicy(AccessPolicy):
+    """Access policy compiling its statements into a per-action dispatch table when the policy class is created.
+
+    Each action maps to the statements that can apply to it, with principals turned into attribute checks and
+    condition names bound to condition methods. Conditions listed in `in_memory_conditions` only read the request
+    principal, so statements with them are evaluated before statements with conditions that query the database, and
+    evaluation stops at the first matching allow statement. Policies using statement features which can not be
+    compiled, such as group principals or condition expressions, are evaluated by drf-access-policy as before.
+    """
+
+    in_memory_conditions: FrozenSet[str] = frozenset({"is_admin"})
+    _dispatch_table: Optional[Dict[str, Tuple[CompiledStatement, ...]]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Compile statements of every subclass policy into its dispatch table."""
+        super().__init_subclass__(**kwargs)
+        cls._dispatch_table = cls._compile_dispatch_table()
+
+    def has_permission(self, request: Request, view: APIView) -> bool:
+        """Check request permission with the compiled dispatch table of the invoked action."""
+        if self._dispatch_table is None:
+            return super().has_permission(request, view)
+        action: str = self._get_invoked_action(view)
+        statements: Optional[Tuple[CompiledStatement, ...]] = self._dispatch_table.get(action)
+        if statements is None:
+            statements = self._dispatch_table[WILDCARD_ACTION]
+        allowed: bool = self._evaluate_compiled_statements(statements, request, view, action)
+        request.access_enforcement = AccessEnforcement(action=action, allowed=allowed)
+        return allowed
+
+    def _evaluate_compiled_statements(
+        self, statements: Tuple[CompiledStatement, ...], request: Request, view: APIView, action: str
+    ) -> bool:
+        """Check that no deny statement matches and return on the first matching allow statement."""
+        user = request.user
+        for statement in statements:
+            if statement.principal_check(user) and self._check_compiled_conditions(statement, request, view, action):
+                if not statement.allow:
+                    return False
+                return True
+        return False
+
+    def _check_compiled_conditions(
+        self, statement: CompiledStatement, request: Request, view: APIView, action: str
+    ) -> bool:
+        """Check if every condition of a statement passes, stopping at the first failing condition."""
+        for condition in statement.conditions:
+            if condition.argument is None:
+                result = condition.method(self, request, view, action)
+            else:
+                result = condition.method(self, request, view, action, condition.argument)
+            if type(result) is not bool:
+                raise AccessPolicyException(f"condition '{condition.name}' must return true/false, not {type(result)}")
+            if not result:
+                return False
+        return True
+
+    @classmethod
+    def _compile_dispatch_table(cls) -> Optional[Dict[str, Tuple[CompiledStatement, ...]]]:
+        """Compile statements into statements per action ordered by deny first and then by evaluation cost.
+
+        Return None if the policy uses any statement feature that is only supported by drf-access-policy.
+        """
+        if cls.get_policy_statements is not AccessPolicy.get_policy_statements:
+            return None
+        action_statements: Dict[str, List[Tuple[int, int, CompiledStatement]]] = {WILDCARD_ACTION: []}
+        statements: List[Any] = [
+            dict(statement) if isinstance(statement, dict) else statement for statement in cls.statements
+        ]
+        for index, statement in enumerate(cls._normalize_statements(cls, statements)):
+            compiled_statement: Optional[CompiledStatement] = cls._compile_statement(statement)
+            if compiled_statement is None or statement["condition_expression"]:
+                return None
+            if any(action.startswith("<") for action in statement["action"]):
+                return None
+            sort_key: Tuple[int, int] = (
+                0 if not compiled_statement.allow else 1 + cls._get_condition_cost(compiled_statement),
+                index,
+            )
+            for action in statement["action"]:
+                action_statements.setdefault(action, [])
+                action_statements[action].append((*sort_key, compiled_statement))
+        wildcard_statements = action_statements[WILDCARD_ACTION]
+        return {
+            action: tuple(
+                compiled_statement
+                for *_, compiled_statement in sorted(
+                    statements if action == WILDCARD_ACTION else statements + wildcard_statements,
+                    key=lambda sort_item: sort_item[:2],
+                )
+            )
+            for action, statements in action_statements.items()
+        }
+
+    @classmethod
+    def _compile_statement(cls, statement: Dict[str, Any]) -> Optional[CompiledStatement]:
+        """Resolve principal check and condition methods of a normalized statement."""
+        principal_checks: List[Callable[[Any], bool]] = []
+        for principal in statement["principal"]:
+            if principal not in PRINCIPAL_CHECKS:
+                return None
+            principal_checks.append(PRINCIPAL_CHECKS[principal])
+        conditions: List[CompiledCondition] = []
+        for condition in statement["condition"]:
+            method_name, _, argument = condition.partition(":")
+            method: Optional[Callable[..., bool]] = getattr(cls, method_name, None)
+            if not inspect.isfunction(method):
+                return None
+            conditions.append(CompiledCondition(method_name, method, argument if argument else None))
+        conditions.sort(key=lambda compiled_condition: compiled_condition.name not in cls.in_memory_conditions)
+        return CompiledStatement(
+            allow=statement["effect"] == "allow",
+            principal_check=(
+                principal_checks[0]
+                if len(principal_checks) == 1
+                else lambda user: any(principal_check(user) for principal_check in principal_checks)
+            ),
+            conditions=tuple(conditions),
+        )
+
+    @classmethod
+    def _get_condition_cost(cls, statement: CompiledStatement) -> int:
+        """Rank a statement by whether its conditions need database access."""
+        return int(any(condition.name not in cls.in_memory_conditions for condition in statement.conditions))
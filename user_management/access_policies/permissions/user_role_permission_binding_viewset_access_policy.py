@@ -2,14 +2,15 @@
 
 from typing import TYPE_CHECKING
 
-from rest_access_policy import AccessPolicy
 from rest_framework.request import Request
 
+from user_management.access_policies.compiled_access_policy import CompiledAccessPolicy
+
 if TYPE_CHECKING:
     from user_management.views.permission.user_role_permission_binding_viewset import UserRolePermissionBindingViewSet
 
 
-class UserRolePermissionBindingAccessPolicy(AccessPolicy):
+class UserRolePermissionBindingAccessPolicy(CompiledAccessPolicy):
     """Access policy defining user role permission binding API permissions.
 
     Permissions explanation:
@@ -3,14 +3,15 @@
 from typing import TYPE_CHECKING
 
 from django.db.models.query import QuerySet
-from rest_access_policy import AccessPolicy
 from rest_framework.request import Request
 
+from user_management.access_policies.compiled_access_policy import CompiledAccessPolicy
+
 if TYPE_CHECKING:
     from user_management.views.role.user_role_binding_viewset import UserRoleBindingViewSet
 
 
-class UserRoleBindingViewSetAccessPolicy(AccessPolicy):
+class UserRoleBindingViewSetAccessPolicy(CompiledAccessPolicy):
     """Access policy defining user role binding API permissions.
 
     Permissions explanation:
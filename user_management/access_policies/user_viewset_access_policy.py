@@ -2,14 +2,15 @@
 
 from typing import TYPE_CHECKING
 
-from rest_access_policy import AccessPolicy
 from rest_framework.request import Request
 
+from user_management.access_policies.compiled_access_policy import CompiledAccessPolicy
+
 if TYPE_CHECKING:
     from user_management.views.user_viewset import UserViewSet
 
 
-class UserViewSetAccessPolicy(AccessPolicy):
+class UserViewSetAccessPolicy(CompiledAccessPolicy):
     """Access policy defining user API permissions.
 
     Permissions explanation:
@@ -33,5 +34,7 @@ class UserViewSetAccessPolicy(AccessPolicy):
 
     def is_request_own_account(self, request: Request, view: 'UserViewSet', action: str) -> bool:
         """Check if request user is fetching or updating his own information."""
+        if request.user.is_anonymous:
+            return False
         query_user = view.get_object()
-        return request.user == query_user
+        return request.user.user_id == query_user.user_id
@@ -1,6 +1,7 @@
 """Configuration for storing metadata and settings."""
 
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class UserManagementConfig(AppConfig):
@@ -8,3 +9,16 @@ class UserManagementConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'user_management'
+
+    def ready(self) -> None:
+        """Register signal receivers and periodic jobs of user management app."""
+        from job_scheduler.services.job_scheduler_service import JobSchedulerService
+        from user_management.services.token_revocation_service import TokenRevocationService
+        from user_management.signals import effective_permission_signals  # noqa: F401
+        from user_management.signals import token_revocation_signals  # noqa: F401
+
+        JobSchedulerService.register_job(
+            "purge_expired_revoked_tokens",
+            settings.REVOKED_TOKEN_PURGE_INTERVAL_SECONDS,
+            TokenRevocationService.purge_expired_revocations,
+        )
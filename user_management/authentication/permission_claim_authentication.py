@@ -0,0 +1,31 @@
+"""Stateless JWT authentication with permission claim principals."""
+
+from typing import Union
+
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from user_management.authentication.permission_claim_token import (
+    IS_ADMIN_CLAIM,
+    PERMISSION_MASK_CLAIM,
+    PermissionClaimTokenUser,
+)
+from user_management.authentication.revocable_authentication import RevocableJWTAuthentication
+from user_management.models.user_model import User
+
+
+class PermissionClaimJWTAuthentication(RevocableJWTAuthentication):
+    """JWT authentication resolving the request user from token claims without loading the user record.
+
+    Tokens issued before permission claims were embedded fall back to loading the user record. Deactivated users are
+    rejected through token revocation since the user record is not loaded.
+    """
+
+    def get_user(self, validated_token: Token) -> Union[PermissionClaimTokenUser, User]:
+        """Get token principal from permission claims or the user record for tokens without permission claims."""
+        if IS_ADMIN_CLAIM not in validated_token or PERMISSION_MASK_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken("Token contained no recognizable user identification")
+        return PermissionClaimTokenUser(validated_token)
@@ -0,0 +1,51 @@
+"""JWT token and token principal carrying admin flag and permission mask claims."""
+
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from user_management.models.user_model import User
+from user_management.services.permission_service import PermissionService
+
+IS_ADMIN_CLAIM = "is_admin"
+PERMISSION_MASK_CLAIM = "permission_mask"
+
+
+class PermissionClaimRefreshToken(RefreshToken):
+    """Refresh token embedding admin flag and role permission mask claims which are copied into access tokens."""
+
+    @classmethod
+    def for_user(cls, user: User) -> 'PermissionClaimRefreshToken':
+        """Create a refresh token for the given user with permission claims."""
+        token: PermissionClaimRefreshToken = super().for_user(user)
+        token.set_permission_claims(user)
+        return token
+
+    def set_permission_claims(self, user: User) -> None:
+        """Set admin flag and effective role permission mask of the given user into token claims."""
+        self[IS_ADMIN_CLAIM] = user.is_admin
+        self[PERMISSION_MASK_CLAIM] = PermissionService.get_user_permission_mask(user.user_id)
+
+
+class PermissionClaimTokenUser(TokenUser):
+    """Lightweight request principal backed by validated token claims instead of user record.
+
+    It exposes the same user id, admin flag and permission mask attributes that access policies read from user model,
+    so permission checks do not touch the database. Claims can be stale for at most the access token lifetime.
+    """
+
+    @cached_property
+    def user_id(self) -> int:
+        """Get user id from token claim."""
+        return int(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def is_admin(self) -> bool:
+        """Get admin flag from token claim."""
+        return bool(self.token.get(IS_ADMIN_CLAIM, False))
+
+    @cached_property
+    def permission_mask(self) -> int:
+        """Get effective role permission mask from token claim."""
+        return int(self.token.get(PERMISSION_MASK_CLAIM, 0))
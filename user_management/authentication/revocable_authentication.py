@@ -0,0 +1,18 @@
+"""JWT authentication rejecting revoked tokens and tokens of deactivated users."""
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import Token
+
+from user_management.services.token_revocation_service import TokenRevocationService
+
+
+class RevocableJWTAuthentication(JWTAuthentication):
+    """JWT authentication checking every validated token against the token revocation filter."""
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        """Validate the token and reject it if it was logged out or its user was deactivated."""
+        validated_token: Token = super().get_validated_token(raw_token)
+        if TokenRevocationService.is_token_revoked(validated_token):
+            raise InvalidToken({"detail": "Token has been revoked", "code": "token_revoked"})
+        return validated_token
@@ -0,0 +1,103 @@
+"""Management command for measuring per-request cost of access policy evaluation."""
+
+import timeit
+from types import SimpleNamespace
+from typing import Any, Dict, List, Type
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from rest_access_policy import AccessPolicy
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from rental_management.access_policies.book_api_access_policy import BookApiAccessPolicy
+from rental_management.access_policies.book_return_api_access_policy import BookeReturnApiAccessPolicy
+from rental_management.access_policies.book_review_api_access_policy import BookReviewApiAccessPolicy
+from rental_management.access_policies.global_api_access_policy import GlobalApiAccessPolicy
+from rental_management.access_policies.rent_api_access_policy import RentApiAccessPolicy
+from rental_management.access_policies.tag_api_access_policy import TagApiAccessPolicy
+from user_management.access_policies.compiled_access_policy import CompiledAccessPolicy
+from user_management.access_policies.permissions.user_role_permission_binding_viewset_access_policy import (
+    UserRolePermissionBindingAccessPolicy,
+)
+from user_management.access_policies.roles.user_role_binding_viewset_access_policy import (
+    UserRoleBindingViewSetAccessPolicy,
+)
+from user_management.access_policies.roles.user_role_viewset_access_policy import UserRoleViewSetAccessPolicy
+from user_management.access_policies.user_viewset_access_policy import UserViewSetAccessPolicy
+from user_management.models.user_role_permission_model import ActionOptions
+
+BENCHMARK_POLICIES: List[Type[CompiledAccessPolicy]] = [
+    GlobalApiAccessPolicy,
+    BookApiAccessPolicy,
+    BookeReturnApiAccessPolicy,
+    BookReviewApiAccessPolicy,
+    RentApiAccessPolicy,
+    TagApiAccessPolicy,
+    UserViewSetAccessPolicy,
+    UserRoleViewSetAccessPolicy,
+    UserRoleBindingViewSetAccessPolicy,
+    UserRolePermissionBindingAccessPolicy,
+]
+BENCHMARK_ACTIONS: List[str] = ["list", "retrieve", "create", "update", "partial_update", "destroy"]
+
+
+class Command(BaseCommand):
+    """Compare drf-access-policy statement evaluation with compiled dispatch tables of every access policy.
+
+    Principals carry their permission mask and the viewed object is kept in memory, so the measured time is the
+    policy evaluation itself without database queries.
+    """
+
+    help = "Measure per-request cost of access policy evaluation before and after compiling statements."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add option for number of evaluations per policy, action and principal."""
+        parser.add_argument("--iterations", type=int, default=2000, help="Number of evaluations of each case.")
+
+    def handle(self, *args: Any, **options: Dict[str, Any]) -> None:
+        """Evaluate every policy with both evaluators, check they agree and print microseconds per request."""
+        iterations: int = options["iterations"]
+        principals = [
+            SimpleNamespace(user_id=1, pk=1, is_admin=True, is_anonymous=False, permission_mask=0),
+            SimpleNamespace(
+                user_id=2,
+                pk=2,
+                is_admin=False,
+                is_anonymous=False,
+                permission_mask=ActionOptions.get_permission_mask([ActionOptions.UPDATE.value]),
+            ),
+        ]
+        total_statement_seconds: float = 0.0
+        total_compiled_seconds: float = 0.0
+        self.stdout.write(f"{'policy':<40}{'statements (us)':>18}{'compiled (us)':>16}")
+        for policy_class in BENCHMARK_POLICIES:
+            policy: CompiledAccessPolicy = policy_class()
+            statement_seconds: float = 0.0
+            compiled_seconds: float = 0.0
+            for action in BENCHMARK_ACTIONS:
+                for principal in principals:
+                    request = Request(APIRequestFactory().get("/"))
+                    request.user = principal
+                    view = SimpleNamespace(
+                        action=action,
+                        action_map={},
+                        get_object=lambda: SimpleNamespace(user_id=1, user_id_id=1),
+                    )
+                    if AccessPolicy.has_permission(policy, request, view) != policy.has_permission(request, view):
+                        raise CommandError(f"{policy_class.__name__} decisions differ for action {action}")
+                    statement_seconds += timeit.timeit(
+                        lambda: AccessPolicy.has_permission(policy, request, view), number=iterations
+                    )
+                    compiled_seconds += timeit.timeit(lambda: policy.has_permission(request, view), number=iterations)
+            case_count: int = iterations * len(BENCHMARK_ACTIONS) * len(principals)
+            self.stdout.write(
+                f"{policy_class.__name__:<40}"
+                f"{statement_seconds / case_count * 1e6:>18.2f}{compiled_seconds / case_count * 1e6:>16.2f}"
+            )
+            total_statement_seconds += statement_seconds
+            total_compiled_seconds += compiled_seconds
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Compiled dispatch is {total_statement_seconds / total_compiled_seconds:.1f}x faster than statements."
+            )
+        )
@@ -0,0 +1,35 @@
+"""Management command for rebuilding permission masks of user roles."""
+
+from typing import Any, Dict
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from user_management.services.permission_service import PermissionService
+
+
+class Command(BaseCommand):
+    """Rebuild role permission masks from role permission bindings and report drift from the live bindings."""
+
+    help = "Rebuild role permission masks from role permission bindings and report drift."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add option for only reporting drift without changing the masks."""
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only report drift without rebuilding the role permission masks."
+        )
+
+    def handle(self, *args: Any, **options: Dict[str, Any]) -> None:
+        """Rebuild the role permission masks and print every drifted role."""
+        drifted_permission_masks = PermissionService.rebuild_role_permission_masks(dry_run=options["dry_run"])
+        for role_id, (stored_permission_mask, expected_permission_mask) in sorted(drifted_permission_masks.items()):
+            self.stdout.write(
+                f"Role {role_id} has permission mask {stored_permission_mask} instead of {expected_permission_mask}"
+            )
+        if options["dry_run"]:
+            self.stdout.write(
+                self.style.WARNING(f"Found {len(drifted_permission_masks)} drifted role permission masks.")
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"Rebuilt role permission masks and fixed {len(drifted_permission_masks)} drifts.")
+            )
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_user_effective_actions(apps, schema_editor):
+    UserRoleBinding = apps.get_model('user_management', 'UserRoleBinding')
+    UserEffectiveAction = apps.get_model('user_management', 'UserEffectiveAction')
+    user_actions = (
+        UserRoleBinding.objects.filter(role_id__userrolepermissionbinding__isnull=False)
+        .order_by()
+        .values_list('user_id', 'role_id__userrolepermissionbinding__permission_id__action')
+        .distinct()
+    )
+    UserEffectiveAction.objects.bulk_create(
+        [UserEffectiveAction(user_id_id=user_id, action=action) for user_id, action in user_actions]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_management', '0005_alter_user_options_alter_userrole_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserEffectiveAction',
+            fields=[
+                ('effective_action_id', models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    'action',
+                    models.CharField(
+                        choices=[
+                            ('CREATE', 'Create'),
+                            ('READ_ALL', 'Read All'),
+                            ('UPDATE', 'Update'),
+                            ('DELETE', 'Delete'),
+                            ('ALL', 'All'),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    'user_id',
+                    models.ForeignKey(
+                        db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL
+                    ),
+                ),
+            ],
+            options={
+                'constraints': [
+                    models.UniqueConstraint(fields=('user_id', 'action'), name='unique_effective_action_per_user')
+                ],
+            },
+        ),
+        migrations.RunPython(populate_user_effective_actions, migrations.RunPython.noop),
+    ]
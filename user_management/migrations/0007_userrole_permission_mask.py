@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:29
+
+from django.db import migrations, models
+
+ACTION_PERMISSION_BITS = {'CREATE': 1 << 0, 'READ_ALL': 1 << 1, 'UPDATE': 1 << 2, 'DELETE': 1 << 3, 'ALL': 1 << 4}
+
+
+def populate_role_permission_masks(apps, schema_editor):
+    UserRole = apps.get_model('user_management', 'UserRole')
+    UserRolePermissionBinding = apps.get_model('user_management', 'UserRolePermissionBinding')
+    role_permission_masks = {}
+    for role_id, action in UserRolePermissionBinding.objects.values_list('role_id', 'permission_id__action'):
+        role_permission_masks[role_id] = role_permission_masks.get(role_id, 0) | ACTION_PERMISSION_BITS.get(action, 0)
+    for role_id, permission_mask in role_permission_masks.items():
+        UserRole.objects.filter(role_id=role_id).update(permission_mask=permission_mask)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_management', '0006_usereffectiveaction'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userrole',
+            name='permission_mask',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_role_permission_masks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:32
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_management', '0007_userrole_permission_mask'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevokedToken',
+            fields=[
+                ('revoked_token_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('jti', models.CharField(blank=True, db_index=True, max_length=255, null=True)),
+                ('revoked_date', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('expires_date', models.DateTimeField(blank=True, null=True)),
+                (
+                    'user_id',
+                    models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+            options={
+                'ordering': ['-revoked_date'],
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:03
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_management', '0009_alter_user_last_login'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='UserEffectiveAction',
+        ),
+    ]
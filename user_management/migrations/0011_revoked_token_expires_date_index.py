@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:08
+
+from django.db import migrations, models
+from django.db.models import F
+from rest_framework_simplejwt.settings import api_settings
+
+
+def populate_user_revocation_expires_dates(apps, schema_editor):
+    RevokedToken = apps.get_model('user_management', 'RevokedToken')
+    max_token_lifetime = max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME)
+    RevokedToken.objects.filter(expires_date__isnull=True).update(expires_date=F('revoked_date') + max_token_lifetime)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_management', '0010_delete_user_effective_action'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='revokedtoken',
+            name='expires_date',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(populate_user_revocation_expires_dates, migrations.RunPython.noop),
+    ]
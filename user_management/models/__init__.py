@@ -1,9 +1,17 @@
 """User management models package for model registrations."""
 
+from user_management.models.revoked_token_model import RevokedToken
 from user_management.models.user_model import User
 from user_management.models.user_role_binding_model import UserRoleBinding
 from user_management.models.user_role_model import UserRole
 from user_management.models.user_role_permission_binding_model import UserRolePermissionBinding
 from user_management.models.user_role_permission_model import UserRolePermission
 
-__all__ = ["UserRolePermission", "UserRolePermissionBinding", "UserRole", "UserRoleBinding", "User"]
+__all__ = [
+    "UserRolePermission",
+    "UserRolePermissionBinding",
+    "UserRole",
+    "UserRoleBinding",
+    "User",
+    "RevokedToken",
+]
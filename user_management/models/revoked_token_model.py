@@ -0,0 +1,25 @@
+"""Revoked token model definition for rental service system."""
+
+from django.db import models
+
+from user_management.models.user_model import User
+
+
+class RevokedToken(models.Model):
+    """Model for recording revoked tokens and users whose previously issued tokens are no longer accepted.
+
+    A record with token jti revokes that single token, e.g. on logout. A record without jti revokes every token of the
+    user issued before the revoked date, e.g. when the user is deactivated. A record is kept until the expires date,
+    after which every token it revokes has expired.
+    """
+
+    revoked_token_id = models.BigAutoField(primary_key=True)
+    jti = models.CharField(max_length=255, null=True, blank=True, db_index=True)
+    user_id = models.ForeignKey(User, on_delete=models.CASCADE)
+    revoked_date = models.DateTimeField(auto_now_add=True, db_index=True)
+    expires_date = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    class Meta:
+        """Set up default ordering on query revoked token model."""
+
+        ordering = ["-revoked_date"]
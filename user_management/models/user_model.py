@@ -46,7 +46,7 @@ class User(AbstractBaseUser):
     last_name = models.CharField(max_length=150, null=False, blank=False)
     is_active = models.BooleanField(default=True)
     is_admin = models.BooleanField(default=False)
-    last_login = models.DateTimeField(auto_now=True)
+    last_login = models.DateTimeField(null=True, blank=True)
 
     USERNAME_FIELD = 'username'
     REQUIRED_FIELDS = ['email', 'age', 'first_name', 'last_name']
@@ -10,6 +10,7 @@ class UserRole(models.Model):
     name = models.CharField(max_length=255, unique=True)
     description = models.TextField(blank=True, null=True)
     created_date = models.DateTimeField(auto_now_add=True)
+    permission_mask = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         """Set up default ordering on query user role model."""
@@ -1,5 +1,7 @@
 """User role permission and action definition for rental service system."""
 
+from typing import Dict, Iterable
+
 from django.db import models
 
 
@@ -12,6 +14,34 @@ class ActionOptions(models.TextChoices):
     DELETE = 'DELETE'
     ALL = 'ALL'
 
+    @classmethod
+    def get_permission_bit(cls, action: str) -> int:
+        """Get the bit representing the given action in a permission mask, unknown actions have no bit."""
+        return ACTION_PERMISSION_BITS.get(action, 0)
+
+    @classmethod
+    def get_permission_mask(cls, actions: Iterable[str]) -> int:
+        """Combine the given actions into a permission mask."""
+        permission_mask: int = 0
+        for action in actions:
+            permission_mask |= cls.get_permission_bit(action)
+        return permission_mask
+
+    @classmethod
+    def has_permission_bit(cls, permission_mask: int, action: str) -> bool:
+        """Check if the permission mask grants the given action directly or through the all type permission."""
+        return bool(permission_mask & (cls.get_permission_bit(action) | cls.get_permission_bit(cls.ALL.value)))
+
+
+# Bit positions are persisted in role permission masks and must never be reordered.
+ACTION_PERMISSION_BITS: Dict[str, int] = {
+    ActionOptions.CREATE.value: 1 << 0,
+    ActionOptions.READ_ALL.value: 1 << 1,
+    ActionOptions.UPDATE.value: 1 << 2,
+    ActionOptions.DELETE.value: 1 << 3,
+    ActionOptions.ALL.value: 1 << 4,
+}
+
 
 class UserRolePermission(models.Model):
     """Model for defining user role permissions."""
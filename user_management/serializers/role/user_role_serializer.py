@@ -9,7 +9,7 @@ class UserRoleSerializer(serializers.ModelSerializer):
     """Model serializer for user role model validating input and serialize output for role related endpoints."""
 
     class Meta:
-        """Set up fields for serializing user role model."""
+        """Set up fields for serializing user role model without its internal permission mask."""
 
         model = UserRole
-        fields = "__all__"
+        exclude = ["permission_mask"]
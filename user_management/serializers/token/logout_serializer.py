@@ -0,0 +1,21 @@
+"""API serializer for logging out by revoking refresh token."""
+
+from typing import Any, Dict
+
+from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class LogoutSerializer(serializers.Serializer):
+    """Serializer for validating the refresh token to be revoked on logout."""
+
+    refresh = serializers.CharField(write_only=True)
+
+    def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse the refresh token, rejecting invalid or expired tokens."""
+        try:
+            attrs["refresh_token"] = RefreshToken(attrs["refresh"])
+        except TokenError as error:
+            raise InvalidToken(error.args[0])
+        return attrs
@@ -0,0 +1,48 @@
+"""API serializers for obtaining and refreshing tokens with permission claims."""
+
+from typing import Any, Dict
+
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from user_management.authentication.permission_claim_token import PermissionClaimRefreshToken
+from user_management.models.user_model import User
+from user_management.services.last_login_buffer_service import LastLoginBufferService
+from user_management.services.token_revocation_service import TokenRevocationService
+
+
+class PermissionClaimTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Serializer for login which issues token pair with admin flag and permission mask claims.
+
+    Last login timestamp is written behind the login by the last login buffer instead of updating the user row.
+    """
+
+    token_class = PermissionClaimRefreshToken
+
+    def validate(self, attrs: Dict[str, Any]) -> Dict[str, str]:
+        """Issue the token pair and buffer last login timestamp of the user."""
+        data: Dict[str, str] = super().validate(attrs)
+        LastLoginBufferService.record_login(self.user.user_id)
+        return data
+
+
+class PermissionClaimTokenRefreshSerializer(TokenRefreshSerializer):
+    """Serializer for refreshing access token with permission claims recomputed from the current user record.
+
+    Logged out refresh tokens and refresh tokens of deactivated users are rejected.
+    """
+
+    token_class = PermissionClaimRefreshToken
+
+    def validate(self, attrs: Dict[str, Any]) -> Dict[str, str]:
+        """Update permission claims of the refresh token before issuing the new access token."""
+        refresh_token: PermissionClaimRefreshToken = self.token_class(attrs["refresh"])
+        if TokenRevocationService.is_token_revoked(refresh_token):
+            raise InvalidToken("Token has been revoked")
+        user: User = User.objects.filter(user_id=refresh_token.payload.get(api_settings.USER_ID_CLAIM)).first()
+        if not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+        refresh_token.set_permission_claims(user)
+        return super().validate({**attrs, "refresh": str(refresh_token)})
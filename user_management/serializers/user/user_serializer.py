@@ -31,6 +31,13 @@ class UserSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Email is already in use.")
         return normalized_email
 
+    def update(self, instance: User, validated_data: Dict[str, Any]) -> User:
+        """Update only the given fields of user, so a last login flushed during the update is not overwritten."""
+        for field_name, value in validated_data.items():
+            setattr(instance, field_name, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
+
     def save(self, **kwargs: Dict[str, Any]) -> User:
         """Save validated data with hash password."""
         if self.validated_data.get('password'):
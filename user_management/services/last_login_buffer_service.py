@@ -0,0 +1,106 @@
+"""Utility service for buffering last login timestamps and writing them to user table in batches."""
+
+import atexit
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+from django.db.models import Case, DateTimeField, Value, When
+from django.utils import timezone
+
+from user_management.models.user_model import User
+
+logger = logging.getLogger(__name__)
+
+
+class LastLoginBufferService:
+    """Function service to record last login timestamps in memory and flush them with a single bulk update.
+
+    Logins only put the timestamp into a per-worker buffer, so a login does not lock the user row. The buffer is
+    flushed by a timer after the configured interval, when it grows to the configured batch size and on worker shutdown.
+    A failed flush puts its timestamps back into the buffer for the next flush. Timestamps still buffered when a worker
+    is killed without a clean shutdown are lost.
+    """
+
+    _lock = threading.Lock()
+    _pending_logins: Dict[int, datetime] = {}
+    _flush_timer: Optional[threading.Timer] = None
+    _exit_handler_registered: bool = False
+
+    @classmethod
+    def record_login(cls, user_id: int, login_date: Optional[datetime] = None) -> None:
+        """Buffer the login timestamp of a user to be written on the next flush."""
+        login_date = login_date or timezone.now()
+        with cls._lock:
+            previous_login_date: Optional[datetime] = cls._pending_logins.get(user_id)
+            if previous_login_date is None or previous_login_date < login_date:
+                cls._pending_logins[user_id] = login_date
+            pending_count: int = len(cls._pending_logins)
+            if not cls._exit_handler_registered:
+                atexit.register(cls.flush)
+                cls._exit_handler_registered = True
+            if cls._flush_timer is None and pending_count < settings.LAST_LOGIN_FLUSH_BATCH_SIZE:
+                cls._flush_timer = threading.Timer(settings.LAST_LOGIN_FLUSH_INTERVAL_SECONDS, cls._flush_on_timer)
+                cls._flush_timer.daemon = True
+                cls._flush_timer.start()
+        if pending_count >= settings.LAST_LOGIN_FLUSH_BATCH_SIZE:
+            cls.flush()
+
+    @classmethod
+    def flush(cls) -> int:
+        """Write every buffered login timestamp with a single update statement and return the number of users.
+
+        If the update fails, the error is logged and the timestamps are merged back into the buffer, so a flush from a
+        login request does not fail the login.
+        """
+        with cls._lock:
+            pending_logins: Dict[int, datetime] = cls._pending_logins
+            cls._pending_logins = {}
+            if cls._flush_timer is not None:
+                cls._flush_timer.cancel()
+                cls._flush_timer = None
+        if not pending_logins:
+            return 0
+        try:
+            User.objects.filter(user_id__in=list(pending_logins)).update(
+                last_login=Case(
+                    *[When(user_id=user_id, then=Value(login_date)) for user_id, login_date in pending_logins.items()],
+                    output_field=DateTimeField(),
+                )
+            )
+        except DatabaseError:
+            logger.exception("Failed to flush last login of %d users", len(pending_logins))
+            cls._restore_pending_logins(pending_logins)
+            return 0
+        return len(pending_logins)
+
+    @classmethod
+    def get_pending_login(cls, user_id: int) -> Optional[datetime]:
+        """Get the login timestamp of a user which is not yet written to user table."""
+        return cls._pending_logins.get(user_id)
+
+    @classmethod
+    def _restore_pending_logins(cls, pending_logins: Dict[int, datetime]) -> None:
+        """Merge timestamps of a failed flush back into the buffer, keeping the latest login of every user."""
+        with cls._lock:
+            for user_id, login_date in pending_logins.items():
+                previous_login_date: Optional[datetime] = cls._pending_logins.get(user_id)
+                if previous_login_date is None or previous_login_date < login_date:
+                    cls._pending_logins[user_id] = login_date
+            if cls._flush_timer is None:
+                cls._flush_timer = threading.Timer(settings.LAST_LOGIN_FLUSH_INTERVAL_SECONDS, cls._flush_on_timer)
+                cls._flush_timer.daemon = True
+                cls._flush_timer.start()
+
+    @classmethod
+    def _flush_on_timer(cls) -> None:
+        """Flush the buffer from the timer thread and release the database connection of the thread."""
+        with cls._lock:
+            cls._flush_timer = None
+        try:
+            cls.flush()
+        finally:
+            connections.close_all()
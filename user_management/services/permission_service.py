@@ -0,0 +1,201 @@
+"""Utility service for resolving and caching effective role permissions of users."""
+
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.request import Request
+
+from user_management.models.user_role_binding_model import UserRoleBinding
+from user_management.models.user_role_model import UserRole
+from user_management.models.user_role_permission_binding_model import UserRolePermissionBinding
+from user_management.models.user_role_permission_model import ActionOptions
+
+PERMISSION_CACHE_KEY_PREFIX = "user_effective_permission"
+PERMISSION_CACHE_TIMEOUT_SECONDS = 60 * 60 * 24
+PERMISSION_LOCAL_CACHE_SIZE = 4096
+
+
+class PermissionService:
+    """Function service to resolve the permission actions a user holds through all assigned roles.
+
+    Each role keeps a permission mask of its assigned permission actions, and the effective permissions of a user are
+    the OR-ed masks of the assigned roles. The user mask is cached in the shared django cache and in an in-process
+    LRU cache. Both cache layers are keyed with a global version and a per-user version, so stale entries are never
+    read after invalidation. Versions expire after a short interval and are then replaced by new ones, so a worker
+    whose cache is local to its process, and which never sees the invalidations of other workers, reloads permissions
+    within that interval, and LRU cache entries are never reused past it. Role masks are refreshed and the affected
+    users are invalidated whenever role or role permission bindings change.
+    """
+
+    @classmethod
+    def has_action(cls, user_id: Optional[int], action: str) -> bool:
+        """Check if the user holds the given permission action or the all type permission."""
+        if user_id is None:
+            return False
+        return ActionOptions.has_permission_bit(cls.get_user_permission_mask(user_id), action)
+
+    @classmethod
+    def has_request_permission(cls, request: Request, action: str) -> bool:
+        """Check permission of the request user with the permission mask loaded once per request.
+
+        Token principals already carry the permission mask, so the cache is only read for user records.
+        """
+        if request.user.is_anonymous:
+            return False
+        permission_mask: Optional[int] = getattr(request.user, "permission_mask", None)
+        if permission_mask is None:
+            permission_mask = getattr(request, "_user_permission_mask", None)
+        if permission_mask is None:
+            permission_mask = cls.get_user_permission_mask(request.user.user_id)
+            request._user_permission_mask = permission_mask
+        return ActionOptions.has_permission_bit(permission_mask, action)
+
+    @classmethod
+    def get_user_permission_mask(cls, user_id: int) -> int:
+        """Get the OR-ed permission mask of all roles assigned to a user from cache or database on cache miss."""
+        global_version_key: str = cls._get_global_version_key()
+        user_version_key: str = cls._get_user_version_key(user_id)
+        versions = cache.get_many([global_version_key, user_version_key])
+        if len(versions) != 2:
+            cache.add(global_version_key, time.time_ns(), settings.PERMISSION_CACHE_VERSION_SECONDS)
+            cache.add(user_version_key, time.time_ns(), settings.PERMISSION_CACHE_VERSION_SECONDS)
+            versions = {
+                global_version_key: time.time_ns(),
+                user_version_key: time.time_ns(),
+                **cache.get_many([global_version_key, user_version_key]),
+            }
+        return cls._load_user_permission_mask(user_id, versions[global_version_key], versions[user_version_key])
+
+    @classmethod
+    def invalidate_all(cls) -> None:
+        """Invalidate cached permissions of every user, e.g. when a role permission assignment has changed."""
+        cls._bump_version(cls._get_global_version_key())
+
+    @classmethod
+    def invalidate_user(cls, user_id: int) -> None:
+        """Invalidate cached permissions of a single user, e.g. when the user role assignment has changed."""
+        cls._bump_version(cls._get_user_version_key(user_id))
+
+    @classmethod
+    def invalidate_all_on_commit(cls) -> None:
+        """Invalidate every user now and again after commit so concurrent readers can not cache uncommitted state."""
+        cls.invalidate_all()
+        transaction.on_commit(cls.invalidate_all)
+
+    @classmethod
+    def invalidate_user_on_commit(cls, user_id: int) -> None:
+        """Invalidate a user now and again after commit so concurrent readers can not cache uncommitted state."""
+        cls.invalidate_user(user_id)
+        transaction.on_commit(lambda: cls.invalidate_user(user_id))
+
+    @classmethod
+    def refresh_role_permission_masks(cls, role_ids: Iterable[int]) -> None:
+        """Recompute permission masks of the given roles from their current role permission bindings."""
+        role_permission_masks: Dict[int, int] = {role_id: 0 for role_id in role_ids if role_id is not None}
+        if not role_permission_masks:
+            return
+        for role_id, action in UserRolePermissionBinding.objects.filter(
+            role_id__in=list(role_permission_masks)
+        ).values_list("role_id", "permission_id__action"):
+            role_permission_masks[role_id] |= ActionOptions.get_permission_bit(action)
+        UserRole.objects.bulk_update(
+            [
+                UserRole(role_id=role_id, permission_mask=permission_mask)
+                for role_id, permission_mask in role_permission_masks.items()
+            ],
+            ["permission_mask"],
+        )
+
+    @classmethod
+    def invalidate_users_on_commit(cls, user_ids: Iterable[Optional[int]]) -> None:
+        """Invalidate cached permissions of the given users now and again after commit."""
+        for user_id in {user_id for user_id in user_ids if user_id is not None}:
+            cls.invalidate_user_on_commit(user_id)
+
+    @classmethod
+    def rebuild_role_permission_masks(cls, dry_run: bool = False) -> Dict[int, Tuple[int, int]]:
+        """Rebuild permission masks of every role from role permission bindings and report drifted masks.
+
+        Return the stored and the expected permission mask of every role whose mask has drifted.
+        """
+        with transaction.atomic():
+            stored_permission_masks: Dict[int, int] = dict(
+                UserRole.objects.select_for_update().order_by("role_id").values_list("role_id", "permission_mask")
+            )
+            expected_permission_masks: Dict[int, int] = {role_id: 0 for role_id in stored_permission_masks}
+            for role_id, action in UserRolePermissionBinding.objects.values_list("role_id", "permission_id__action"):
+                expected_permission_masks[role_id] |= ActionOptions.get_permission_bit(action)
+            drifted_permission_masks: Dict[int, Tuple[int, int]] = {
+                role_id: (stored_permission_mask, expected_permission_masks[role_id])
+                for role_id, stored_permission_mask in stored_permission_masks.items()
+                if stored_permission_mask != expected_permission_masks[role_id]
+            }
+            if not dry_run and drifted_permission_masks:
+                UserRole.objects.bulk_update(
+                    [
+                        UserRole(role_id=role_id, permission_mask=expected_permission_mask)
+                        for role_id, (_, expected_permission_mask) in drifted_permission_masks.items()
+                    ],
+                    ["permission_mask"],
+                )
+                cls.invalidate_all_on_commit()
+        return drifted_permission_masks
+
+    @staticmethod
+    def get_role_user_ids(role_ids: Iterable[int]) -> Set[int]:
+        """Get users who are assigned to any of the given roles."""
+        return set(UserRoleBinding.objects.filter(role_id__in=role_ids).values_list("user_id", flat=True))
+
+    @staticmethod
+    def get_permission_role_ids(permission_id: int) -> Set[int]:
+        """Get roles which are assigned with the given permission."""
+        return set(
+            UserRolePermissionBinding.objects.filter(permission_id=permission_id).values_list("role_id", flat=True)
+        )
+
+    @staticmethod
+    def get_permission_user_ids(permission_id: int) -> Set[int]:
+        """Get users who hold the given permission through any of their assigned roles."""
+        return set(
+            UserRoleBinding.objects.filter(role_id__userrolepermissionbinding__permission_id=permission_id).values_list(
+                "user_id", flat=True
+            )
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=PERMISSION_LOCAL_CACHE_SIZE)
+    def _load_user_permission_mask(user_id: int, global_version: int, user_version: int) -> int:
+        """Load user permission mask from shared cache or OR the masks of assigned roles with one query."""
+        shared_cache_key = f"{PERMISSION_CACHE_KEY_PREFIX}:{global_version}:{user_version}:{user_id}"
+        permission_mask: Optional[int] = cache.get(shared_cache_key)
+        if permission_mask is not None:
+            return permission_mask
+        permission_mask = 0
+        for role_permission_mask in UserRoleBinding.objects.filter(user_id=user_id).values_list(
+            "role_id__permission_mask", flat=True
+        ):
+            permission_mask |= role_permission_mask
+        cache.set(shared_cache_key, permission_mask, PERMISSION_CACHE_TIMEOUT_SECONDS)
+        return permission_mask
+
+    @staticmethod
+    def _bump_version(version_key: str) -> None:
+        """Move a cache version forward so every entry cached under the previous version is ignored."""
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, time.time_ns(), settings.PERMISSION_CACHE_VERSION_SECONDS)
+
+    @staticmethod
+    def _get_global_version_key() -> str:
+        """Get cache key of the version shared by every user permission entry."""
+        return f"{PERMISSION_CACHE_KEY_PREFIX}:version"
+
+    @staticmethod
+    def _get_user_version_key(user_id: int) -> str:
+        """Get cache key of the version of a single user permission entry."""
+        return f"{PERMISSION_CACHE_KEY_PREFIX}:version:{user_id}"
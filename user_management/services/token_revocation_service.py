@@ -0,0 +1,165 @@
+"""Utility service for revoking tokens and rejecting revoked tokens with a per-worker Bloom filter."""
+
+import hashlib
+import threading
+import time
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Iterable, Optional
+
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from user_management.models.revoked_token_model import RevokedToken
+
+REVOCATION_FILTER_SIZE_BITS = 1 << 23
+REVOCATION_FILTER_HASH_COUNT = 7
+REVOCATION_FILTER_REFRESH_INTERVAL_SECONDS = 5
+# Revocations committed out of primary key order are still picked up by re-reading this window on each refresh.
+REVOCATION_FILTER_REFRESH_OVERLAP = timedelta(minutes=1)
+
+
+class BloomFilter:
+    """Fixed size Bloom filter answering whether a key was possibly added or definitely not added."""
+
+    def __init__(self, size_bits: int, hash_count: int) -> None:
+        """Create an empty filter with the given number of bits and hash functions."""
+        self.size_bits = size_bits
+        self.hash_count = hash_count
+        self.bits = bytearray((size_bits + 7) // 8)
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter."""
+        for bit_position in self._get_bit_positions(key):
+            self.bits[bit_position >> 3] |= 1 << (bit_position & 7)
+
+    def might_contain(self, key: str) -> bool:
+        """Check if the key was possibly added, false positives are possible but false negatives are not."""
+        return all(
+            self.bits[bit_position >> 3] & (1 << (bit_position & 7)) for bit_position in self._get_bit_positions(key)
+        )
+
+    def _get_bit_positions(self, key: str) -> Iterable[int]:
+        """Derive bit positions of a key from two halves of one digest with double hashing."""
+        digest: bytes = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first_hash: int = int.from_bytes(digest[:8], "little")
+        second_hash: int = int.from_bytes(digest[8:], "little") | 1
+        return ((first_hash + index * second_hash) % self.size_bits for index in range(self.hash_count))
+
+
+class TokenRevocationService:
+    """Function service to revoke tokens and check token revocation.
+
+    Each worker keeps a Bloom filter of revoked token ids and revoked users, refreshed incrementally from the revoked
+    token table at most every few seconds. Only tokens reported as possibly revoked by the filter are checked exactly
+    against the database, so accepting a valid token costs no query. Revocations made by other workers are seen after
+    the next filter refresh. Every revocation expires with the last token it revokes, so expired revocations are left
+    out of the filter and purged from the table by a periodic job.
+    """
+
+    _lock = threading.Lock()
+    _revocation_filter: Optional[BloomFilter] = None
+    _refreshed_date: Optional[datetime] = None
+    _next_refresh_time: float = 0.0
+
+    @classmethod
+    def revoke_token(cls, token: Token) -> None:
+        """Revoke a single token by its jti claim until the token expires."""
+        jti: str = token[api_settings.JTI_CLAIM]
+        user_id: int = int(token[api_settings.USER_ID_CLAIM])
+        expires_date: datetime = datetime.fromtimestamp(token["exp"], tz=dt_timezone.utc)
+        RevokedToken.objects.create(jti=jti, user_id_id=user_id, expires_date=expires_date)
+        cls._add_revocation_keys(jti, None)
+
+    @classmethod
+    def revoke_user(cls, user_id: int) -> None:
+        """Revoke every token of the user issued until now, until the longest lived of those tokens expires."""
+        RevokedToken.objects.create(user_id_id=user_id, expires_date=timezone.now() + cls.get_max_token_lifetime())
+        cls._add_revocation_keys(None, user_id)
+
+    @classmethod
+    def is_token_revoked(cls, token: Token) -> bool:
+        """Check if the token or its user has been revoked, querying database only on a possible filter hit."""
+        jti: Optional[str] = token.get(api_settings.JTI_CLAIM)
+        user_id: Optional[str] = token.get(api_settings.USER_ID_CLAIM)
+        revocation_filter: BloomFilter = cls._get_revocation_filter()
+        possibly_revoked_token: bool = jti is not None and revocation_filter.might_contain(cls._get_token_key(jti))
+        possibly_revoked_user: bool = user_id is not None and revocation_filter.might_contain(
+            cls._get_user_key(user_id)
+        )
+        if not possibly_revoked_token and not possibly_revoked_user:
+            return False
+
+        revoked_condition = Q()
+        if possibly_revoked_token:
+            revoked_condition |= Q(jti=jti)
+        if possibly_revoked_user:
+            issued_date: datetime = datetime.fromtimestamp(token.get("iat", 0), tz=dt_timezone.utc)
+            revoked_condition |= Q(user_id=user_id, jti__isnull=True, revoked_date__gte=issued_date)
+        return RevokedToken.objects.filter(revoked_condition).exists()
+
+    @classmethod
+    def purge_expired_revocations(cls, now: Optional[datetime] = None) -> int:
+        """Delete revocations whose revoked tokens have all expired and return the number of deleted revocations."""
+        deleted_count, _ = RevokedToken.objects.filter(expires_date__lte=now or timezone.now()).delete()
+        return deleted_count
+
+    @staticmethod
+    def get_max_token_lifetime() -> timedelta:
+        """Get the lifetime of the longest lived token type."""
+        return max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME)
+
+    @classmethod
+    def reset_revocation_filter(cls) -> None:
+        """Drop the worker filter so that it is fully rebuilt from the revoked token table on next check."""
+        with cls._lock:
+            cls._revocation_filter = None
+            cls._refreshed_date = None
+            cls._next_refresh_time = 0.0
+
+    @classmethod
+    def _get_revocation_filter(cls) -> BloomFilter:
+        """Get the worker filter after refreshing it with revocations recorded since the previous refresh."""
+        if time.monotonic() < cls._next_refresh_time and cls._revocation_filter is not None:
+            return cls._revocation_filter
+        with cls._lock:
+            if cls._revocation_filter is None:
+                cls._revocation_filter = BloomFilter(REVOCATION_FILTER_SIZE_BITS, REVOCATION_FILTER_HASH_COUNT)
+            refresh_start_date: datetime = timezone.now()
+            revoked_tokens = RevokedToken.objects.filter(
+                Q(expires_date__isnull=True) | Q(expires_date__gt=refresh_start_date)
+            )
+            if cls._refreshed_date is not None:
+                revoked_tokens = revoked_tokens.filter(
+                    revoked_date__gte=cls._refreshed_date - REVOCATION_FILTER_REFRESH_OVERLAP
+                )
+            for jti, user_id in revoked_tokens.order_by().values_list("jti", "user_id").iterator():
+                cls._add_revocation_keys(jti, None if jti else user_id, revocation_filter=cls._revocation_filter)
+            cls._refreshed_date = refresh_start_date
+            cls._next_refresh_time = time.monotonic() + REVOCATION_FILTER_REFRESH_INTERVAL_SECONDS
+            return cls._revocation_filter
+
+    @classmethod
+    def _add_revocation_keys(
+        cls, jti: Optional[str], user_id: Optional[int], revocation_filter: Optional[BloomFilter] = None
+    ) -> None:
+        """Add revoked token id or revoked user into the worker filter."""
+        revocation_filter = revocation_filter or cls._revocation_filter
+        if revocation_filter is None:
+            return
+        if jti:
+            revocation_filter.add(cls._get_token_key(jti))
+        if user_id is not None:
+            revocation_filter.add(cls._get_user_key(user_id))
+
+    @staticmethod
+    def _get_token_key(jti: str) -> str:
+        """Get filter key of a revoked token id."""
+        return f"jti:{jti}"
+
+    @staticmethod
+    def _get_user_key(user_id: int) -> str:
+        """Get filter key of a revoked user."""
+        return f"user:{user_id}"
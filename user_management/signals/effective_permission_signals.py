@@ -0,0 +1,97 @@
+"""Signal receivers for maintaining role permission masks and cached effective permissions of users.
+
+Role deletions are covered by the cascaded deletion signals of their role bindings and role permission bindings.
+"""
+
+from typing import Any, Dict, Type
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from user_management.models.user_model import User
+from user_management.models.user_role_binding_model import UserRoleBinding
+from user_management.models.user_role_permission_binding_model import UserRolePermissionBinding
+from user_management.models.user_role_permission_model import UserRolePermission
+from user_management.services.permission_service import PermissionService
+
+
+@receiver(post_save, sender=User, dispatch_uid="invalidate_permission_cache_on_user_created")
+def invalidate_permission_cache_on_user_created(
+    sender: Type[User], instance: User, created: bool, **kwargs: Dict[str, Any]
+) -> None:
+    """Start a newly created user with a clean permission cache entry."""
+    if created:
+        PermissionService.invalidate_user(instance.user_id)
+
+
+@receiver(pre_save, sender=UserRoleBinding, dispatch_uid="remember_previous_role_binding_user")
+def remember_previous_role_binding_user(
+    sender: Type[UserRoleBinding], instance: UserRoleBinding, raw: bool, **kwargs: Dict[str, Any]
+) -> None:
+    """Keep the previously assigned user so the user can be refreshed when the assignment is moved."""
+    if not raw and not instance._state.adding:
+        instance._previous_user_id = (
+            UserRoleBinding.objects.filter(pk=instance.pk).values_list("user_id", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=UserRoleBinding, dispatch_uid="invalidate_permissions_on_role_binding_saved")
+def invalidate_permissions_on_role_binding_saved(
+    sender: Type[UserRoleBinding], instance: UserRoleBinding, raw: bool, **kwargs: Dict[str, Any]
+) -> None:
+    """Refresh permissions of the assigned user and the previously assigned user."""
+    if not raw:
+        PermissionService.invalidate_users_on_commit(
+            [instance.user_id_id, getattr(instance, "_previous_user_id", None)]
+        )
+
+
+@receiver(post_delete, sender=UserRoleBinding, dispatch_uid="invalidate_permissions_on_role_binding_deleted")
+def invalidate_permissions_on_role_binding_deleted(
+    sender: Type[UserRoleBinding], instance: UserRoleBinding, **kwargs: Dict[str, Any]
+) -> None:
+    """Refresh permissions of the user whose role assignment has been removed."""
+    PermissionService.invalidate_users_on_commit([instance.user_id_id])
+
+
+@receiver(pre_save, sender=UserRolePermissionBinding, dispatch_uid="remember_previous_permission_binding_role")
+def remember_previous_permission_binding_role(
+    sender: Type[UserRolePermissionBinding], instance: UserRolePermissionBinding, raw: bool, **kwargs: Dict[str, Any]
+) -> None:
+    """Keep the previously assigned role so its users can be refreshed when the assignment is moved."""
+    if not raw and not instance._state.adding:
+        instance._previous_role_id = (
+            UserRolePermissionBinding.objects.filter(pk=instance.pk).values_list("role_id", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=UserRolePermissionBinding, dispatch_uid="invalidate_permissions_on_binding_saved")
+def invalidate_permissions_on_permission_binding_saved(
+    sender: Type[UserRolePermissionBinding], instance: UserRolePermissionBinding, raw: bool, **kwargs: Dict[str, Any]
+) -> None:
+    """Refresh permission masks of the role and the previously assigned role and permissions of their users."""
+    if not raw:
+        changed_role_ids = [instance.role_id_id, getattr(instance, "_previous_role_id", None)]
+        PermissionService.refresh_role_permission_masks(changed_role_ids)
+        PermissionService.invalidate_users_on_commit(PermissionService.get_role_user_ids(changed_role_ids))
+
+
+@receiver(post_delete, sender=UserRolePermissionBinding, dispatch_uid="invalidate_permissions_on_binding_deleted")
+def invalidate_permissions_on_permission_binding_deleted(
+    sender: Type[UserRolePermissionBinding], instance: UserRolePermissionBinding, **kwargs: Dict[str, Any]
+) -> None:
+    """Refresh permission mask of the role that lost the permission and permissions of its users."""
+    PermissionService.refresh_role_permission_masks([instance.role_id_id])
+    PermissionService.invalidate_users_on_commit(PermissionService.get_role_user_ids([instance.role_id_id]))
+
+
+@receiver(post_save, sender=UserRolePermission, dispatch_uid="invalidate_permissions_on_permission_saved")
+def invalidate_permissions_on_permission_saved(
+    sender: Type[UserRolePermission], instance: UserRolePermission, created: bool, raw: bool, **kwargs: Dict[str, Any]
+) -> None:
+    """Refresh permission masks of roles and permissions of users holding the permission when its action changed."""
+    if not raw and not created:
+        PermissionService.refresh_role_permission_masks(
+            PermissionService.get_permission_role_ids(instance.permission_id)
+        )
+        PermissionService.invalidate_users_on_commit(PermissionService.get_permission_user_ids(instance.permission_id))
@@ -0,0 +1,29 @@
+"""Signal receivers for revoking tokens of deactivated users."""
+
+from typing import Any, Dict, FrozenSet, Optional, Type
+
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from user_management.models.user_model import User
+from user_management.services.token_revocation_service import TokenRevocationService
+
+
+@receiver(pre_save, sender=User, dispatch_uid="remember_previous_user_active_status")
+def remember_previous_user_active_status(
+    sender: Type[User], instance: User, raw: bool, update_fields: Optional[FrozenSet[str]], **kwargs: Dict[str, Any]
+) -> None:
+    """Keep the previous active status so tokens are revoked only when the user is deactivated."""
+    if raw or instance._state.adding or (update_fields is not None and "is_active" not in update_fields):
+        return
+    instance._previous_is_active = User.objects.filter(pk=instance.pk).values_list("is_active", flat=True).first()
+
+
+@receiver(post_save, sender=User, dispatch_uid="revoke_tokens_on_user_deactivated")
+def revoke_tokens_on_user_deactivated(
+    sender: Type[User], instance: User, created: bool, raw: bool, **kwargs: Dict[str, Any]
+) -> None:
+    """Revoke every token issued to the user when the user is deactivated."""
+    previous_is_active: bool = instance.__dict__.pop("_previous_is_active", False)
+    if not raw and not created and previous_is_active and not instance.is_active:
+        TokenRevocationService.revoke_user(instance.user_id)
@@ -0,0 +1,96 @@
+"""Unittest for access policies compiled into dispatch tables."""
+
+from io import StringIO
+from types import SimpleNamespace
+from typing import Any, List
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from rest_access_policy import AccessPolicy
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from user_management.access_policies.compiled_access_policy import CompiledAccessPolicy
+from user_management.access_policies.user_viewset_access_policy import UserViewSetAccessPolicy
+from user_management.management.commands.benchmark_access_policies import BENCHMARK_ACTIONS, BENCHMARK_POLICIES
+
+
+class GroupAccessPolicy(CompiledAccessPolicy):
+    """Access policy with group principal which can only be evaluated from statements."""
+
+    statements = [{"action": ["*"], "principal": "group:clerk", "effect": "allow"}]
+
+
+class DenyAccessPolicy(CompiledAccessPolicy):
+    """Access policy denying destroy action after allowing every action."""
+
+    statements = [
+        {"action": ["*"], "principal": "*", "effect": "allow"},
+        {"action": ["destroy"], "principal": "authenticated", "effect": "deny"},
+    ]
+
+
+class TestCompiledAccessPolicy(SimpleTestCase):
+    """Test case for evaluating access policy statements with compiled dispatch tables."""
+
+    def make_request(self, principal: Any) -> Request:
+        """Create a request of the given principal."""
+        request = Request(APIRequestFactory().get("/"))
+        request.user = principal
+        return request
+
+    def make_view(self, action: str, fetched_objects: List[str]) -> SimpleNamespace:
+        """Create a view of the given action recording every object fetch."""
+
+        def get_object() -> SimpleNamespace:
+            fetched_objects.append(action)
+            return SimpleNamespace(user_id=1, user_id_id=1)
+
+        return SimpleNamespace(action=action, action_map={}, get_object=get_object)
+
+    def test_same_decision_as_statements(self) -> None:
+        """Test deciding every action of every policy the same way as drf-access-policy statements."""
+        principals = [
+            SimpleNamespace(user_id=1, pk=1, is_admin=True, is_anonymous=False, permission_mask=0),
+            SimpleNamespace(user_id=1, pk=1, is_admin=False, is_anonymous=False, permission_mask=0),
+            SimpleNamespace(user_id=2, pk=2, is_admin=False, is_anonymous=False, permission_mask=4),
+            SimpleNamespace(user_id=None, pk=None, is_admin=False, is_anonymous=True, permission_mask=0),
+        ]
+        for policy_class in [*BENCHMARK_POLICIES, DenyAccessPolicy]:
+            self.assertIsNotNone(policy_class._dispatch_table)
+            for action in [*BENCHMARK_ACTIONS, "unknown"]:
+                for principal in principals:
+                    request: Request = self.make_request(principal)
+                    view = self.make_view(action, [])
+                    with self.subTest(policy=policy_class.__name__, action=action, user_id=principal.user_id):
+                        self.assertEqual(
+                            policy_class().has_permission(request, view),
+                            AccessPolicy.has_permission(policy_class(), request, view),
+                        )
+
+    def test_admin_short_circuit_before_object_fetch(self) -> None:
+        """Test allowing admin by in-memory condition without evaluating condition that fetches the object."""
+        fetched_objects: List[str] = []
+        admin = SimpleNamespace(user_id=2, pk=2, is_admin=True, is_anonymous=False)
+        self.assertTrue(
+            UserViewSetAccessPolicy().has_permission(
+                self.make_request(admin), self.make_view("update", fetched_objects)
+            )
+        )
+        self.assertEqual(fetched_objects, [])
+
+    def test_deny_statement(self) -> None:
+        """Test denying an action even though an earlier statement allows it."""
+        user = SimpleNamespace(user_id=1, pk=1, is_admin=False, is_anonymous=False)
+        self.assertFalse(DenyAccessPolicy().has_permission(self.make_request(user), self.make_view("destroy", [])))
+        self.assertTrue(DenyAccessPolicy().has_permission(self.make_request(user), self.make_view("update", [])))
+
+    def test_fall_back_to_statements(self) -> None:
+        """Test leaving statements that can not be compiled to drf-access-policy."""
+        self.assertIsNone(GroupAccessPolicy._dispatch_table)
+
+    def test_benchmark_command(self) -> None:
+        """Test comparing evaluation time of statements and dispatch tables of every policy."""
+        output = StringIO()
+        call_command("benchmark_access_policies", "--iterations", "1", stdout=output)
+        self.assertIn("Compiled dispatch is", output.getvalue())
@@ -0,0 +1,83 @@
+"""Unittest for stateless JWT authentication with permission claims."""
+
+from django.urls import reverse
+from model_bakery.recipe import Recipe
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from rental_management.access_policies.global_api_access_policy import GlobalApiAccessPolicy
+from user_management.authentication.permission_claim_authentication import PermissionClaimJWTAuthentication
+from user_management.authentication.permission_claim_token import PermissionClaimTokenUser
+from user_management.models.user_model import User
+from user_management.models.user_role_binding_model import UserRoleBinding
+from user_management.models.user_role_model import UserRole
+from user_management.models.user_role_permission_binding_model import UserRolePermissionBinding
+from user_management.models.user_role_permission_model import ActionOptions, UserRolePermission
+
+
+class TestPermissionClaimAuthentication(APITestCase):
+    """Test case for issuing and authenticating tokens carrying admin flag and permission mask claims."""
+
+    fixtures = ['fixtures/user_role_permission.json']
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data."""
+        cls.password = "test_password"
+        cls.user: User = User.objects.create_user(
+            username="clerk", password=cls.password, email="clerk@email.com", age=20, first_name="a", last_name="b"
+        )
+        cls.create_role: UserRole = Recipe(UserRole).make()
+        create_permission: UserRolePermission = UserRolePermission.objects.filter(
+            action=ActionOptions.CREATE.value
+        ).first()
+        Recipe(UserRolePermissionBinding, role_id=cls.create_role, permission_id=create_permission).make()
+        Recipe(UserRoleBinding, user_id=cls.user, role_id=cls.create_role).make()
+
+    def login(self) -> Response:
+        """Login with test user credential."""
+        return self.client.post(
+            reverse("token_obtain"), data={"username": self.user.username, "password": self.password}
+        )
+
+    def authenticate(self, access_token: str) -> PermissionClaimTokenUser:
+        """Authenticate a request with the given access token by stateless authentication."""
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {access_token}")
+        principal, _ = PermissionClaimJWTAuthentication().authenticate(request)
+        return principal
+
+    def test_authenticate_without_query(self) -> None:
+        """Test resolving request principal and its permissions from token claims without database query."""
+        login_response: Response = self.login()
+        self.assertEqual(login_response.status_code, status.HTTP_200_OK)
+        # The first authentication of the worker loads the token revocation filter.
+        self.authenticate(login_response.data["access"])
+
+        with self.assertNumQueries(0):
+            principal: PermissionClaimTokenUser = self.authenticate(login_response.data["access"])
+            self.assertIsInstance(principal, PermissionClaimTokenUser)
+            self.assertEqual(principal.user_id, self.user.user_id)
+            self.assertFalse(principal.is_admin)
+            self.assertTrue(ActionOptions.has_permission_bit(principal.permission_mask, ActionOptions.CREATE.value))
+
+            request = APIRequestFactory().post("/")
+            request.user = principal
+            policy = GlobalApiAccessPolicy()
+            self.assertTrue(policy.has_role_permission(request, None, "create"))
+            self.assertFalse(policy.has_role_permission(request, None, "destroy"))
+            self.assertFalse(policy.is_admin(request, None, "create"))
+
+    def test_refresh_token_with_updated_permission_claims(self) -> None:
+        """Test recomputing permission claims from user record when refreshing access token."""
+        login_response: Response = self.login()
+        UserRoleBinding.objects.filter(user_id=self.user).delete()
+        User.objects.filter(user_id=self.user.user_id).update(is_admin=True)
+
+        refresh_response: Response = self.client.post(
+            reverse("token_refresh"), data={"refresh": login_response.data["refresh"]}
+        )
+        self.assertEqual(refresh_response.status_code, status.HTTP_200_OK)
+        principal: PermissionClaimTokenUser = self.authenticate(refresh_response.data["access"])
+        self.assertTrue(principal.is_admin)
+        self.assertEqual(principal.permission_mask, 0)
@@ -0,0 +1,100 @@
+"""Unittest for last login buffer service."""
+
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from user_management.models.user_model import User
+from user_management.serializers.user.user_serializer import UserSerializer
+from user_management.services.last_login_buffer_service import LastLoginBufferService
+from user_management.tests.baker_recipe.user_recipe import normal_user_recipe
+
+
+class TestLastLoginBufferService(TestCase):
+    """Test case for buffering last login timestamps and flushing them in batches."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data."""
+        cls.password = "test_password"
+        cls.user: User = User.objects.create_user(
+            username="reader", password=cls.password, email="reader@email.com", age=20, first_name="a", last_name="b"
+        )
+        cls.other_user: User = normal_user_recipe.make()
+
+    def setUp(self) -> None:
+        """Start every test with an empty buffer."""
+        LastLoginBufferService.flush()
+
+    def test_login_without_updating_user(self) -> None:
+        """Test buffering last login on login and writing it on flush."""
+        response = self.client.post(
+            reverse("token_obtain"), data={"username": self.user.username, "password": self.password}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.last_login)
+        self.assertIsNotNone(LastLoginBufferService.get_pending_login(self.user.user_id))
+
+        self.assertEqual(LastLoginBufferService.flush(), 1)
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
+        self.assertIsNone(LastLoginBufferService.get_pending_login(self.user.user_id))
+
+    def test_flush_logins_with_single_update(self) -> None:
+        """Test writing the latest buffered login of every user with a single update statement."""
+        login_date: datetime = timezone.now()
+        LastLoginBufferService.record_login(self.user.user_id, login_date)
+        LastLoginBufferService.record_login(self.user.user_id, login_date - timedelta(minutes=1))
+        LastLoginBufferService.record_login(self.other_user.user_id, login_date - timedelta(minutes=2))
+        with self.assertNumQueries(1):
+            self.assertEqual(LastLoginBufferService.flush(), 2)
+        self.user.refresh_from_db()
+        self.other_user.refresh_from_db()
+        self.assertEqual(self.user.last_login, login_date)
+        self.assertEqual(self.other_user.last_login, login_date - timedelta(minutes=2))
+
+    @override_settings(LAST_LOGIN_FLUSH_BATCH_SIZE=2)
+    def test_flush_when_batch_is_full(self) -> None:
+        """Test flushing the buffer as soon as it reaches the batch size."""
+        LastLoginBufferService.record_login(self.user.user_id)
+        LastLoginBufferService.record_login(self.other_user.user_id)
+        self.assertIsNone(LastLoginBufferService.get_pending_login(self.user.user_id))
+        self.assertIsNotNone(User.objects.get(user_id=self.other_user.user_id).last_login)
+
+    def test_update_user_without_touching_last_login(self) -> None:
+        """Test saving user without rewriting last login."""
+        self.user.first_name = "updated"
+        self.user.save()
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.last_login)
+
+    @override_settings(LAST_LOGIN_FLUSH_BATCH_SIZE=1)
+    def test_keep_logins_of_failed_flush(self) -> None:
+        """Test keeping buffered logins when the flush from a login fails and writing them on the next flush."""
+        login_date: datetime = timezone.now()
+        with transaction.atomic():
+            transaction.set_rollback(True)
+            with self.assertLogs("user_management.services.last_login_buffer_service", level="ERROR"):
+                LastLoginBufferService.record_login(self.user.user_id, login_date)
+        self.assertEqual(LastLoginBufferService.get_pending_login(self.user.user_id), login_date)
+
+        self.assertEqual(LastLoginBufferService.flush(), 1)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.last_login, login_date)
+
+    def test_update_user_without_overwriting_flushed_last_login(self) -> None:
+        """Test updating user through serializer without rewriting last login flushed after the user was loaded."""
+        login_date: datetime = timezone.now()
+        LastLoginBufferService.record_login(self.user.user_id, login_date)
+        LastLoginBufferService.flush()
+        user_serializer = UserSerializer(self.user, data={"first_name": "updated"}, partial=True)
+        user_serializer.is_valid(raise_exception=True)
+        user_serializer.save()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, "updated")
+        self.assertEqual(self.user.last_login, login_date)
@@ -0,0 +1,133 @@
+"""Unittest for user effective permission service."""
+
+import time
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from model_bakery.recipe import Recipe
+
+from user_management.models.user_model import User
+from user_management.models.user_role_binding_model import UserRoleBinding
+from user_management.models.user_role_model import UserRole
+from user_management.models.user_role_permission_binding_model import UserRolePermissionBinding
+from user_management.models.user_role_permission_model import ActionOptions, UserRolePermission
+from user_management.services.permission_service import PermissionService
+from user_management.tests.baker_recipe.user_recipe import normal_user_recipe
+
+
+class TestPermissionService(TestCase):
+    """Test case for resolving and caching user effective permissions."""
+
+    fixtures = ['fixtures/user_role_permission.json']
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data."""
+        cls.update_role: UserRole = Recipe(UserRole).make()
+        cls.update_permission: UserRolePermission = UserRolePermission.objects.filter(
+            action=ActionOptions.UPDATE.value
+        ).first()
+        cls.delete_permission: UserRolePermission = UserRolePermission.objects.filter(
+            action=ActionOptions.DELETE.value
+        ).first()
+        Recipe(UserRolePermissionBinding, role_id=cls.update_role, permission_id=cls.update_permission).make()
+        cls.user: User = normal_user_recipe.make()
+        cls.role_binding: UserRoleBinding = Recipe(UserRoleBinding, user_id=cls.user, role_id=cls.update_role).make()
+
+    def test_get_user_permission_mask_from_assigned_roles(self) -> None:
+        """Test resolving permission mask of user from assigned roles."""
+        self.update_role.refresh_from_db()
+        self.assertEqual(self.update_role.permission_mask, ActionOptions.get_permission_bit(ActionOptions.UPDATE))
+        self.assertEqual(
+            PermissionService.get_user_permission_mask(self.user.user_id),
+            ActionOptions.get_permission_mask([ActionOptions.UPDATE.value]),
+        )
+        self.assertTrue(PermissionService.has_action(self.user.user_id, ActionOptions.UPDATE.value))
+        self.assertFalse(PermissionService.has_action(self.user.user_id, ActionOptions.DELETE.value))
+        self.assertFalse(PermissionService.has_action(None, ActionOptions.UPDATE.value))
+
+    def test_cached_user_actions_without_query(self) -> None:
+        """Test checking permission without database query after the cache is warmed up."""
+        PermissionService.get_user_permission_mask(self.user.user_id)
+        with self.assertNumQueries(0):
+            self.assertTrue(PermissionService.has_action(self.user.user_id, ActionOptions.UPDATE.value))
+
+    def test_invalidate_cache_on_role_permission_binding_changed(self) -> None:
+        """Test invalidating cached permissions when a permission is assigned to user role."""
+        self.assertFalse(PermissionService.has_action(self.user.user_id, ActionOptions.DELETE.value))
+        Recipe(UserRolePermissionBinding, role_id=self.update_role, permission_id=self.delete_permission).make()
+        self.assertTrue(PermissionService.has_action(self.user.user_id, ActionOptions.DELETE.value))
+        self.update_role.refresh_from_db()
+        self.assertEqual(
+            self.update_role.permission_mask,
+            ActionOptions.get_permission_mask([ActionOptions.UPDATE.value, ActionOptions.DELETE.value]),
+        )
+
+    def test_all_type_permission_mask(self) -> None:
+        """Test granting every action with the all type permission bit."""
+        all_permission_mask: int = ActionOptions.get_permission_mask([ActionOptions.ALL.value])
+        for action in ActionOptions.values:
+            self.assertTrue(ActionOptions.has_permission_bit(all_permission_mask, action))
+        self.assertFalse(ActionOptions.has_permission_bit(0, ActionOptions.READ_ALL.value))
+        self.assertFalse(ActionOptions.has_permission_bit(ActionOptions.get_permission_mask(["UNKNOWN"]), ""))
+
+    def test_invalidate_cache_on_role_binding_deleted(self) -> None:
+        """Test invalidating cached permissions when a role is unassigned from user."""
+        self.assertTrue(PermissionService.has_action(self.user.user_id, ActionOptions.UPDATE.value))
+        self.role_binding.delete()
+        self.assertFalse(PermissionService.has_action(self.user.user_id, ActionOptions.UPDATE.value))
+
+    @override_settings(PERMISSION_CACHE_VERSION_SECONDS=1)
+    def test_expire_cached_permissions_of_other_worker(self) -> None:
+        """Test that a worker with its own cache stops granting a revoked role once its cache versions expire."""
+        worker_caches = {
+            worker: {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": worker}}
+            for worker in ("worker-a", "worker-b")
+        }
+        with override_settings(CACHES=worker_caches["worker-a"]):
+            self.assertTrue(PermissionService.has_action(self.user.user_id, ActionOptions.UPDATE.value))
+        with override_settings(CACHES=worker_caches["worker-b"]):
+            self.assertTrue(PermissionService.has_action(self.user.user_id, ActionOptions.UPDATE.value))
+            self.role_binding.delete()
+            self.assertFalse(PermissionService.has_action(self.user.user_id, ActionOptions.UPDATE.value))
+        with override_settings(CACHES=worker_caches["worker-a"]):
+            self.assertTrue(PermissionService.has_action(self.user.user_id, ActionOptions.UPDATE.value))
+            time.sleep(1.1)
+            self.assertFalse(PermissionService.has_action(self.user.user_id, ActionOptions.UPDATE.value))
+
+    def test_invalidate_permissions_on_role_binding_changed(self) -> None:
+        """Test refreshing permissions of a user when role is assigned and unassigned."""
+        other_user: User = normal_user_recipe.make()
+        self.assertFalse(PermissionService.has_action(other_user.user_id, ActionOptions.UPDATE.value))
+        role_binding: UserRoleBinding = Recipe(UserRoleBinding, user_id=other_user, role_id=self.update_role).make()
+        self.assertTrue(PermissionService.has_action(other_user.user_id, ActionOptions.UPDATE.value))
+        role_binding.delete()
+        self.assertFalse(PermissionService.has_action(other_user.user_id, ActionOptions.UPDATE.value))
+
+    def test_invalidate_permissions_on_permission_action_changed(self) -> None:
+        """Test refreshing role masks and user permissions when the action of an assigned permission has changed."""
+        self.assertTrue(PermissionService.has_action(self.user.user_id, ActionOptions.UPDATE.value))
+        self.update_permission.action = ActionOptions.CREATE.value
+        self.update_permission.save()
+        self.update_role.refresh_from_db()
+        self.assertEqual(self.update_role.permission_mask, ActionOptions.get_permission_bit(ActionOptions.CREATE.value))
+        self.assertTrue(PermissionService.has_action(self.user.user_id, ActionOptions.CREATE.value))
+        self.assertFalse(PermissionService.has_action(self.user.user_id, ActionOptions.UPDATE.value))
+
+    def test_rebuild_role_permission_masks_with_drift(self) -> None:
+        """Test reporting and fixing drift between role permission masks and role permission bindings."""
+        expected_permission_mask: int = ActionOptions.get_permission_bit(ActionOptions.UPDATE.value)
+        UserRole.objects.filter(pk=self.update_role.pk).update(permission_mask=0)
+
+        output = StringIO()
+        call_command("rebuild_role_permission_masks", "--dry-run", stdout=output)
+        self.assertIn("Found 1 drifted role permission masks.", output.getvalue())
+        self.update_role.refresh_from_db()
+        self.assertEqual(self.update_role.permission_mask, 0)
+
+        call_command("rebuild_role_permission_masks", stdout=output)
+        self.update_role.refresh_from_db()
+        self.assertEqual(self.update_role.permission_mask, expected_permission_mask)
+        self.assertTrue(PermissionService.has_action(self.user.user_id, ActionOptions.UPDATE.value))
+        self.assertEqual(PermissionService.rebuild_role_permission_masks(dry_run=True), {})
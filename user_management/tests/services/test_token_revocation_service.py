@@ -0,0 +1,92 @@
+"""Unittest for token revocation service."""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from user_management.models.revoked_token_model import RevokedToken
+from user_management.models.user_model import User
+from user_management.services.token_revocation_service import BloomFilter, TokenRevocationService
+from user_management.tests.baker_recipe.user_recipe import normal_user_recipe
+
+
+class TestTokenRevocationService(TestCase):
+    """Test case for revoking tokens and checking revoked tokens through the revocation filter."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data."""
+        cls.user: User = normal_user_recipe.make()
+
+    def setUp(self) -> None:
+        """Start every test with an empty worker filter."""
+        TokenRevocationService.reset_revocation_filter()
+
+    def test_bloom_filter_without_false_negative(self) -> None:
+        """Test finding every added key in bloom filter."""
+        bloom_filter = BloomFilter(1 << 12, 5)
+        for index in range(100):
+            bloom_filter.add(f"key:{index}")
+        self.assertTrue(all(bloom_filter.might_contain(f"key:{index}") for index in range(100)))
+        self.assertFalse(BloomFilter(1 << 12, 5).might_contain("key:0"))
+
+    def test_accept_valid_token_without_query(self) -> None:
+        """Test accepting a token that was not revoked without database query once the filter is loaded."""
+        token: RefreshToken = RefreshToken.for_user(self.user)
+        self.assertFalse(TokenRevocationService.is_token_revoked(token))
+        with self.assertNumQueries(0):
+            self.assertFalse(TokenRevocationService.is_token_revoked(RefreshToken.for_user(self.user)))
+
+    def test_revoke_token(self) -> None:
+        """Test rejecting only the revoked token of the user."""
+        token: RefreshToken = RefreshToken.for_user(self.user)
+        other_token: RefreshToken = RefreshToken.for_user(self.user)
+        TokenRevocationService.revoke_token(token)
+        self.assertTrue(TokenRevocationService.is_token_revoked(token))
+        self.assertFalse(TokenRevocationService.is_token_revoked(other_token))
+
+    def test_revoke_token_recorded_by_other_worker(self) -> None:
+        """Test rejecting a token revoked by another worker after the worker filter is refreshed."""
+        token: RefreshToken = RefreshToken.for_user(self.user)
+        self.assertFalse(TokenRevocationService.is_token_revoked(token))
+        RevokedToken.objects.create(jti=token["jti"], user_id=self.user)
+        TokenRevocationService.reset_revocation_filter()
+        self.assertTrue(TokenRevocationService.is_token_revoked(token))
+
+    def test_revoke_tokens_of_deactivated_user(self) -> None:
+        """Test rejecting every token issued before the user is deactivated."""
+        token: RefreshToken = RefreshToken.for_user(self.user)
+        self.user.is_active = False
+        self.user.save()
+        self.assertTrue(RevokedToken.objects.filter(user_id=self.user, jti__isnull=True).exists())
+        self.assertTrue(TokenRevocationService.is_token_revoked(token))
+        self.assertTrue(TokenRevocationService.is_token_revoked(token.access_token))
+
+        self.user.save()
+        self.assertEqual(RevokedToken.objects.filter(user_id=self.user).count(), 1)
+
+    def test_purge_expired_revocations(self) -> None:
+        """Test deleting revocations of expired tokens and leaving them out of the worker filter."""
+        token: RefreshToken = RefreshToken.for_user(self.user)
+        expired_token: RefreshToken = RefreshToken.for_user(self.user)
+        TokenRevocationService.revoke_token(token)
+        RevokedToken.objects.create(
+            jti=expired_token["jti"], user_id=self.user, expires_date=timezone.now() - timedelta(seconds=1)
+        )
+        TokenRevocationService.reset_revocation_filter()
+        self.assertTrue(TokenRevocationService.is_token_revoked(token))
+        with self.assertNumQueries(0):
+            self.assertFalse(TokenRevocationService.is_token_revoked(expired_token))
+
+        self.assertEqual(TokenRevocationService.purge_expired_revocations(), 1)
+        self.assertEqual(list(RevokedToken.objects.values_list("jti", flat=True)), [token["jti"]])
+
+    def test_purge_revocation_of_user_after_longest_token_lifetime(self) -> None:
+        """Test keeping revocation of a user until every token issued before the revocation has expired."""
+        TokenRevocationService.revoke_user(self.user.user_id)
+        user_revocation: RevokedToken = RevokedToken.objects.get(user_id=self.user)
+        expires_date = user_revocation.revoked_date + TokenRevocationService.get_max_token_lifetime()
+        self.assertEqual(TokenRevocationService.purge_expired_revocations(expires_date - timedelta(seconds=1)), 0)
+        self.assertEqual(TokenRevocationService.purge_expired_revocations(expires_date + timedelta(seconds=1)), 1)
@@ -82,6 +82,7 @@ class TestUserRoleViewSet(APITestCase):
         response: Response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['role_id'], self.role.role_id)
+        self.assertNotIn('permission_mask', response.data)
 
     def test_retrieve_user_role_with_normal_user(self) -> None:
         """Test retrieving a specific user role by ID with normal user."""
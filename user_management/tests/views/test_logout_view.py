@@ -0,0 +1,64 @@
+"""Unittest for logout view."""
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from user_management.models.revoked_token_model import RevokedToken
+from user_management.models.user_model import User
+from user_management.services.token_revocation_service import TokenRevocationService
+
+
+class TestLogoutView(APITestCase):
+    """Test case for revoking tokens by logging out."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data."""
+        cls.password = "test_password"
+        cls.user: User = User.objects.create_user(
+            username="reader", password=cls.password, email="reader@email.com", age=20, first_name="a", last_name="b"
+        )
+        cls.other_user: User = User.objects.create_user(
+            username="other", password=cls.password, email="other@email.com", age=20, first_name="a", last_name="b"
+        )
+
+    def setUp(self) -> None:
+        """Start every test with an empty worker filter."""
+        TokenRevocationService.reset_revocation_filter()
+
+    def login(self, user: User) -> Response:
+        """Login with test user credential."""
+        return self.client.post(reverse("token_obtain"), data={"username": user.username, "password": self.password})
+
+    def test_logout_revoke_tokens(self) -> None:
+        """Test rejecting access token and refresh token after logging out."""
+        tokens = self.login(self.user).data
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        response: Response = self.client.post(reverse("logout"), data={"refresh": tokens["refresh"]})
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(RevokedToken.objects.filter(user_id=self.user).count(), 2)
+
+        response = self.client.get(reverse("users:retrieve-user", args=[self.user.user_id]))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials()
+        response = self.client.post(reverse("token_refresh"), data={"refresh": tokens["refresh"]})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_with_refresh_token_of_other_user(self) -> None:
+        """Test forbidding revocation of refresh token which belongs to another user."""
+        tokens = self.login(self.user).data
+        other_tokens = self.login(self.other_user).data
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        response: Response = self.client.post(reverse("logout"), data={"refresh": other_tokens["refresh"]})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(RevokedToken.objects.exists())
+
+    def test_refresh_token_of_deactivated_user(self) -> None:
+        """Test rejecting refresh token after user is deactivated."""
+        tokens = self.login(self.user).data
+        self.user.is_active = False
+        self.user.save()
+        response: Response = self.client.post(reverse("token_refresh"), data={"refresh": tokens["refresh"]})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
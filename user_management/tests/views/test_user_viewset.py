@@ -2,11 +2,13 @@
 
 from typing import Dict, List, Union
 
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.test import APITestCase
 
+from cartoon_rent_api.identity_map import IDENTITY_MAP_SAVED_FETCH_HEADER, get_request_identity_map
 from user_management.models.user_model import User
 from user_management.serializers.user.user_output_serializer import UserOutputSerializer
 from user_management.tests.baker_recipe.user_recipe import admin_user_recipe, normal_user_recipe
@@ -68,6 +70,26 @@ class TestUserViewSet(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['user_id'], self.admin_user.user_id)
 
+    @override_settings(IDENTITY_MAP_DEBUG_HEADER=True)
+    def test_retrieve_own_account_with_single_fetch(self) -> None:
+        """Test fetching user only once for access policy and retrieve view through request identity map."""
+        url: str = reverse("users:retrieve-user", args=[self.normal_user.user_id])
+        self.client.force_authenticate(user=self.normal_user)
+        with self.assertNumQueries(1):
+            response: Response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response[IDENTITY_MAP_SAVED_FETCH_HEADER], "1")
+        self.assertFalse(get_request_identity_map(response.wsgi_request).records)
+
+    @override_settings(DEBUG=True, IDENTITY_MAP_DEBUG_HEADER=False)
+    def test_retrieve_own_account_without_debug_header(self) -> None:
+        """Test leaving out the identity map debug header unless it is opted in, even in debug mode."""
+        url: str = reverse("users:retrieve-user", args=[self.normal_user.user_id])
+        self.client.force_authenticate(user=self.normal_user)
+        response: Response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.has_header(IDENTITY_MAP_SAVED_FETCH_HEADER))
+
     def test_retrieve_other_user_info_with_admin_user(self) -> None:
         """Test retrieving other user information with admin account."""
         url: str = reverse("users:retrieve-user", args=[self.normal_user.user_id])
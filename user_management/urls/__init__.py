@@ -24,6 +24,7 @@ from rest_framework_simplejwt.views import (
 from user_management.urls.permissions_url import permission_urls
 from user_management.urls.role_url import role_urls
 from user_management.urls.user_url import user_urls
+from user_management.views.token.logout_view import LogoutView
 
 role_base_context_path = "roles/"
 user_base_context_path = "users/"
@@ -35,4 +36,5 @@ urlpatterns = [
     path(f'{user_base_context_path}', include((user_urls, 'users'), namespace='users')),
     path('login', TokenObtainPairView.as_view(), name='token_obtain'),
     path('token/refresh', TokenRefreshView.as_view(), name='token_refresh'),
+    path('logout', LogoutView.as_view(), name='logout'),
 ]
@@ -2,6 +2,7 @@
 
 from rest_framework.viewsets import ModelViewSet
 
+from cartoon_rent_api.identity_map import IdentityMapMixin
 from user_management.access_policies.permissions.user_role_permission_binding_viewset_access_policy import (
     UserRolePermissionBindingAccessPolicy,
 )
@@ -11,7 +12,7 @@ from user_management.serializers.permission.user_role_permission_binding_seriali
 )
 
 
-class UserRolePermissionBindingViewSet(ModelViewSet):
+class UserRolePermissionBindingViewSet(IdentityMapMixin, ModelViewSet):
     """CRUD viewset for assigning user role permission.
 
     Viewset provide the following:
@@ -4,6 +4,7 @@ from django.db.models.query import QuerySet
 from rest_access_policy.access_view_set_mixin import AccessViewSetMixin
 from rest_framework.viewsets import ModelViewSet
 
+from cartoon_rent_api.identity_map import IdentityMapMixin
 from user_management.access_policies.roles.user_role_binding_viewset_access_policy import (
     UserRoleBindingViewSetAccessPolicy,
 )
@@ -11,7 +12,7 @@ from user_management.models.user_role_binding_model import UserRoleBinding
 from user_management.serializers.role.user_role_binding_serializer import UserRoleBindingSerializer
 
 
-class UserRoleBindingViewSet(AccessViewSetMixin, ModelViewSet):
+class UserRoleBindingViewSet(IdentityMapMixin, AccessViewSetMixin, ModelViewSet):
     """CRUD viewset for assigning user role.
 
     Viewset provide the following:
@@ -2,12 +2,13 @@
 
 from rest_framework.viewsets import ModelViewSet
 
+from cartoon_rent_api.identity_map import IdentityMapMixin
 from user_management.access_policies.roles.user_role_viewset_access_policy import UserRoleViewSetAccessPolicy
 from user_management.models.user_role_model import UserRole
 from user_management.serializers.role.user_role_serializer import UserRoleSerializer
 
 
-class UserRoleViewSet(ModelViewSet):
+class UserRoleViewSet(IdentityMapMixin, ModelViewSet):
     """CRUD viewset for user role model.
 
     Viewset provide the following:
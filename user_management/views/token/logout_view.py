@@ -0,0 +1,40 @@
+"""API view for logging out."""
+
+from typing import Dict, Tuple
+
+from django.db import transaction
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework_simplejwt.settings import api_settings
+
+from user_management.serializers.token.logout_serializer import LogoutSerializer
+from user_management.services.token_revocation_service import TokenRevocationService
+
+
+class LogoutView(GenericAPIView):
+    """Logout view revoking the given refresh token and the access token of the request.
+
+    View provide the following:
+    - POST: revoke refresh token of the request user
+    """
+
+    serializer_class = LogoutSerializer
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(responses={204: None})
+    @transaction.atomic
+    def post(self, request: Request, *args: Tuple[str, str], **kwargs: Dict[str, int]) -> Response:
+        """Revoke refresh token of the request user and the access token used for the request."""
+        serializer: LogoutSerializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        refresh_token = serializer.validated_data["refresh_token"]
+        if str(refresh_token[api_settings.USER_ID_CLAIM]) != str(request.user.user_id):
+            return Response(status=status.HTTP_403_FORBIDDEN)
+        TokenRevocationService.revoke_token(refresh_token)
+        if request.auth is not None:
+            TokenRevocationService.revoke_token(request.auth)
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -9,6 +9,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from cartoon_rent_api.identity_map import IdentityMapMixin
 from user_management.access_policies.user_viewset_access_policy import UserViewSetAccessPolicy
 from user_management.models.user_model import User
 from user_management.serializers.user.user_output_serializer import UserOutputSerializer
@@ -20,7 +21,7 @@ from user_management.serializers.user.user_serializer import UserSerializer
     update=extend_schema(request=UserSerializer, responses={200: UserOutputSerializer}),
     partial_update=extend_schema(request=UserSerializer, responses={200: UserOutputSerializer}),
 )
-class UserViewSet(ModelViewSet):
+class UserViewSet(IdentityMapMixin, ModelViewSet):
     """CRUD viewset for user.
 
     Viewset provide the following: